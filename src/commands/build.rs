@@ -1,6 +1,7 @@
 //! Build command implementation that runs SDK compile, extension build, and runtime build.
 
 use anyhow::{Context, Result};
+use futures_util::stream::{self, StreamExt};
 use std::collections::HashSet;
 use std::pin::Pin;
 use std::sync::Arc;
@@ -392,50 +393,83 @@ impl BuildCommand {
             }
         }
 
-        // Phase 2: Build runtimes sequentially (RuntimeBuildCommand contains
-        // non-Send types like TufSigner, so it cannot be spawned on tokio).
+        // Phase 2: Build runtimes. RuntimeBuildCommand contains non-Send types
+        // like TufSigner, so builds cannot be spawned on tokio; they are
+        // instead polled concurrently on this task. Runtimes may share sdk
+        // compile sections and build dirs, so this stays sequential unless
+        // AVOCADO_PARALLEL_RUNTIMES opts in. After a failure, builds that have
+        // not started yet are skipped and in-flight ones run to completion.
+        let max_parallel_runtimes = if self.runs_on.is_some() {
+            1
+        } else {
+            std::env::var("AVOCADO_PARALLEL_RUNTIMES")
+                .ok()
+                .and_then(|v| v.parse::<usize>().ok())
+                .filter(|n| *n > 0)
+                .unwrap_or(1)
+        };
+        let failed = std::cell::Cell::new(false);
         let mut rt_error: Option<anyhow::Error> = None;
-        for runtime_name in &runtimes_to_build {
-            let rt_task_id = TaskId::RuntimeBuild(runtime_name.clone());
-            if let Some(ref r) = renderer {
-                r.set_status(&rt_task_id, TaskStatus::Running);
-            }
+        let mut builds = stream::iter(&runtimes_to_build)
+            .map(|runtime_name| {
+                let renderer = renderer.clone();
+                let composed = Arc::clone(&composed);
+                let failed = &failed;
+                async move {
+                    if failed.get() {
+                        return None;
+                    }
 
-            let tui_ctx = renderer.as_ref().map(|r| TuiContext {
-                task_id: rt_task_id.clone(),
-                renderer: Arc::clone(r),
-            });
-
-            let mut cmd = RuntimeBuildCommand::new(
-                runtime_name.clone(),
-                self.config_path.clone(),
-                self.verbose,
-                self.target.clone(),
-                self.container_args.clone(),
-                self.dnf_args.clone(),
-            )
-            .with_no_stamps(self.no_stamps)
-            .with_runs_on(self.runs_on.clone(), self.nfs_port)
-            .with_sdk_arch(self.sdk_arch.clone())
-            .with_composed_config(Arc::clone(&composed));
-
-            if let Some(ctx) = tui_ctx {
-                cmd = cmd.with_tui_context(ctx);
-            }
+                    let rt_task_id = TaskId::RuntimeBuild(runtime_name.clone());
+                    if let Some(ref r) = renderer {
+                        r.set_status(&rt_task_id, TaskStatus::Running);
+                    }
 
-            let result = cmd.execute().await;
+                    let tui_ctx = renderer.as_ref().map(|r| TuiContext {
+                        task_id: rt_task_id.clone(),
+                        renderer: Arc::clone(r),
+                    });
+
+                    let mut cmd = RuntimeBuildCommand::new(
+                        runtime_name.clone(),
+                        self.config_path.clone(),
+                        self.verbose,
+                        self.target.clone(),
+                        self.container_args.clone(),
+                        self.dnf_args.clone(),
+                    )
+                    .with_no_stamps(self.no_stamps)
+                    .with_runs_on(self.runs_on.clone(), self.nfs_port)
+                    .with_sdk_arch(self.sdk_arch.clone())
+                    .with_composed_config(composed);
 
-            if let Some(ref r) = renderer {
-                if result.is_ok() {
-                    r.set_status(&rt_task_id, TaskStatus::Success);
-                } else {
-                    r.set_status(&rt_task_id, TaskStatus::Failed);
+                    if let Some(ctx) = tui_ctx {
+                        cmd = cmd.with_tui_context(ctx);
+                    }
+
+                    let result = cmd.execute().await;
+
+                    if let Some(ref r) = renderer {
+                        if result.is_ok() {
+                            r.set_status(&rt_task_id, TaskStatus::Success);
+                        } else {
+                            r.set_status(&rt_task_id, TaskStatus::Failed);
+                        }
+                    }
+                    if result.is_err() {
+                        failed.set(true);
+                    }
+
+                    Some((runtime_name, result))
                 }
-            }
+            })
+            .buffered(max_parallel_runtimes);
 
-            if let Err(e) = result {
-                rt_error = Some(e.context(format!("Failed to build runtime '{runtime_name}'")));
-                break;
+        while let Some(outcome) = builds.next().await {
+            if let Some((runtime_name, Err(e))) = outcome {
+                if rt_error.is_none() {
+                    rt_error = Some(e.context(format!("Failed to build runtime '{runtime_name}'")));
+                }
             }
         }
 
@@ -127,14 +127,29 @@ impl CleanCommand {
         // pair its removal with volume removal — `--skip-volumes`
         // means "leave both alone" so unlock-/stamps-only invocations
         // don't orphan the volume by deleting its name reference.
-        if self.volumes {
-            self.clean_volume(&directory_path).await?;
+        let volume_removed = if self.volumes {
+            let removed = self.clean_volume(&directory_path).await?;
             self.clean_state_file(&directory_path)?;
-        }
+            removed
+        } else {
+            false
+        };
 
-        // Clean stamp files if requested
+        // Clean stamp files if requested. Stamps live inside the docker
+        // volume, so once the volume is gone there is nothing left to
+        // remove; launching an SDK container here would only recreate an
+        // empty volume.
         if self.stamps {
-            self.clean_stamps(&directory_path).await?;
+            if volume_removed {
+                if self.verbose {
+                    print_info(
+                        "Stamp files were removed with the docker volume.",
+                        OutputLevel::Normal,
+                    );
+                }
+            } else {
+                self.clean_stamps(&directory_path).await?;
+            }
         }
 
         // Unlock (clear lock file entries) if requested
@@ -243,8 +258,10 @@ fi
         Ok(())
     }
 
-    /// Clean docker volume associated with the directory
-    async fn clean_volume(&self, directory_path: &Path) -> Result<()> {
+    /// Clean docker volume associated with the directory.
+    ///
+    /// Returns whether a volume was found and removed.
+    async fn clean_volume(&self, directory_path: &Path) -> Result<bool> {
         // Try to load existing volume state
         if let Some(volume_state) = VolumeState::load_from_dir(directory_path)? {
             let volume_manager = VolumeManager::new(self.container_tool.clone(), self.verbose);
@@ -282,6 +299,7 @@ fi
                 &format!("Removed docker volume: {}", volume_state.volume_name),
                 OutputLevel::Normal,
             );
+            return Ok(true);
         } else if self.verbose {
             print_info(
                 "No volume state found, skipping volume cleanup.",
@@ -289,24 +307,31 @@ fi
             );
         }
 
-        Ok(())
+        Ok(false)
     }
 
     /// Clean .avocado-state file
     fn clean_state_file(&self, directory_path: &Path) -> Result<()> {
         let state_file = directory_path.join(".avocado-state");
 
-        if state_file.exists() {
-            fs::remove_file(&state_file).with_context(|| {
-                format!("Failed to remove state file: {}", state_file.display())
-            })?;
-
-            print_success(
+        // Remove directly and treat NotFound as "nothing to do" rather than
+        // stat-ing first: one syscall instead of two, and no window between
+        // the check and the removal.
+        match fs::remove_file(&state_file) {
+            Ok(()) => print_success(
                 &format!("Removed state file: {}", state_file.display()),
                 OutputLevel::Normal,
-            );
-        } else if self.verbose {
-            print_info("No .avocado-state file found.", OutputLevel::Normal);
+            ),
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                if self.verbose {
+                    print_info("No .avocado-state file found.", OutputLevel::Normal);
+                }
+            }
+            Err(e) => {
+                return Err(e).with_context(|| {
+                    format!("Failed to remove state file: {}", state_file.display())
+                })
+            }
         }
 
         Ok(())
@@ -25,6 +25,74 @@ struct OverlayConfig {
     preprocess: crate::utils::overlay_preprocess::PreprocessSpec,
 }
 
+/// Read `key` from an extension config as a list of strings, skipping
+/// non-string entries. Returns `None` when the key is absent or not a list.
+fn string_list(ext_config: &serde_yaml::Value, key: &str) -> Option<Vec<String>> {
+    ext_config
+        .get(key)
+        .and_then(|v| v.as_sequence())
+        .map(|arr| {
+            arr.iter()
+                .filter_map(|v| v.as_str())
+                .map(|s| s.to_string())
+                .collect()
+        })
+}
+
+/// Render release-file lines recording each user-supplied `on_merge` /
+/// `on_unmerge` command under `var` (e.g. `AVOCADO_ON_MERGE`).
+fn release_file_commands_section(var: &str, label: &str, commands: &[String]) -> String {
+    commands
+        .iter()
+        .map(|command| {
+            format!(
+                r#"echo "{var}=\"{command}\"" >> "$release_file"
+echo "[INFO] Added custom {label} command to release file: {command}""#
+            )
+        })
+        .collect::<Vec<_>>()
+        .join("\n")
+}
+
+/// Render the release-file preamble shared by sysext and confext builds:
+/// defines `$release_dir`/`$release_file` and seeds the file with the ID,
+/// reload-manager and `scope_var` lines.
+fn release_file_header_section(
+    release_dir: &str,
+    ext_name: &str,
+    ext_version: &str,
+    reload_service_manager: bool,
+    scope_var: &str,
+    ext_scopes: &[String],
+) -> String {
+    let reload_manager = if reload_service_manager { "1" } else { "0" };
+    let scopes = ext_scopes.join(" ");
+    format!(
+        r#"release_dir="{release_dir}"
+release_file="$release_dir/extension-release.{ext_name}-{ext_version}"
+
+mkdir -p "$release_dir"
+echo "ID=_any" > "$release_file"
+echo "EXTENSION_RELOAD_MANAGER={reload_manager}" >> "$release_file"
+echo "{scope_var}={scopes}" >> "$release_file"
+"#
+    )
+}
+
+/// Join per-type build scripts so every type builds in one container run.
+/// Each script runs in its own subshell, which keeps its `set -e` and shell
+/// variables isolated; a single script is passed through unchanged.
+fn combine_build_scripts(build_scripts: &[(&str, String)]) -> String {
+    if let [(_, build_script)] = build_scripts {
+        return build_script.clone();
+    }
+    let mut combined = String::from("set -e\n");
+    for (ext_type, build_script) in build_scripts {
+        combined.push_str(&format!("\n# {ext_type}\n(\n{build_script}\n)\n"));
+    }
+    combined
+}
+
 #[derive(Debug, Clone, PartialEq)]
 enum OverlayMode {
     Merge,  // Default: rsync -a (safe merging)
@@ -441,52 +509,16 @@ impl ExtBuildCommand {
             .unwrap_or_else(|| vec!["sysext", "confext"]);
 
         // Get enable_services from configuration
-        let enable_services = ext_config
-            .get("enable_services")
-            .and_then(|v| v.as_sequence())
-            .map(|arr| {
-                arr.iter()
-                    .filter_map(|v| v.as_str())
-                    .map(|s| s.to_string())
-                    .collect::<Vec<_>>()
-            })
-            .unwrap_or_default();
+        let enable_services = string_list(&ext_config, "enable_services").unwrap_or_default();
 
         // Get modprobe modules from configuration
-        let modprobe_modules = ext_config
-            .get("modprobe")
-            .and_then(|v| v.as_sequence())
-            .map(|arr| {
-                arr.iter()
-                    .filter_map(|v| v.as_str())
-                    .map(|s| s.to_string())
-                    .collect::<Vec<_>>()
-            })
-            .unwrap_or_default();
+        let modprobe_modules = string_list(&ext_config, "modprobe").unwrap_or_default();
 
         // Get on_merge commands from configuration
-        let on_merge_commands = ext_config
-            .get("on_merge")
-            .and_then(|v| v.as_sequence())
-            .map(|arr| {
-                arr.iter()
-                    .filter_map(|v| v.as_str())
-                    .map(|s| s.to_string())
-                    .collect::<Vec<_>>()
-            })
-            .unwrap_or_default();
+        let on_merge_commands = string_list(&ext_config, "on_merge").unwrap_or_default();
 
         // Get on_unmerge commands from configuration
-        let on_unmerge_commands = ext_config
-            .get("on_unmerge")
-            .and_then(|v| v.as_sequence())
-            .map(|arr| {
-                arr.iter()
-                    .filter_map(|v| v.as_str())
-                    .map(|s| s.to_string())
-                    .collect::<Vec<_>>()
-            })
-            .unwrap_or_default();
+        let on_unmerge_commands = string_list(&ext_config, "on_unmerge").unwrap_or_default();
 
         // Get reload_service_manager configuration (defaults to false)
         let reload_service_manager = ext_config
@@ -526,38 +558,14 @@ impl ExtBuildCommand {
             );
         }
 
-        let ext_scopes = ext_config
-            .get("scopes")
-            .and_then(|v| v.as_sequence())
-            .map(|arr| {
-                arr.iter()
-                    .filter_map(|v| v.as_str())
-                    .map(|s| s.to_string())
-                    .collect::<Vec<_>>()
-            })
-            .unwrap_or_else(|| vec!["system".to_string()]);
+        let ext_scopes =
+            string_list(&ext_config, "scopes").unwrap_or_else(|| vec!["system".to_string()]);
 
-        let sysext_scopes = ext_config
-            .get("sysext_scopes")
-            .and_then(|v| v.as_sequence())
-            .map(|arr| {
-                arr.iter()
-                    .filter_map(|v| v.as_str())
-                    .map(|s| s.to_string())
-                    .collect::<Vec<_>>()
-            })
-            .unwrap_or_else(|| ext_scopes.clone());
+        let sysext_scopes =
+            string_list(&ext_config, "sysext_scopes").unwrap_or_else(|| ext_scopes.clone());
 
-        let confext_scopes = ext_config
-            .get("confext_scopes")
-            .and_then(|v| v.as_sequence())
-            .map(|arr| {
-                arr.iter()
-                    .filter_map(|v| v.as_str())
-                    .map(|s| s.to_string())
-                    .collect::<Vec<_>>()
-            })
-            .unwrap_or_else(|| ext_scopes.clone());
+        let confext_scopes =
+            string_list(&ext_config, "confext_scopes").unwrap_or_else(|| ext_scopes.clone());
 
         // Get extension version from the composed config (source of truth).
         // For remote extensions, the version comes from the merged remote extension avocado.yaml.
@@ -620,14 +628,6 @@ impl ExtBuildCommand {
             }
         });
 
-        // Get SDK configuration from interpolated config
-        let container_image = config
-            .get_sdk_image()
-            .ok_or_else(|| anyhow::anyhow!("No SDK container image specified in configuration."))?;
-
-        // Resolve target with proper precedence
-        let target_arch = resolve_target_required(self.target.as_deref(), config)?;
-
         // Initialize SDK container helper
         let container_helper = SdkContainer::from_config(&self.config_path, config)?
             .with_cli_target_board(self.target_board.clone());
@@ -742,8 +742,11 @@ impl ExtBuildCommand {
             .await?;
         }
 
-        // Build extensions based on configuration
+        // Build extensions based on configuration. Every requested type is
+        // rendered first so they all run in one SDK container: container
+        // start-up dominates these short scripts.
         let mut overall_success = true;
+        let mut build_scripts: Vec<(&str, String)> = Vec::new();
 
         for ext_type in ext_types {
             print_info(
@@ -751,71 +754,88 @@ impl ExtBuildCommand {
                 OutputLevel::Normal,
             );
 
-            let build_result = match ext_type {
-                "sysext" => {
-                    self.build_sysext_extension(
-                        &container_helper,
-                        container_image,
-                        &target_arch,
-                        &ext_version,
-                        &sysext_scopes,
-                        overlay_config.as_ref(),
-                        repo_url.as_ref(),
-                        repo_release.as_ref(),
-                        &processed_container_args,
-                        &modprobe_modules,
-                        &on_merge_commands,
-                        &on_unmerge_commands,
-                        users_config,
-                        groups_config,
-                        reload_service_manager,
-                        &ext_src_path,
-                        &effective_tui_context,
-                    )
-                    .await?
-                }
-                "confext" => {
-                    self.build_confext_extension(
-                        &container_helper,
-                        container_image,
-                        &target_arch,
-                        &ext_version,
-                        &confext_scopes,
-                        overlay_config.as_ref(),
-                        repo_url.as_ref(),
-                        repo_release.as_ref(),
-                        &processed_container_args,
-                        &enable_services,
-                        &on_merge_commands,
-                        &on_unmerge_commands,
-                        users_config,
-                        groups_config,
-                        reload_service_manager,
-                        &ext_src_path,
-                        &effective_tui_context,
-                    )
-                    .await?
-                }
-                _ => false,
+            let build_script = match ext_type {
+                "sysext" => Some(self.create_sysext_build_script(
+                    &ext_version,
+                    &sysext_scopes,
+                    overlay_config.as_ref(),
+                    &modprobe_modules,
+                    &on_merge_commands,
+                    &on_unmerge_commands,
+                    users_config,
+                    groups_config,
+                    reload_service_manager,
+                    &ext_src_path,
+                )),
+                "confext" => Some(self.create_confext_build_script(
+                    &ext_version,
+                    &confext_scopes,
+                    overlay_config.as_ref(),
+                    &enable_services,
+                    &on_merge_commands,
+                    &on_unmerge_commands,
+                    users_config,
+                    groups_config,
+                    reload_service_manager,
+                    &ext_src_path,
+                )),
+                _ => None,
             };
 
-            if build_result {
-                print_success(
-                    &format!(
-                        "Successfully built {} extension '{}'.",
-                        ext_type, self.extension
-                    ),
-                    OutputLevel::Normal,
-                );
-            } else {
-                print_error(
-                    &format!(
-                        "Failed to build {} extension '{}'.",
-                        ext_type, self.extension
-                    ),
-                    OutputLevel::Normal,
-                );
-                overall_success = false;
+            match build_script {
+                Some(build_script) => build_scripts.push((ext_type, build_script)),
+                None => {
+                    print_error(
+                        &format!(
+                            "Failed to build {} extension '{}'.",
+                            ext_type, self.extension
+                        ),
+                        OutputLevel::Normal,
+                    );
+                    overall_success = false;
+                }
+            }
+        }
+
+        if !build_scripts.is_empty() {
+            let ext_type_label = build_scripts
+                .iter()
+                .map(|(ext_type, _)| *ext_type)
+                .collect::<Vec<_>>()
+                .join("+");
+            let build_result = self
+                .run_build_script(
+                    &ext_type_label,
+                    combine_build_scripts(&build_scripts),
+                    &container_helper,
+                    container_image,
+                    &target,
+                    repo_url.as_ref(),
+                    repo_release.as_ref(),
+                    &processed_container_args,
+                    &effective_tui_context,
+                )
+                .await?;
+
+            for (ext_type, _) in &build_scripts {
+                if build_result {
+                    print_success(
+                        &format!(
+                            "Successfully built {} extension '{}'.",
+                            ext_type, self.extension
+                        ),
+                        OutputLevel::Normal,
+                    );
+                } else {
+                    print_error(
+                        &format!(
+                            "Failed to build {} extension '{}'.",
+                            ext_type, self.extension
+                        ),
+                        OutputLevel::Normal,
+                    );
+                    overall_success = false;
+                }
             }
         }
 
@@ -883,45 +903,23 @@ impl ExtBuildCommand {
         Ok(())
     }
 
+    /// Run a rendered sysext/confext build script in the SDK container.
     #[allow(clippy::too_many_arguments)]
-    async fn build_sysext_extension(
+    async fn run_build_script(
         &self,
+        ext_type: &str,
+        build_script: String,
         container_helper: &SdkContainer,
         container_image: &str,
         target_arch: &str,
-        ext_version: &str,
-        ext_scopes: &[String],
-        overlay_config: Option<&OverlayConfig>,
         repo_url: Option<&String>,
         repo_release: Option<&String>,
         processed_container_args: &Option<Vec<String>>,
-        modprobe_modules: &[String],
-        on_merge_commands: &[String],
-        on_unmerge_commands: &[String],
-        users_config: Option<&serde_yaml::Mapping>,
-        groups_config: Option<&serde_yaml::Mapping>,
-        reload_service_manager: bool,
-        ext_src_path: &str,
         effective_tui_context: &Option<TuiContext>,
     ) -> Result<bool> {
-        // Create the build script for sysext extension
-        let build_script = self.create_sysext_build_script(
-            ext_version,
-            ext_scopes,
-            overlay_config,
-            modprobe_modules,
-            on_merge_commands,
-            on_unmerge_commands,
-            users_config,
-            groups_config,
-            reload_service_manager,
-            ext_src_path,
-        );
-
-        // Execute the build script in the SDK container
         if self.verbose {
             print_info(
-                "Executing sysext extension build script.",
+                &format!("Executing {ext_type} extension build script."),
                 OutputLevel::Normal,
             );
         }
@@ -948,80 +946,7 @@ impl ExtBuildCommand {
 
         if self.verbose {
             print_info(
-                &format!("Sysext build script execution returned: {result}."),
-                OutputLevel::Normal,
-            );
-        }
-
-        Ok(result)
-    }
-
-    #[allow(clippy::too_many_arguments)]
-    async fn build_confext_extension(
-        &self,
-        container_helper: &SdkContainer,
-        container_image: &str,
-        target_arch: &str,
-        ext_version: &str,
-        ext_scopes: &[String],
-        overlay_config: Option<&OverlayConfig>,
-        repo_url: Option<&String>,
-        repo_release: Option<&String>,
-        processed_container_args: &Option<Vec<String>>,
-        enable_services: &[String],
-        on_merge_commands: &[String],
-        on_unmerge_commands: &[String],
-        users_config: Option<&serde_yaml::Mapping>,
-        groups_config: Option<&serde_yaml::Mapping>,
-        reload_service_manager: bool,
-        ext_src_path: &str,
-        effective_tui_context: &Option<TuiContext>,
-    ) -> Result<bool> {
-        // Create the build script for confext extension
-        let build_script = self.create_confext_build_script(
-            ext_version,
-            ext_scopes,
-            overlay_config,
-            enable_services,
-            on_merge_commands,
-            on_unmerge_commands,
-            users_config,
-            groups_config,
-            reload_service_manager,
-            ext_src_path,
-        );
-
-        // Execute the build script in the SDK container
-        if self.verbose {
-            print_info(
-                "Executing confext extension build script.",
-                OutputLevel::Normal,
-            );
-        }
-
-        let config = RunConfig {
-            container_image: container_image.to_string(),
-            target: target_arch.to_string(),
-            command: build_script,
-            verbose: self.verbose,
-            source_environment: true,
-            interactive: false,
-            repo_url: repo_url.cloned(),
-            repo_release: repo_release.cloned(),
-            container_args: processed_container_args.clone(),
-            dnf_args: self.dnf_args.clone(),
-            sdk_arch: self.sdk_arch.clone(),
-            runs_on: self.runs_on.clone(),
-            nfs_port: self.nfs_port,
-            tui_context: effective_tui_context.clone(),
-            env_vars: self.runtime_env_vars(),
-            ..Default::default()
-        };
-        let result = container_helper.run_in_container(config).await?;
-
-        if self.verbose {
-            print_info(
-                &format!("Confext build script execution returned: {result}."),
+                &format!("{ext_type} build script execution returned: {result}."),
                 OutputLevel::Normal,
             );
         }
@@ -1043,57 +968,7 @@ impl ExtBuildCommand {
         reload_service_manager: bool,
         ext_src_path: &str,
     ) -> String {
-        let overlay_section = if let Some(overlay_config) = overlay_config {
-            match overlay_config.mode {
-                OverlayMode::Merge => format!(
-                    r#"
-# Merge overlay directory into extension sysroot
-if [ -d "{src_path}/{overlay_dir}" ]; then
-    echo "Merging overlay directory '{overlay_dir}' into extension sysroot with root:root ownership"
-    # cp -a preserves attrs/symlinks while merging into the existing tree;
-    # chown -R sets ownership to root:root. Avoids depending on rsync.
-    cp -a "{src_path}/{overlay_dir}/." "$AVOCADO_EXT_SYSROOTS/{ext_name}/"
-    chown -R root:root "$AVOCADO_EXT_SYSROOTS/{ext_name}/"
-else
-    echo "Error: Overlay directory '{overlay_dir}' not found in source"
-    exit 1
-fi
-"#,
-                    src_path = ext_src_path,
-                    overlay_dir = overlay_config.dir,
-                    ext_name = self.extension,
-                ),
-                OverlayMode::Opaque => format!(
-                    r#"
-# Copy overlay directory to extension sysroot (opaque mode)
-if [ -d "{src_path}/{overlay_dir}" ]; then
-    echo "Copying overlay directory '{overlay_dir}' to extension sysroot (opaque mode)"
-    # Use cp to replace directory contents completely while preserving permissions
-    cp -r {src_path}/{overlay_dir}/* "$AVOCADO_EXT_SYSROOTS/{ext_name}/"
-    # Fix ownership to root:root for copied overlay files only (permissions are preserved)
-    echo "Setting ownership to root:root for overlay files"
-    find "{src_path}/{overlay_dir}" -mindepth 1 | while IFS= read -r srcpath; do
-        relpath="$(echo "$srcpath" | sed "s|^{src_path}/{overlay_dir}||" | sed "s|^/||")"
-        if [ -n "$relpath" ]; then
-            destpath="$AVOCADO_EXT_SYSROOTS/{ext_name}/$relpath"
-            if [ -e "$destpath" ]; then
-                chown root:root "$destpath" 2>/dev/null || true
-            fi
-        fi
-    done
-else
-    echo "Error: Overlay directory '{overlay_dir}' not found in source"
-    exit 1
-fi
-"#,
-                    src_path = ext_src_path,
-                    overlay_dir = overlay_config.dir,
-                    ext_name = self.extension,
-                ),
-            }
-        } else {
-            String::new()
-        };
+        let overlay_section = self.create_overlay_script_section(overlay_config, ext_src_path);
 
         // Create modprobe commands section for AVOCADO_ON_MERGE
         let modprobe_section = if !modprobe_modules.is_empty() {
@@ -1111,102 +986,62 @@ fi
             String::new()
         };
 
-        // Create custom on_merge commands section
-        let custom_on_merge_section = if !on_merge_commands.is_empty() {
-            on_merge_commands
-                .iter()
-                .map(|command| {
-                    format!(
-                        r#"echo "AVOCADO_ON_MERGE=\"{command}\"" >> "$release_file"
-echo "[INFO] Added custom on_merge command to release file: {command}""#
-                    )
-                })
-                .collect::<Vec<_>>()
-                .join("\n")
-        } else {
-            String::new()
-        };
+        let custom_on_merge_section =
+            release_file_commands_section("AVOCADO_ON_MERGE", "on_merge", &on_merge_commands);
 
-        // Create custom on_unmerge commands section
-        let custom_on_unmerge_section = if !on_unmerge_commands.is_empty() {
-            on_unmerge_commands
-                .iter()
-                .map(|command| {
-                    format!(
-                        r#"echo "AVOCADO_ON_UNMERGE=\"{command}\"" >> "$release_file"
-echo "[INFO] Added custom on_unmerge command to release file: {command}""#
-                    )
-                })
-                .collect::<Vec<_>>()
-                .join("\n")
-        } else {
-            String::new()
-        };
+        let custom_on_unmerge_section =
+            release_file_commands_section("AVOCADO_ON_UNMERGE", "on_unmerge", &on_unmerge_commands);
 
         let users_section = self.create_users_script_section(users_config, groups_config);
 
+        let ext_name = &self.extension;
+        let ext_sysroot = format!("$AVOCADO_EXT_SYSROOTS/{ext_name}");
+        let release_header = release_file_header_section(
+            &format!("{ext_sysroot}/usr/lib/extension-release.d"),
+            ext_name,
+            ext_version,
+            reload_service_manager,
+            "SYSEXT_SCOPE",
+            ext_scopes,
+        );
+
         format!(
             r#"
 set -e
-{}{}
-release_dir="$AVOCADO_EXT_SYSROOTS/{}/usr/lib/extension-release.d"
-release_file="$release_dir/extension-release.{}-{}"
-modules_dir="$AVOCADO_EXT_SYSROOTS/{}/usr/lib/modules"
-
-mkdir -p "$release_dir"
-echo "ID=_any" > "$release_file"
-echo "EXTENSION_RELOAD_MANAGER={}" >> "$release_file"
-echo "SYSEXT_SCOPE={}" >> "$release_file"
-
+{overlay_section}{users_section}
+{release_header}
 # Check if extension includes kernel modules and add AVOCADO_ON_MERGE if needed
+modules_dir="{ext_sysroot}/usr/lib/modules"
 if [ -d "$modules_dir" ] && [ -n "$(find "$modules_dir" -name "*.ko" -o -name "*.ko.xz" -o -name "*.ko.gz" 2>/dev/null | head -n 1)" ]; then
     echo "AVOCADO_ON_MERGE=\"depmod\"" >> "$release_file"
-    echo "[INFO] Found kernel modules in extension '{}', added AVOCADO_ON_MERGE=\"depmod\" to release file"
-    {}
+    echo "[INFO] Found kernel modules in extension '{ext_name}', added AVOCADO_ON_MERGE=\"depmod\" to release file"
+    {modprobe_section}
 fi
 
 # Check if extension includes sysusers.d config files and add systemd-sysusers to AVOCADO_ON_MERGE if needed
-sysusers_dir1="$AVOCADO_EXT_SYSROOTS/{}/usr/local/lib/sysusers.d"
-sysusers_dir2="$AVOCADO_EXT_SYSROOTS/{}/usr/lib/sysusers.d"
+sysusers_dir1="{ext_sysroot}/usr/local/lib/sysusers.d"
+sysusers_dir2="{ext_sysroot}/usr/lib/sysusers.d"
 if ([ -d "$sysusers_dir1" ] && [ -n "$(find "$sysusers_dir1" -name "*.conf" 2>/dev/null | head -n 1)" ]) || \
    ([ -d "$sysusers_dir2" ] && [ -n "$(find "$sysusers_dir2" -name "*.conf" 2>/dev/null | head -n 1)" ]); then
     echo "AVOCADO_ON_MERGE=\"systemd-sysusers\"" >> "$release_file"
-    echo "[INFO] Found sysusers.d config files in extension '{}', added AVOCADO_ON_MERGE=\"systemd-sysusers\" to release file"
+    echo "[INFO] Found sysusers.d config files in extension '{ext_name}', added AVOCADO_ON_MERGE=\"systemd-sysusers\" to release file"
 fi
 
 # Check if extension includes tmpfiles.d config files and add systemd-tmpfiles --create to AVOCADO_ON_MERGE if needed
-tmpfiles_dir1="$AVOCADO_EXT_SYSROOTS/{}/usr/local/lib/tmpfiles.d"
-tmpfiles_dir2="$AVOCADO_EXT_SYSROOTS/{}/usr/lib/tmpfiles.d"
+tmpfiles_dir1="{ext_sysroot}/usr/local/lib/tmpfiles.d"
+tmpfiles_dir2="{ext_sysroot}/usr/lib/tmpfiles.d"
 if ([ -d "$tmpfiles_dir1" ] && [ -n "$(find "$tmpfiles_dir1" -name "*.conf" 2>/dev/null | head -n 1)" ]) || \
    ([ -d "$tmpfiles_dir2" ] && [ -n "$(find "$tmpfiles_dir2" -name "*.conf" 2>/dev/null | head -n 1)" ]); then
     echo "AVOCADO_ON_MERGE=\"systemd-tmpfiles --create\"" >> "$release_file"
-    echo "[INFO] Found tmpfiles.d config files in extension '{}', added AVOCADO_ON_MERGE=\"systemd-tmpfiles --create\" to release file"
+    echo "[INFO] Found tmpfiles.d config files in extension '{ext_name}', added AVOCADO_ON_MERGE=\"systemd-tmpfiles --create\" to release file"
 fi
 
 # Add custom AVOCADO_ON_MERGE commands if specified
-{}
+{custom_on_merge_section}
 
 # Add custom AVOCADO_ON_UNMERGE commands if specified
-{}
-"#,
-            overlay_section,
-            users_section,
-            self.extension,
-            self.extension,
-            ext_version,
-            self.extension,
-            if reload_service_manager { "1" } else { "0" },
-            ext_scopes.join(" "),
-            self.extension,
-            modprobe_section,
-            self.extension,
-            self.extension,
-            self.extension,
-            self.extension,
-            self.extension,
-            self.extension,
-            custom_on_merge_section,
-            custom_on_unmerge_section
+{custom_on_unmerge_section}
+"#
         )
     }
 
@@ -1224,57 +1059,7 @@ fi
         reload_service_manager: bool,
         ext_src_path: &str,
     ) -> String {
-        let overlay_section = if let Some(overlay_config) = overlay_config {
-            match overlay_config.mode {
-                OverlayMode::Merge => format!(
-                    r#"
-# Merge overlay directory into extension sysroot
-if [ -d "{src_path}/{overlay_dir}" ]; then
-    echo "Merging overlay directory '{overlay_dir}' into extension sysroot with root:root ownership"
-    # cp -a preserves attrs/symlinks while merging into the existing tree;
-    # chown -R sets ownership to root:root. Avoids depending on rsync.
-    cp -a "{src_path}/{overlay_dir}/." "$AVOCADO_EXT_SYSROOTS/{ext_name}/"
-    chown -R root:root "$AVOCADO_EXT_SYSROOTS/{ext_name}/"
-else
-    echo "Error: Overlay directory '{overlay_dir}' not found in source"
-    exit 1
-fi
-"#,
-                    src_path = ext_src_path,
-                    overlay_dir = overlay_config.dir,
-                    ext_name = self.extension,
-                ),
-                OverlayMode::Opaque => format!(
-                    r#"
-# Copy overlay directory to extension sysroot (opaque mode)
-if [ -d "{src_path}/{overlay_dir}" ]; then
-    echo "Copying overlay directory '{overlay_dir}' to extension sysroot (opaque mode)"
-    # Use cp to replace directory contents completely while preserving permissions
-    cp -r {src_path}/{overlay_dir}/* "$AVOCADO_EXT_SYSROOTS/{ext_name}/"
-    # Fix ownership to root:root for copied overlay files only (permissions are preserved)
-    echo "Setting ownership to root:root for overlay files"
-    find "{src_path}/{overlay_dir}" -mindepth 1 | while IFS= read -r srcpath; do
-        relpath="$(echo "$srcpath" | sed "s|^{src_path}/{overlay_dir}||" | sed "s|^/||")"
-        if [ -n "$relpath" ]; then
-            destpath="$AVOCADO_EXT_SYSROOTS/{ext_name}/$relpath"
-            if [ -e "$destpath" ]; then
-                chown root:root "$destpath" 2>/dev/null || true
-            fi
-        fi
-    done
-else
-    echo "Error: Overlay directory '{overlay_dir}' not found in source"
-    exit 1
-fi
-"#,
-                    src_path = ext_src_path,
-                    overlay_dir = overlay_config.dir,
-                    ext_name = self.extension,
-                ),
-            }
-        } else {
-            String::new()
-        };
+        let overlay_section = self.create_overlay_script_section(overlay_config, ext_src_path);
 
         // Create service enabling section by parsing [Install] section and creating symlinks
         let service_linking_section = if !enable_services.is_empty() {
@@ -1338,101 +1123,122 @@ echo "[INFO] Added AVOCADO_ENABLE_SERVICES=\"{services_list}\" to release file""
             String::new()
         };
 
-        // Create custom on_merge commands section for confext
-        let custom_on_merge_section = if !on_merge_commands.is_empty() {
-            on_merge_commands
-                .iter()
-                .map(|command| {
-                    format!(
-                        r#"echo "AVOCADO_ON_MERGE=\"{command}\"" >> "$release_file"
-echo "[INFO] Added custom on_merge command to release file: {command}""#
-                    )
-                })
-                .collect::<Vec<_>>()
-                .join("\n")
-        } else {
-            String::new()
-        };
+        let custom_on_merge_section =
+            release_file_commands_section("AVOCADO_ON_MERGE", "on_merge", &on_merge_commands);
 
-        // Create custom on_unmerge commands section for confext
-        let custom_on_unmerge_section = if !on_unmerge_commands.is_empty() {
-            on_unmerge_commands
-                .iter()
-                .map(|command| {
-                    format!(
-                        r#"echo "AVOCADO_ON_UNMERGE=\"{command}\"" >> "$release_file"
-echo "[INFO] Added custom on_unmerge command to release file: {command}""#
-                    )
-                })
-                .collect::<Vec<_>>()
-                .join("\n")
-        } else {
-            String::new()
-        };
+        let custom_on_unmerge_section =
+            release_file_commands_section("AVOCADO_ON_UNMERGE", "on_unmerge", &on_unmerge_commands);
+
+        let ext_name = &self.extension;
+        let ext_sysroot = format!("$AVOCADO_EXT_SYSROOTS/{ext_name}");
+        let release_header = release_file_header_section(
+            &format!("{ext_sysroot}/etc/extension-release.d"),
+            ext_name,
+            ext_version,
+            reload_service_manager,
+            "CONFEXT_SCOPE",
+            ext_scopes,
+        );
 
         format!(
             r#"
 set -e
-{}{}
-release_dir="$AVOCADO_EXT_SYSROOTS/{}/etc/extension-release.d"
-release_file="$release_dir/extension-release.{}-{}"
-
-mkdir -p "$release_dir"
-echo "ID=_any" > "$release_file"
-echo "EXTENSION_RELOAD_MANAGER={}" >> "$release_file"
-echo "CONFEXT_SCOPE={}" >> "$release_file"
-
+{overlay_section}{users_section}
+{release_header}
 # Check if extension includes sysusers.d config files and add systemd-sysusers to AVOCADO_ON_MERGE if needed
-sysusers_etc_dir="$AVOCADO_EXT_SYSROOTS/{}/etc/sysusers.d"
+sysusers_etc_dir="{ext_sysroot}/etc/sysusers.d"
 if [ -d "$sysusers_etc_dir" ] && [ -n "$(find "$sysusers_etc_dir" -name "*.conf" 2>/dev/null | head -n 1)" ]; then
     echo "AVOCADO_ON_MERGE=\"systemd-sysusers\"" >> "$release_file"
-    echo "[INFO] Found sysusers.d config files in extension '{}', added AVOCADO_ON_MERGE=\"systemd-sysusers\" to release file"
+    echo "[INFO] Found sysusers.d config files in extension '{ext_name}', added AVOCADO_ON_MERGE=\"systemd-sysusers\" to release file"
 fi
 
 # Check if extension includes ld.so.conf.d config files and add ldconfig to AVOCADO_ON_MERGE if needed
-ldso_etc_dir="$AVOCADO_EXT_SYSROOTS/{}/etc/ld.so.conf.d"
+ldso_etc_dir="{ext_sysroot}/etc/ld.so.conf.d"
 if [ -d "$ldso_etc_dir" ] && [ -n "$(find "$ldso_etc_dir" -name "*.conf" 2>/dev/null | head -n 1)" ]; then
     echo "AVOCADO_ON_MERGE=\"ldconfig\"" >> "$release_file"
-    echo "[INFO] Found ld.so.conf.d config files in extension '{}', added AVOCADO_ON_MERGE=\"ldconfig\" to release file"
+    echo "[INFO] Found ld.so.conf.d config files in extension '{ext_name}', added AVOCADO_ON_MERGE=\"ldconfig\" to release file"
 fi
 
 # Check if extension includes tmpfiles.d config files and add systemd-tmpfiles --create to AVOCADO_ON_MERGE if needed
-tmpfiles_etc_dir="$AVOCADO_EXT_SYSROOTS/{}/etc/tmpfiles.d"
+tmpfiles_etc_dir="{ext_sysroot}/etc/tmpfiles.d"
 if [ -d "$tmpfiles_etc_dir" ] && [ -n "$(find "$tmpfiles_etc_dir" -name "*.conf" 2>/dev/null | head -n 1)" ]; then
     echo "AVOCADO_ON_MERGE=\"systemd-tmpfiles --create\"" >> "$release_file"
-    echo "[INFO] Found tmpfiles.d config files in extension '{}', added AVOCADO_ON_MERGE=\"systemd-tmpfiles --create\" to release file"
+    echo "[INFO] Found tmpfiles.d config files in extension '{ext_name}', added AVOCADO_ON_MERGE=\"systemd-tmpfiles --create\" to release file"
 fi
 
 # Add custom AVOCADO_ON_MERGE commands if specified
-{}
+{custom_on_merge_section}
 
 # Add custom AVOCADO_ON_UNMERGE commands if specified
-{}
+{custom_on_unmerge_section}
 
 # Add AVOCADO_ENABLE_SERVICES if enable_services is configured
-{}
-{}
-"#,
-            overlay_section,
-            users_section,
-            self.extension,
-            self.extension,
-            ext_version,
-            if reload_service_manager { "1" } else { "0" },
-            ext_scopes.join(" "),
-            self.extension,
-            self.extension,
-            self.extension,
-            self.extension,
-            self.extension,
-            self.extension,
-            custom_on_merge_section,
-            custom_on_unmerge_section,
-            enable_services_section,
-            service_linking_section
+{enable_services_section}
+{service_linking_section}
+"#
         )
     }
 
+    /// Script section copying the extension's overlay directory into its
+    /// sysroot. Identical for sysext and confext builds; empty without an
+    /// overlay.
+    fn create_overlay_script_section(
+        &self,
+        overlay_config: Option<&OverlayConfig>,
+        ext_src_path: &str,
+    ) -> String {
+        let Some(overlay_config) = overlay_config else {
+            return String::new();
+        };
+        match overlay_config.mode {
+            OverlayMode::Merge => format!(
+                r#"
+# Merge overlay directory into extension sysroot
+if [ -d "{src_path}/{overlay_dir}" ]; then
+    echo "Merging overlay directory '{overlay_dir}' into extension sysroot with root:root ownership"
+    # cp -a preserves attrs/symlinks while merging into the existing tree;
+    # chown -R sets ownership to root:root. Avoids depending on rsync.
+    cp -a "{src_path}/{overlay_dir}/." "$AVOCADO_EXT_SYSROOTS/{ext_name}/"
+    chown -R root:root "$AVOCADO_EXT_SYSROOTS/{ext_name}/"
+else
+    echo "Error: Overlay directory '{overlay_dir}' not found in source"
+    exit 1
+fi
+"#,
+                src_path = ext_src_path,
+                overlay_dir = overlay_config.dir,
+                ext_name = self.extension,
+            ),
+            OverlayMode::Opaque => format!(
+                r#"
+# Copy overlay directory to extension sysroot (opaque mode)
+if [ -d "{src_path}/{overlay_dir}" ]; then
+    echo "Copying overlay directory '{overlay_dir}' to extension sysroot (opaque mode)"
+    # Use cp to replace directory contents completely while preserving permissions
+    cp -r {src_path}/{overlay_dir}/* "$AVOCADO_EXT_SYSROOTS/{ext_name}/"
+    # Fix ownership to root:root for copied overlay files only (permissions are preserved)
+    echo "Setting ownership to root:root for overlay files"
+    find "{src_path}/{overlay_dir}" -mindepth 1 | while IFS= read -r srcpath; do
+        relpath="$(echo "$srcpath" | sed "s|^{src_path}/{overlay_dir}||" | sed "s|^/||")"
+        if [ -n "$relpath" ]; then
+            destpath="$AVOCADO_EXT_SYSROOTS/{ext_name}/$relpath"
+            if [ -e "$destpath" ]; then
+                chown root:root "$destpath" 2>/dev/null || true
+            fi
+        fi
+    done
+else
+    echo "Error: Overlay directory '{overlay_dir}' not found in source"
+    exit 1
+fi
+"#,
+                src_path = ext_src_path,
+                overlay_dir = overlay_config.dir,
+                ext_name = self.extension,
+            ),
+        }
+    }
+
     /// Creates a script section for handling user and group configuration
     /// Thin wrapper around [`render_users_groups_script`] that targets the
     /// extension's sysroot `/etc` and seeds it from the rootfs `/etc`. Kept
@@ -3563,4 +3369,24 @@ sdk:
         // AVOCADO_SDK_PREFIX=$AVOCADO_SDK_PREFIX bash 'src/test-install.sh';
         // else echo 'Install script test-install.sh not found.' && ls -la src; exit 1; fi
     }
+
+    #[test]
+    fn test_combine_build_scripts_passes_single_script_through() {
+        let scripts = vec![("sysext", "echo sysext".to_string())];
+        assert_eq!(combine_build_scripts(&scripts), "echo sysext");
+    }
+
+    #[test]
+    fn test_combine_build_scripts_runs_each_type_in_a_subshell() {
+        let scripts = vec![
+            ("sysext", "set -e\necho sysext".to_string()),
+            ("confext", "set -e\necho confext".to_string()),
+        ];
+        let combined = combine_build_scripts(&scripts);
+
+        assert!(combined.starts_with("set -e\n"));
+        assert!(combined.contains("(\nset -e\necho sysext\n)"));
+        assert!(combined.contains("(\nset -e\necho confext\n)"));
+        assert!(combined.find("echo sysext").unwrap() < combined.find("echo confext").unwrap());
+    }
 }
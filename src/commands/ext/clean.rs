@@ -2,10 +2,11 @@ use anyhow::{Context, Result};
 use std::collections::HashMap;
 use std::sync::Arc;
 
-use super::find_ext_in_mapping;
+use super::{ext_sysroot, find_ext_in_mapping};
 use crate::utils::config::{ComposedConfig, Config, ExtensionLocation};
 use crate::utils::container::{RunConfig, SdkContainer};
 use crate::utils::output::{print_error, print_info, print_success, OutputLevel};
+use crate::utils::shell::shell_word;
 use crate::utils::stamps::{
     generate_batch_read_stamps_script, validate_stamps_batch, StampRequirement,
 };
@@ -92,6 +93,9 @@ impl ExtCleanCommand {
         let target = resolve_target_required(self.target.as_deref(), config)?;
         let extension_location = self.find_extension_in_dependency_tree(config, &target)?;
         let container_image = self.get_container_image(config)?;
+        // Resolve container args once so every container this command starts
+        // sees the same sdk.container_args + CLI merge.
+        let container_args = config.merge_sdk_container_args(self.container_args.as_ref());
 
         // Get extension configuration from the composed/merged config
         let ext_config = self.get_extension_config(config, parsed, &extension_location, &target)?;
@@ -113,11 +117,13 @@ impl ExtCleanCommand {
             &ext_config,
             &container_image,
             &target,
+            &container_args,
             ext_script_workdir.as_deref(),
         )
         .await?;
 
-        self.clean_extension(&container_image, &target).await
+        self.clean_extension(&container_image, &target, &container_args)
+            .await
     }
 
     /// Get extension configuration from the composed/merged config
@@ -161,6 +167,7 @@ impl ExtCleanCommand {
         ext_config: &serde_yaml::Value,
         container_image: &str,
         target: &str,
+        container_args: &Option<Vec<String>>,
         ext_script_workdir: Option<&str>,
     ) -> Result<()> {
         // Get dependencies from extension configuration
@@ -207,7 +214,6 @@ impl ExtCleanCommand {
         // Get SDK configuration for container setup
         let repo_url = config.get_sdk_repo_url();
         let repo_release = config.get_sdk_repo_release();
-        let merged_container_args = config.merge_sdk_container_args(self.container_args.as_ref());
 
         // Initialize SDK container helper
         let container_helper = SdkContainer::from_config(&self.config_path, config)?;
@@ -224,7 +230,7 @@ impl ExtCleanCommand {
             interactive: false,
             repo_url: repo_url.clone(),
             repo_release: repo_release.clone(),
-            container_args: merged_container_args.clone(),
+            container_args: container_args.clone(),
             dnf_args: self.dnf_args.clone(),
             sdk_arch: self.sdk_arch.clone(),
             env_vars: self.runtime_env_vars(),
@@ -288,7 +294,7 @@ impl ExtCleanCommand {
                 interactive: false,
                 repo_url: repo_url.clone(),
                 repo_release: repo_release.clone(),
-                container_args: merged_container_args.clone(),
+                container_args: container_args.clone(),
                 dnf_args: self.dnf_args.clone(),
                 sdk_arch: self.sdk_arch.clone(),
                 env_vars: self.runtime_env_vars(),
@@ -389,7 +395,12 @@ impl ExtCleanCommand {
             })
     }
 
-    async fn clean_extension(&self, container_image: &str, target: &str) -> Result<()> {
+    async fn clean_extension(
+        &self,
+        container_image: &str,
+        target: &str,
+        container_args: &Option<Vec<String>>,
+    ) -> Result<()> {
         print_info(
             &format!("Cleaning extension '{}'...", self.extension),
             OutputLevel::Normal,
@@ -398,19 +409,7 @@ impl ExtCleanCommand {
         let container_helper = SdkContainer::new();
 
         // Clean sysroot, output files, and stamps
-        let clean_command = format!(
-            r#"
-# Clean extension sysroot
-rm -rf "$AVOCADO_EXT_SYSROOTS/{ext}"
-
-# Clean extension output files (built .raw images)
-rm -f "$AVOCADO_PREFIX/output/extensions/{ext}"-*.raw
-
-# Clean extension stamps (install and build)
-rm -rf "$AVOCADO_PREFIX/.stamps/ext/{ext}"
-"#,
-            ext = self.extension
-        );
+        let clean_command = self.generate_clean_script();
 
         if self.verbose {
             print_info(
@@ -426,9 +425,7 @@ rm -rf "$AVOCADO_PREFIX/.stamps/ext/{ext}"
             verbose: self.verbose,
             source_environment: false, // don't source environment
             interactive: false,
-            container_args: crate::utils::config::Config::process_container_args(
-                self.container_args.as_ref(),
-            ),
+            container_args: container_args.clone(),
             dnf_args: self.dnf_args.clone(),
             sdk_arch: self.sdk_arch.clone(),
             env_vars: self.runtime_env_vars(),
@@ -451,21 +448,22 @@ rm -rf "$AVOCADO_PREFIX/.stamps/ext/{ext}"
         }
     }
 
-    /// Generate the clean command script for testing
-    #[cfg(test)]
+    /// Generate the clean command script. Every step is an unconditional
+    /// `rm`, so a missing sysroot needs no separate existence probe.
     fn generate_clean_script(&self) -> String {
         format!(
             r#"
 # Clean extension sysroot
-rm -rf "$AVOCADO_EXT_SYSROOTS/{ext}"
+rm -rf {sysroot}
 
-# Clean extension output files (built .raw images)
-rm -f "$AVOCADO_PREFIX/output/extensions/{ext}"-*.raw
+# Clean extension output files (built .raw images and their fingerprints)
+rm -f "$AVOCADO_PREFIX/output/extensions/"{ext}-*.raw "$AVOCADO_PREFIX/output/extensions/"{ext}-*.raw.fingerprint
 
 # Clean extension stamps (install and build)
-rm -rf "$AVOCADO_PREFIX/.stamps/ext/{ext}"
+rm -rf "$AVOCADO_PREFIX/.stamps/ext/"{ext}
 "#,
-            ext = self.extension
+            sysroot = ext_sysroot(&self.extension),
+            ext = shell_word(&self.extension)
         )
     }
 }
@@ -525,7 +523,7 @@ mod tests {
         let script = cmd.generate_clean_script();
 
         // Should clean extension sysroot
-        assert!(script.contains(r#"rm -rf "$AVOCADO_EXT_SYSROOTS/gpu-driver""#));
+        assert!(script.contains(r#"rm -rf "$AVOCADO_EXT_SYSROOTS"/gpu-driver"#));
     }
 
     #[test]
@@ -543,7 +541,7 @@ mod tests {
 
         // Should clean built extension images
         assert!(
-            script.contains(r#"rm -f "$AVOCADO_PREFIX/output/extensions/network-driver"-*.raw"#)
+            script.contains(r#"rm -f "$AVOCADO_PREFIX/output/extensions/"network-driver-*.raw"#)
         );
     }
 
@@ -561,7 +559,24 @@ mod tests {
         let script = cmd.generate_clean_script();
 
         // Should clean extension stamps (install and build)
-        assert!(script.contains(r#"rm -rf "$AVOCADO_PREFIX/.stamps/ext/app-bundle""#));
+        assert!(script.contains(r#"rm -rf "$AVOCADO_PREFIX/.stamps/ext/"app-bundle"#));
+    }
+
+    #[test]
+    fn test_clean_script_escapes_extension_name() {
+        let cmd = ExtCleanCommand::new(
+            "odd\"$(name)`x`".to_string(),
+            "avocado.yaml".to_string(),
+            false,
+            None,
+            None,
+            None,
+        );
+
+        let script = cmd.generate_clean_script();
+
+        assert!(script.contains(r#"rm -rf "$AVOCADO_EXT_SYSROOTS"/'odd"$(name)`x`'"#));
+        assert!(script.contains(r#"rm -rf "$AVOCADO_PREFIX/.stamps/ext/"'odd"$(name)`x`'"#));
     }
 
     #[test]
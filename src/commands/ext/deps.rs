@@ -1,5 +1,6 @@
 use anyhow::Result;
 use std::collections::HashSet;
+use std::io::{self, BufWriter, Write};
 use std::sync::Arc;
 
 use crate::utils::config::{ComposedConfig, Config};
@@ -120,24 +121,28 @@ impl ExtDepsCommand {
             return;
         }
 
+        // Lock stdout once and buffer the listing; stdout is line-buffered,
+        // so per-line println! would lock and flush for every dependency.
+        let mut out = BufWriter::new(io::stdout().lock());
         for ext_name in extensions {
-            println!("Extension: {ext_name}");
+            let _ = writeln!(out, "Extension: {ext_name}");
 
             let dependencies = self.list_packages_from_config(parsed, ext_name);
-            self.print_dependencies(&dependencies);
-            println!();
+            self.print_dependencies(&mut out, &dependencies);
+            let _ = writeln!(out);
         }
+        let _ = out.flush();
     }
 
-    fn print_dependencies(&self, dependencies: &[(String, String, String)]) {
+    fn print_dependencies(&self, out: &mut impl Write, dependencies: &[(String, String, String)]) {
         if dependencies.is_empty() {
-            println!("  No dependencies");
+            let _ = writeln!(out, "  No dependencies");
             return;
         }
 
         for (dep_type, pkg_name, pkg_version) in dependencies {
             let type_prefix = if dep_type == "ext" { "ext:" } else { "pkg:" };
-            println!("  {type_prefix}{pkg_name} = {pkg_version}");
+            let _ = writeln!(out, "  {type_prefix}{pkg_name} = {pkg_version}");
         }
     }
 
@@ -278,7 +283,9 @@ impl ExtDepsCommand {
             return Vec::new();
         };
 
-        let mut all_packages: Vec<_> = deps_table
+        // Split extensions from packages while collecting: extensions are
+        // listed first, so each group then only needs a by-name sort.
+        let (mut extensions, mut packages): (Vec<_>, Vec<_>) = deps_table
             .iter()
             .flat_map(|(package_name_val, package_spec)| {
                 package_name_val
@@ -288,27 +295,26 @@ impl ExtDepsCommand {
                     })
                     .unwrap_or_default()
             })
-            .collect();
+            .partition(|(dep_type, _, _)| dep_type == "ext");
 
-        self.deduplicate_and_sort(&mut all_packages);
-        all_packages
+        for group in [&mut extensions, &mut packages] {
+            self.deduplicate(group);
+            group.sort_by(|a, b| a.1.cmp(&b.1));
+        }
+
+        extensions.append(&mut packages);
+        extensions
     }
 
-    fn deduplicate_and_sort(&self, packages: &mut Vec<(String, String, String)>) {
-        // Remove duplicates while preserving order
-        let mut seen = HashSet::new();
-        packages.retain(|pkg| seen.insert(pkg.clone()));
-
-        // Sort: extensions first, then packages, both alphabetically
-        packages.sort_by(|a, b| {
-            let a_is_ext = a.0 == "ext";
-            let b_is_ext = b.0 == "ext";
-            match (a_is_ext, b_is_ext) {
-                (true, false) => std::cmp::Ordering::Less,
-                (false, true) => std::cmp::Ordering::Greater,
-                _ => a.1.cmp(&b.1),
-            }
-        });
+    fn deduplicate(&self, packages: &mut Vec<(String, String, String)>) {
+        // Remove duplicates while preserving order. The seen-set borrows the
+        // tuples, so only the keep/drop decision is stored — nothing is cloned.
+        let keep: Vec<bool> = {
+            let mut seen = HashSet::new();
+            packages.iter().map(|pkg| seen.insert(pkg)).collect()
+        };
+        let mut keep = keep.into_iter();
+        packages.retain(|_| keep.next().unwrap_or(false));
     }
 }
 
@@ -405,4 +411,68 @@ extensions:
         assert_eq!(result[0].1, "test-package");
         assert_eq!(result[0].2, "1.0.0");
     }
+
+    #[test]
+    fn test_list_packages_dedupes_and_sorts_extensions_first() {
+        let config_content = r#"
+extensions:
+  base-ext:
+    version: "2.0.0"
+  my-ext:
+    packages:
+      zlib: "1.0"
+      app:
+        compile: app
+      base-ext:
+        extensions: base-ext
+sdk:
+  compile:
+    app:
+      packages:
+        zlib: "1.0"
+        curl: "*"
+"#;
+
+        let config: serde_yaml::Value = serde_yaml::from_str(config_content).unwrap();
+        let cmd = ExtDepsCommand::new("test.yaml".to_string(), None, None);
+
+        let result = cmd.list_packages_from_config(&config, "my-ext");
+        let expected = [
+            ("ext", "base-ext", "2.0.0"),
+            ("pkg", "curl", "*"),
+            ("pkg", "zlib", "1.0"),
+        ];
+        assert_eq!(result.len(), expected.len());
+        for ((dep_type, name, version), (e_type, e_name, e_version)) in result.iter().zip(expected)
+        {
+            assert_eq!(
+                (dep_type.as_str(), name.as_str(), version.as_str()),
+                (e_type, e_name, e_version)
+            );
+        }
+    }
+
+    #[test]
+    fn test_print_dependencies_formats_each_entry() {
+        let cmd = ExtDepsCommand::new("test.yaml".to_string(), None, None);
+        let deps = vec![
+            (
+                "ext".to_string(),
+                "base-ext".to_string(),
+                "2.0.0".to_string(),
+            ),
+            ("pkg".to_string(), "curl".to_string(), "*".to_string()),
+        ];
+
+        let mut out = Vec::new();
+        cmd.print_dependencies(&mut out, &deps);
+        assert_eq!(
+            String::from_utf8(out).unwrap(),
+            "  ext:base-ext = 2.0.0\n  pkg:curl = *\n"
+        );
+
+        let mut out = Vec::new();
+        cmd.print_dependencies(&mut out, &[]);
+        assert_eq!(String::from_utf8(out).unwrap(), "  No dependencies\n");
+    }
 }
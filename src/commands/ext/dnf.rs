@@ -1,15 +1,30 @@
 use anyhow::{Context, Result};
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
+use std::io::IsTerminal;
 use std::sync::Arc;
 
+use super::ext_sysroot;
 use crate::utils::config::{ComposedConfig, Config, ExtensionLocation};
 use crate::utils::container::{RunConfig, SdkContainer};
 use crate::utils::output::{print_error, print_info, print_success, OutputLevel};
+use crate::utils::shell::shell_word;
 use crate::utils::target::resolve_target_required;
 
+/// RPM database every extension sysroot is seeded from.
+const ROOTFS_RPMDB: &str = "$AVOCADO_PREFIX/rootfs/var/lib/rpm";
+
+fn extension_location_name(extension_location: &ExtensionLocation) -> &str {
+    match extension_location {
+        ExtensionLocation::Local { name, .. } => name,
+        ExtensionLocation::Remote { name, .. } => name,
+    }
+}
+
 pub struct ExtDnfCommand {
     config_path: String,
-    extension: String,
+    /// Extensions to run the DNF command against, in order. All of them are
+    /// handled in one container run.
+    extensions: Vec<String>,
     command: Vec<String>,
     verbose: bool,
     target: Option<String>,
@@ -24,7 +39,7 @@ pub struct ExtDnfCommand {
 impl ExtDnfCommand {
     pub fn new(
         config_path: String,
-        extension: String,
+        extensions: Vec<String>,
         command: Vec<String>,
         verbose: bool,
         target: Option<String>,
@@ -33,7 +48,7 @@ impl ExtDnfCommand {
     ) -> Self {
         Self {
             config_path,
-            extension,
+            extensions,
             command,
             verbose,
             target,
@@ -83,10 +98,13 @@ impl ExtDnfCommand {
         };
         let config = &composed.config;
         let merged_container_args = config.merge_sdk_container_args(self.container_args.as_ref());
-        let parsed = &composed.merged_value;
 
         let target = self.resolve_target_architecture(config)?;
-        let extension_location = self.find_extension_in_dependency_tree(config, &target)?;
+        let extension_locations = self
+            .extensions
+            .iter()
+            .map(|extension| self.find_extension_in_dependency_tree(config, &target, extension))
+            .collect::<Result<Vec<_>>>()?;
         let container_image = self.get_container_image(config)?;
 
         // Get repo_url and repo_release from config
@@ -94,13 +112,12 @@ impl ExtDnfCommand {
         let repo_release = config.get_sdk_repo_release();
 
         self.execute_dnf_command(
-            parsed,
             &container_image,
             &target,
             repo_url.as_ref(),
             repo_release.as_ref(),
             &merged_container_args,
-            &extension_location,
+            &extension_locations,
         )
         .await
     }
@@ -109,12 +126,9 @@ impl ExtDnfCommand {
         &self,
         config: &Config,
         target: &str,
+        extension: &str,
     ) -> Result<ExtensionLocation> {
-        match config.find_extension_in_dependency_tree(
-            &self.config_path,
-            &self.extension,
-            target,
-        )? {
+        match config.find_extension_in_dependency_tree(&self.config_path, extension, target)? {
             Some(location) => {
                 if self.verbose {
                     match &location {
@@ -138,7 +152,7 @@ impl ExtDnfCommand {
             }
             None => {
                 print_error(
-                    &format!("Extension '{}' not found in configuration.", self.extension),
+                    &format!("Extension '{extension}' not found in configuration."),
                     OutputLevel::Normal,
                 );
                 Err(anyhow::anyhow!("Extension not found"))
@@ -162,31 +176,17 @@ impl ExtDnfCommand {
     #[allow(clippy::too_many_arguments)]
     async fn execute_dnf_command(
         &self,
-        parsed: &serde_yaml::Value,
         container_image: &str,
         target: &str,
         repo_url: Option<&String>,
         repo_release: Option<&String>,
         merged_container_args: &Option<Vec<String>>,
-        extension_location: &ExtensionLocation,
+        extension_locations: &[ExtensionLocation],
     ) -> Result<()> {
         let container_helper = SdkContainer::new();
 
-        // Perform extension setup first
-        self.setup_extension_environment(
-            parsed,
-            &container_helper,
-            container_image,
-            target,
-            repo_url,
-            repo_release,
-            merged_container_args,
-            extension_location,
-        )
-        .await?;
-
-        // Build and execute DNF command
-        let dnf_command = self.build_dnf_command(extension_location);
+        // Every extension's sysroot setup and DNF run share one container.
+        let dnf_command = self.build_run_script(extension_locations);
         self.run_dnf_command(
             &container_helper,
             container_image,
@@ -199,110 +199,69 @@ impl ExtDnfCommand {
         .await
     }
 
-    #[allow(clippy::too_many_arguments)]
-    async fn setup_extension_environment(
-        &self,
-        _config: &serde_yaml::Value,
-        container_helper: &SdkContainer,
-        container_image: &str,
-        target: &str,
-        repo_url: Option<&String>,
-        repo_release: Option<&String>,
-        merged_container_args: &Option<Vec<String>>,
-        extension_location: &ExtensionLocation,
-    ) -> Result<()> {
-        let extension_name = match extension_location {
-            ExtensionLocation::Local { name, .. } => name,
-            ExtensionLocation::Remote { name, .. } => name,
-        };
-        let check_cmd = format!("test -d $AVOCADO_EXT_SYSROOTS/{extension_name}");
-
-        let config = RunConfig {
-            container_image: container_image.to_string(),
-            target: target.to_string(),
-            command: check_cmd,
-            verbose: self.verbose,
-            source_environment: false, // don't source environment
-            interactive: false,
-            repo_url: repo_url.cloned(),
-            repo_release: repo_release.cloned(),
-            container_args: merged_container_args.clone(),
-            dnf_args: self.dnf_args.clone(),
-            sdk_arch: self.sdk_arch.clone(),
-            env_vars: self.runtime_env_vars(),
-            ..Default::default()
-        };
-        let dir_exists = container_helper.run_in_container(config).await?;
-
-        if !dir_exists {
-            // TODO: does this actually need the repo release + url ??
-            self.create_extension_directory(
-                container_helper,
-                container_image,
-                target,
-                repo_url,
-                repo_release,
-                merged_container_args,
-                extension_location,
-            )
-            .await?;
+    /// Script for the whole run. With several extensions the sysroot setups
+    /// are independent, so they run concurrently ahead of the DNF calls;
+    /// those stay sequential since they share the container's DNF cache and
+    /// terminal.
+    fn build_run_script(&self, extension_locations: &[ExtensionLocation]) -> String {
+        let mut script = String::from("set -e\n");
+        if let [location] = extension_locations {
+            script.push_str(&self.build_extension_script(location));
+            return script;
         }
 
-        Ok(())
+        let mut seen = HashSet::new();
+        script.push_str("setup_pids=\"\"\n");
+        for location in extension_locations {
+            let extension_name = extension_location_name(location);
+            if seen.insert(extension_name) {
+                script.push_str(&format!(
+                    "( {} ) &\nsetup_pids=\"$setup_pids $!\"\n",
+                    self.build_guarded_setup_command(extension_name)
+                ));
+            }
+        }
+        script.push_str("for pid in $setup_pids; do wait \"$pid\" || exit 1; done\n");
+        for location in extension_locations {
+            script.push_str(&self.build_dnf_command(location));
+        }
+        script
     }
 
-    #[allow(clippy::too_many_arguments)]
-    async fn create_extension_directory(
-        &self,
-        container_helper: &SdkContainer,
-        container_image: &str,
-        target: &str,
-        repo_url: Option<&String>,
-        repo_release: Option<&String>,
-        merged_container_args: &Option<Vec<String>>,
-        extension_location: &ExtensionLocation,
-    ) -> Result<()> {
-        let extension_name = match extension_location {
-            ExtensionLocation::Local { name, .. } => name,
-            ExtensionLocation::Remote { name, .. } => name,
-        };
-        let setup_cmd = format!(
-            "mkdir -p $AVOCADO_EXT_SYSROOTS/{extension_name}/var/lib && cp -rf $AVOCADO_PREFIX/rootfs/var/lib/rpm $AVOCADO_EXT_SYSROOTS/{extension_name}/var/lib"
-        );
-
-        let config = RunConfig {
-            container_image: container_image.to_string(),
-            target: target.to_string(),
-            command: setup_cmd,
-            verbose: self.verbose,
-            source_environment: false, // don't source environment
-            interactive: false,
-            repo_url: repo_url.cloned(),
-            repo_release: repo_release.cloned(),
-            container_args: merged_container_args.clone(),
-            dnf_args: self.dnf_args.clone(),
-            sdk_arch: self.sdk_arch.clone(),
-            env_vars: self.runtime_env_vars(),
-            ..Default::default()
-        };
-        let setup_success = container_helper.run_in_container(config).await?;
-
-        if !setup_success {
-            print_error(
-                &format!("Failed to set up extension directory for '{extension_name}'."),
-                OutputLevel::Normal,
-            );
-            return Err(anyhow::anyhow!("Failed to create extension directory"));
-        }
+    /// Script for one extension: create its sysroot if needed, then run DNF
+    /// against it. The setup snippet is a no-op once the sysroot exists.
+    fn build_extension_script(&self, extension_location: &ExtensionLocation) -> String {
+        format!(
+            "{setup}\n{dnf}",
+            setup = self.build_guarded_setup_command(extension_location_name(extension_location)),
+            dnf = self.build_dnf_command(extension_location),
+        )
+    }
 
-        if self.verbose {
-            print_info(
-                &format!("Created extension directory for '{extension_name}'."),
-                OutputLevel::Normal,
-            );
-        }
+    /// [`Self::build_setup_command`] with a failure message naming the
+    /// extension, exiting the (sub)shell on error.
+    fn build_guarded_setup_command(&self, extension_name: &str) -> String {
+        format!(
+            "{setup} || {{ echo \"[ERROR] Failed to set up extension directory for '\"{name}\"'.\" >&2; exit 1; }}",
+            setup = self.build_setup_command(extension_name),
+            name = shell_word(extension_name),
+        )
+    }
 
-        Ok(())
+    /// Shell snippet that creates the extension sysroot, seeded with the
+    /// rootfs rpm database, unless it already exists.
+    ///
+    /// The database is copied with `--reflink=auto` so copy-on-write volumes
+    /// share extents instead of duplicating them; a `cp` without reflink
+    /// support falls back to a plain copy. Hardlinks are not an option: DNF
+    /// writes the copied database in place, which would corrupt the rootfs'.
+    fn build_setup_command(&self, extension_name: &str) -> String {
+        let root = ext_sysroot(extension_name);
+        format!(
+            r#"if [ ! -d {root} ]; then
+    mkdir -p {root}/var/lib && {{ cp -rf --reflink=auto "{ROOTFS_RPMDB}" {root}/var/lib 2>/dev/null || cp -rf "{ROOTFS_RPMDB}" {root}/var/lib; }}
+fi"#
+        )
     }
 
     #[allow(clippy::too_many_arguments)]
@@ -329,7 +288,9 @@ impl ExtDnfCommand {
             command: dnf_command.to_string(),
             verbose: self.verbose,
             source_environment: false, // don't source environment
-            interactive: true,
+            // Only allocate a PTY when a user is actually at the terminal;
+            // piped or CI runs keep stdin open (-i) without the -t overhead.
+            interactive: std::io::stdin().is_terminal() && std::io::stdout().is_terminal(),
             repo_url: repo_url.cloned(),
             repo_release: repo_release.cloned(),
             container_args: merged_container_args.clone(),
@@ -349,13 +310,21 @@ impl ExtDnfCommand {
         }
     }
 
+    /// DNF invocation for one extension sysroot.
+    ///
+    /// Repo metadata is cached next to the target repo configuration rather
+    /// than inside each installroot, so every extension (and every later
+    /// run) reuses one copy of the target repo metadata on the project
+    /// volume instead of downloading it per sysroot.
     fn build_dnf_command(&self, extension_location: &ExtensionLocation) -> String {
-        let extension_name = match extension_location {
-            ExtensionLocation::Local { name, .. } => name,
-            ExtensionLocation::Remote { name, .. } => name,
-        };
-        let installroot = format!("$AVOCADO_EXT_SYSROOTS/{extension_name}");
-        let command_args_str = self.command.join(" ");
+        let extension_name = extension_location_name(extension_location);
+        let installroot = ext_sysroot(extension_name);
+        let command_args_str = self
+            .command
+            .iter()
+            .map(|arg| shell_word(arg))
+            .collect::<Vec<_>>()
+            .join(" ");
         let dnf_args_str = if let Some(args) = &self.dnf_args {
             format!(" {} ", args.join(" "))
         } else {
@@ -371,6 +340,7 @@ RPM_CONFIGDIR=$AVOCADO_SDK_PREFIX/ext-rpm-config-scripts \
 RPM_ETCCONFIGDIR=$DNF_SDK_TARGET_PREFIX \
 $DNF_SDK_HOST \
     $DNF_SDK_TARGET_REPO_CONF \
+    --setopt=cachedir=$DNF_SDK_TARGET_PREFIX/var/cache \
     --setopt=sslcacert=${{SSL_CERT_FILE}} \
     --installroot={installroot} \
     --disablerepo=${{AVOCADO_TARGET}}-target-ext \
@@ -380,3 +350,94 @@ $DNF_SDK_HOST \
         )
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn dnf_command() -> ExtDnfCommand {
+        ExtDnfCommand::new(
+            "avocado.yaml".to_string(),
+            vec!["my-ext".to_string()],
+            vec!["install".to_string(), "curl".to_string()],
+            false,
+            None,
+            None,
+            None,
+        )
+    }
+
+    #[test]
+    fn test_setup_command_probes_and_creates_in_one_script() {
+        let script = dnf_command().build_setup_command("my-ext");
+
+        assert!(script.starts_with(r#"if [ ! -d "$AVOCADO_EXT_SYSROOTS"/my-ext ]; then"#));
+        assert!(script.contains(r#"mkdir -p "$AVOCADO_EXT_SYSROOTS"/my-ext/var/lib"#));
+        assert!(script.contains(
+            r#"cp -rf --reflink=auto "$AVOCADO_PREFIX/rootfs/var/lib/rpm" "$AVOCADO_EXT_SYSROOTS"/my-ext/var/lib 2>/dev/null"#
+        ));
+        assert!(script.contains(
+            r#"|| cp -rf "$AVOCADO_PREFIX/rootfs/var/lib/rpm" "$AVOCADO_EXT_SYSROOTS"/my-ext/var/lib; }"#
+        ));
+        assert!(script.trim_end().ends_with("fi"));
+    }
+
+    #[test]
+    fn test_extension_script_targets_its_own_installroot() {
+        let location = ExtensionLocation::Local {
+            name: "other-ext".to_string(),
+            config_path: "avocado.yaml".to_string(),
+        };
+        let script = dnf_command().build_extension_script(&location);
+
+        assert!(script.starts_with(r#"if [ ! -d "$AVOCADO_EXT_SYSROOTS"/other-ext ]; then"#));
+        assert!(script.contains("Failed to set up extension directory for '\"other-ext\"'."));
+        assert!(script.contains("--installroot=\"$AVOCADO_EXT_SYSROOTS\"/other-ext"));
+        assert!(script.trim_end().ends_with("install curl"));
+    }
+
+    #[test]
+    fn test_dnf_command_shares_metadata_cache_across_extensions() {
+        let cmd = dnf_command();
+        let cache_opt = "--setopt=cachedir=$DNF_SDK_TARGET_PREFIX/var/cache";
+        for name in ["my-ext", "other-ext"] {
+            let location = ExtensionLocation::Local {
+                name: name.to_string(),
+                config_path: "avocado.yaml".to_string(),
+            };
+            let script = cmd.build_dnf_command(&location);
+            assert!(script.contains(cache_opt));
+            assert!(script.contains(&format!("--installroot=\"$AVOCADO_EXT_SYSROOTS\"/{name}")));
+        }
+    }
+
+    #[test]
+    fn test_run_script_sets_up_extensions_concurrently_then_runs_dnf_in_order() {
+        let location = |name: &str| ExtensionLocation::Local {
+            name: name.to_string(),
+            config_path: "avocado.yaml".to_string(),
+        };
+        let script = dnf_command().build_run_script(&[
+            location("ext-a"),
+            location("ext-b"),
+            location("ext-a"),
+        ]);
+
+        assert!(script.starts_with("set -e\n"));
+        assert_eq!(script.matches(") &\nsetup_pids=").count(), 2);
+        let wait = script.find("wait \"$pid\"").unwrap();
+        let first_dnf = script
+            .find("--installroot=\"$AVOCADO_EXT_SYSROOTS\"/ext-a")
+            .unwrap();
+        let second_dnf = script
+            .find("--installroot=\"$AVOCADO_EXT_SYSROOTS\"/ext-b")
+            .unwrap();
+        assert!(wait < first_dnf && first_dnf < second_dnf);
+        assert_eq!(
+            script
+                .matches("--installroot=\"$AVOCADO_EXT_SYSROOTS\"/ext-a")
+                .count(),
+            2
+        );
+    }
+}
@@ -1,4 +1,5 @@
 use anyhow::{Context, Result};
+use sha2::{Digest, Sha256};
 use std::collections::HashMap;
 use std::path::PathBuf;
 use std::sync::Arc;
@@ -514,10 +515,10 @@ impl ExtImageCommand {
             .unwrap_or(effective_fs);
 
         match filesystem {
-            "squashfs" | "erofs" | "erofs-lz4" | "erofs-zst" => {}
+            "squashfs" | "squashfs-zst" | "erofs" | "erofs-lz4" | "erofs-zst" => {}
             other => {
                 return Err(anyhow::anyhow!(
-                    "Extension '{}' has invalid filesystem type '{}'. Must be 'squashfs', 'erofs', 'erofs-lz4', or 'erofs-zst'.",
+                    "Extension '{}' has invalid filesystem type '{}'. Must be 'squashfs', 'squashfs-zst', 'erofs', 'erofs-lz4', or 'erofs-zst'.",
                     self.extension,
                     other
                 ));
@@ -560,22 +561,6 @@ impl ExtImageCommand {
             None
         };
 
-        // Use resolved target (from CLI/env) if available, otherwise fall back to config
-        let _config_target = parsed
-            .get("runtimes")
-            .and_then(|runtime| runtime.as_mapping())
-            .and_then(|runtime_table| {
-                if runtime_table.len() == 1 {
-                    runtime_table.values().next()
-                } else {
-                    None
-                }
-            })
-            .and_then(|runtime_config| runtime_config.get("target"))
-            .and_then(|target| target.as_str())
-            .map(|s| s.to_string());
-        let target_arch = resolve_target_required(self.target.as_deref(), config)?;
-
         // Initialize SDK container helper
         let container_helper = SdkContainer::new();
 
@@ -623,11 +608,30 @@ impl ExtImageCommand {
             kab_env_vars = Some(env);
         }
 
+        // The image stamp is written by the build script itself, after the
+        // image is built (or reused), instead of in a separate container run.
+        let stamp_script = if self.no_stamps {
+            None
+        } else {
+            let inputs = compute_ext_image_input_hash(
+                parsed,
+                &self.extension,
+                Some(filesystem),
+                &config.project_root(&self.config_path),
+                Some(target.as_str()),
+                self.runtime.as_deref(),
+                self.target_board.as_deref(),
+            )?;
+            let outputs = StampOutputs::default();
+            let stamp = Stamp::ext_image(&self.extension, &target, inputs, outputs);
+            Some(generate_write_stamp_script(&stamp)?)
+        };
+
         let result = self
             .create_image(
                 &container_helper,
                 container_image,
-                &target_arch,
+                &target,
                 &ext_version,
                 &ext_types.join(","), // Pass types for potential future use
                 repo_url.as_ref(),
@@ -640,6 +644,7 @@ impl ExtImageCommand {
                 &image_type,
                 image_args.as_deref(),
                 &kab_env_vars,
+                stamp_script.as_deref(),
             )
             .await?;
 
@@ -647,7 +652,7 @@ impl ExtImageCommand {
             let image_ext = if image_type == "kab" { "kab" } else { "raw" };
             let image_filename = format!("{}-{}.{}", self.extension, ext_version, image_ext);
             let container_image_path =
-                format!("/opt/_avocado/{target_arch}/output/extensions/{image_filename}");
+                format!("/opt/_avocado/{target}/output/extensions/{image_filename}");
 
             // Copy image to host if --out specified
             if let Some(output_dir) = &self.output_dir {
@@ -687,49 +692,11 @@ impl ExtImageCommand {
                 );
             }
 
-            // Write extension image stamp (unless --no-stamps)
-            if !self.no_stamps {
-                let inputs = compute_ext_image_input_hash(
-                    parsed,
-                    &self.extension,
-                    Some(filesystem),
-                    &config.project_root(&self.config_path),
-                    Some(target.as_str()),
-                    self.runtime.as_deref(),
-                    self.target_board.as_deref(),
-                )?;
-                let outputs = StampOutputs::default();
-                let stamp = Stamp::ext_image(&self.extension, &target, inputs, outputs);
-                let stamp_script = generate_write_stamp_script(&stamp)?;
-
-                let run_config = RunConfig {
-                    container_image: container_image.to_string(),
-                    target: target.clone(),
-                    command: stamp_script,
-                    verbose: self.verbose,
-                    source_environment: true,
-                    interactive: false,
-                    repo_url: repo_url.clone(),
-                    repo_release: repo_release.clone(),
-                    container_args: merged_container_args.clone(),
-                    dnf_args: self.dnf_args.clone(),
-                    sdk_arch: self.sdk_arch.clone(),
-                    tui_context: effective_tui_context.clone(),
-                    env_vars: self.merge_runtime_env(&None),
-                    ..Default::default()
-                };
-
-                let container_helper = SdkContainer::from_config(&self.config_path, config)?
-                    .verbose(self.verbose)
-                    .with_cli_target_board(self.target_board.clone());
-                container_helper.run_in_container(run_config).await?;
-
-                if self.verbose {
-                    print_info(
-                        &format!("Wrote image stamp for extension '{}'.", self.extension),
-                        OutputLevel::Normal,
-                    );
-                }
+            if stamp_script.is_some() && self.verbose {
+                print_info(
+                    &format!("Wrote image stamp for extension '{}'.", self.extension),
+                    OutputLevel::Normal,
+                );
             }
         } else {
             return Err(anyhow::anyhow!(
@@ -839,9 +806,10 @@ impl ExtImageCommand {
         image_type: &str,
         image_args: Option<&str>,
         extra_env_vars: &Option<std::collections::HashMap<String, String>>,
+        stamp_script: Option<&str>,
     ) -> Result<bool> {
         // Create the build script
-        let build_script = self.create_build_script(
+        let mut build_script = self.create_build_script(
             ext_version,
             extension_type,
             source_date_epoch,
@@ -850,6 +818,9 @@ impl ExtImageCommand {
             image_type,
             image_args,
         );
+        if let Some(stamp_script) = stamp_script {
+            build_script.push_str(stamp_script);
+        }
 
         // Execute the build script in the SDK container
         if self.verbose {
@@ -928,6 +899,10 @@ mkfs.erofs \
                 )
             }
             _ => {
+                let compress_flag = match filesystem {
+                    "squashfs-zst" => " \\\n  -comp zstd",
+                    _ => "",
+                };
                 let exclude_flags = var_excludes
                     .iter()
                     .map(|p| format!("  -e \"{p}\""))
@@ -945,11 +920,40 @@ mksquashfs \
   "$OUTPUT_FILE" \
   -noappend \
   -no-xattrs \
-  -reproducible{exclude_section}"#
+  -reproducible{compress_flag}{exclude_section}"#
                 )
             }
         };
 
+        // A plain .raw image is reused when neither the sysroot tree (paths,
+        // sizes, mtimes, inodes, modes, owners, link targets) nor the mkfs
+        // parameters changed since it was built. KAB builds remove the .raw
+        // after wrapping, so they always rebuild.
+        let (reuse_check, record_fingerprint) = if image_type == "kab" {
+            (String::new(), String::new())
+        } else {
+            let params_fingerprint = crate::utils::jcs::hex_encode(&Sha256::digest(
+                format!("{source_date_epoch}\n{mkfs_command}").as_bytes(),
+            ));
+            (
+                format!(
+                    r#"
+# Reuse the existing image if the sysroot and image parameters are unchanged
+IMAGE_FINGERPRINT=$({{ echo "{params_fingerprint}"; find "$AVOCADO_EXT_SYSROOTS/$EXT_NAME" -printf '%P %y %s %T@ %i %m %U %G %l\n' | LC_ALL=C sort; }} | sha256sum | cut -d' ' -f1)
+if [ -f "$OUTPUT_FILE" ] && [ "$(cat "$OUTPUT_FILE.fingerprint" 2>/dev/null)" = "$IMAGE_FINGERPRINT" ]; then
+    echo "Extension image is up to date: $OUTPUT_FILE"
+    REUSE_IMAGE=1
+else
+    rm -f "$OUTPUT_FILE.fingerprint"
+fi
+"#
+                ),
+                r#"
+echo "$IMAGE_FINGERPRINT" > "$OUTPUT_FILE.fingerprint""#
+                    .to_string(),
+            )
+        };
+
         let kab_wrapping = if image_type == "kab" {
             let kab_args = image_args
                 .unwrap_or(r#"-b -t kos.layer -v "$EXT_VERSION" --tag "$AVOCADO_TARGET""#);
@@ -997,34 +1001,39 @@ echo "Created KAB extension image: $KAB_OUTPUT"
 set -e
 
 # Common variables
-EXT_NAME="{}"
-EXT_VERSION="{}"
+EXT_NAME={}
+EXT_VERSION={}
 OUTPUT_DIR="$AVOCADO_PREFIX/output/extensions"
 OUTPUT_FILE="$OUTPUT_DIR/$EXT_NAME-$EXT_VERSION.raw"
 
 # Create output directory
 mkdir -p $OUTPUT_DIR
 
-# Remove existing file if it exists
-rm -f "$OUTPUT_FILE"
-
 # Check if extension directory exists
 if [ ! -d "$AVOCADO_EXT_SYSROOTS/$EXT_NAME" ]; then
     echo "Extension sysroot does not exist: $AVOCADO_EXT_SYSROOTS/$EXT_NAME."
     exit 1
 fi
+{reuse_check}
+if [ -z "${{REUSE_IMAGE:-}}" ]; then
+# Remove existing file if it exists
+rm -f "$OUTPUT_FILE"
 
 # Ensure reproducible timestamps
 export SOURCE_DATE_EPOCH={source_date_epoch}
 
 {mkfs_command}
-
+{record_fingerprint}
 echo "Created extension image: $OUTPUT_FILE"
-{kab_wrapping}"#,
-            self.extension,
-            ext_version,
+{kab_wrapping}
+fi
+"#,
+            crate::utils::shell::shell_word(&self.extension),
+            crate::utils::shell::shell_word(ext_version),
             source_date_epoch = source_date_epoch,
             mkfs_command = mkfs_command,
+            reuse_check = reuse_check,
+            record_fingerprint = record_fingerprint,
             kab_wrapping = kab_wrapping,
         )
     }
@@ -1148,6 +1157,37 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_create_build_script_squashfs_zst_includes_compression() {
+        let cmd = make_cmd("my-ext");
+        let script =
+            cmd.create_build_script("1.0.0", "sysext", 0, "squashfs-zst", &[], "raw", None);
+
+        assert!(
+            script.contains("mksquashfs"),
+            "squashfs-zst should invoke mksquashfs"
+        );
+        assert!(
+            script.contains("-reproducible \\\n  -comp zstd"),
+            "squashfs-zst should include -comp zstd compression flag"
+        );
+        assert!(
+            !script.contains("mkfs.erofs"),
+            "squashfs-zst should not invoke mkfs.erofs"
+        );
+    }
+
+    #[test]
+    fn test_create_build_script_squashfs_uses_default_compression() {
+        let cmd = make_cmd("my-ext");
+        let script = cmd.create_build_script("1.0.0", "sysext", 0, "squashfs", &[], "raw", None);
+
+        assert!(
+            !script.contains("-comp"),
+            "plain squashfs should keep the mksquashfs default compressor"
+        );
+    }
+
     #[test]
     fn test_create_build_script_defaults_to_squashfs() {
         let cmd = make_cmd("my-ext");
@@ -1197,15 +1237,24 @@ mod tests {
         let script = cmd.create_build_script("2.3.4", "sysext", 0, "squashfs", &[], "raw", None);
 
         assert!(
-            script.contains("EXT_NAME=\"test-extension\""),
+            script.contains("EXT_NAME=test-extension\n"),
             "script should contain the extension name"
         );
         assert!(
-            script.contains("EXT_VERSION=\"2.3.4\""),
+            script.contains("EXT_VERSION=2.3.4\n"),
             "script should contain the extension version"
         );
     }
 
+    #[test]
+    fn test_create_build_script_escapes_name_and_version() {
+        let cmd = make_cmd("my-\"ext");
+        let script = cmd.create_build_script("1.0`id`", "sysext", 0, "squashfs", &[], "raw", None);
+
+        assert!(script.contains(r#"EXT_NAME='my-"ext'"#));
+        assert!(script.contains("EXT_VERSION='1.0`id`'"));
+    }
+
     #[test]
     fn test_create_build_script_output_path() {
         let cmd = make_cmd("my-ext");
@@ -1217,6 +1266,59 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_create_build_script_reuses_unchanged_raw_image() {
+        let cmd = make_cmd("my-ext");
+        let script = cmd.create_build_script("1.0.0", "sysext", 0, "erofs-lz4", &[], "raw", None);
+
+        let check = script
+            .find(r#"= "$IMAGE_FINGERPRINT" ]; then"#)
+            .expect("script should compare the stored image fingerprint");
+        let remove = script
+            .find(r#"rm -f "$OUTPUT_FILE""#)
+            .expect("script should remove a stale image");
+        let mkfs = script
+            .find("mkfs.erofs")
+            .expect("script should build the image");
+        let record = script
+            .find(r#"echo "$IMAGE_FINGERPRINT" > "$OUTPUT_FILE.fingerprint""#)
+            .expect("script should record the fingerprint of the new image");
+        assert!(check < remove && remove < mkfs && mkfs < record);
+        // A reused image falls through rather than exiting, so anything
+        // appended after the build (the image stamp) still runs.
+        assert!(!script.contains("exit 0"));
+        assert!(script.trim_end().ends_with("fi"));
+    }
+
+    #[test]
+    fn test_create_build_script_fingerprint_covers_image_parameters() {
+        let cmd = make_cmd("my-ext");
+        let fingerprint_line = |script: &str| {
+            script
+                .lines()
+                .find(|l| l.starts_with("IMAGE_FINGERPRINT="))
+                .map(str::to_string)
+                .expect("script should compute an image fingerprint")
+        };
+        let lz4 = cmd.create_build_script("1.0.0", "sysext", 0, "erofs-lz4", &[], "raw", None);
+        let zst = cmd.create_build_script("1.0.0", "sysext", 0, "erofs-zst", &[], "raw", None);
+        let epoch = cmd.create_build_script("1.0.0", "sysext", 42, "erofs-lz4", &[], "raw", None);
+
+        assert_ne!(fingerprint_line(&lz4), fingerprint_line(&zst));
+        assert_ne!(fingerprint_line(&lz4), fingerprint_line(&epoch));
+    }
+
+    #[test]
+    fn test_create_build_script_kab_always_rebuilds() {
+        let cmd = make_cmd("my-ext");
+        let script = cmd.create_build_script("1.0.0", "sysext", 0, "erofs-lz4", &[], "kab", None);
+
+        assert!(
+            !script.contains("IMAGE_FINGERPRINT"),
+            "KAB builds remove the .raw, so there is no image to reuse"
+        );
+    }
+
     #[test]
     fn test_create_build_script_squashfs_var_files_excludes() {
         let cmd = make_cmd("my-ext");
@@ -3,6 +3,7 @@ use std::collections::{HashMap, HashSet};
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
 
+use super::ext_sysroot;
 use crate::utils::config::{ComposedConfig, Config, ExtensionLocation};
 use crate::utils::container::{RunConfig, SdkContainer, TuiContext};
 use crate::utils::kernel_resolver::{
@@ -12,6 +13,7 @@ use crate::utils::kernel_version::substitute_kernel_version;
 use crate::utils::lockfile::{build_package_spec_with_lock, LockFile, SysrootType};
 use crate::utils::output::{print_debug, print_error, print_info, print_success, OutputLevel};
 use crate::utils::runs_on::RunsOnContext;
+use crate::utils::shell::shell_word;
 use crate::utils::stamps::{
     compute_ext_install_input_hash, generate_write_stamp_script, Stamp, StampOutputs,
 };
@@ -273,22 +275,6 @@ impl ExtInstallCommand {
             anyhow::anyhow!("No container image specified in config under 'sdk.image'.")
         })?;
 
-        // Use resolved target (from CLI/env) if available, otherwise fall back to config
-        let _config_target = parsed
-            .get("runtimes")
-            .and_then(|runtime| runtime.as_mapping())
-            .and_then(|runtime_table| {
-                if runtime_table.len() == 1 {
-                    runtime_table.values().next()
-                } else {
-                    None
-                }
-            })
-            .and_then(|runtime_config| runtime_config.get("target"))
-            .and_then(|target| target.as_str())
-            .map(|s| s.to_string());
-        let target = resolve_target_required(self.target.as_deref(), config)?;
-
         // Use the container helper to run the setup commands
         let container_helper = SdkContainer::new().verbose(self.verbose);
 
@@ -377,8 +363,19 @@ impl ExtInstallCommand {
             );
         }
 
+        // Reject malformed `packages:` blocks before any container runs, so a
+        // typo in a later extension doesn't surface only after the earlier
+        // ones have been installed.
+        for (ext_name, _) in extensions_to_install {
+            let packages = parsed
+                .get("extensions")
+                .and_then(|ext| ext.get(ext_name))
+                .and_then(|ec| ec.get("packages"));
+            validate_packages_field(ext_name, packages)?;
+        }
+
         // Install each extension
-        for (index, (ext_name, ext_location)) in extensions_to_install.iter().enumerate() {
+        for (index, (ext_name, _)) in extensions_to_install.iter().enumerate() {
             if self.verbose {
                 print_debug(
                     &format!("Installing ({}/{}) {}.", index + 1, total, ext_name),
@@ -391,7 +388,6 @@ impl ExtInstallCommand {
                     config,
                     parsed,
                     ext_name,
-                    ext_location,
                     container_helper,
                     container_image,
                     target,
@@ -470,10 +466,8 @@ impl ExtInstallCommand {
     /// packages that remain in the config.
     fn detect_package_removals(
         &self,
-        parsed: &serde_yaml::Value,
+        raw_ext_config: Option<&serde_yaml::Value>,
         extension: &str,
-        ext_location: &ExtensionLocation,
-        _config: &Config,
         target: &str,
         lock_file: &mut LockFile,
     ) -> bool {
@@ -485,26 +479,16 @@ impl ExtInstallCommand {
         }
 
         // Gather current config package names for this extension
-        let ext_config = match ext_location {
-            ExtensionLocation::Remote { .. } | ExtensionLocation::Local { .. } => parsed
-                .get("extensions")
-                .and_then(|ext| ext.get(extension))
-                .cloned(),
-        };
-
-        let config_names: HashSet<String> = ext_config
-            .as_ref()
+        let config_names: HashSet<&str> = raw_ext_config
             .and_then(|ec| ec.get("packages"))
             .and_then(|deps| deps.as_mapping())
-            .map(|deps_map| {
-                deps_map
-                    .keys()
-                    .filter_map(|k| k.as_str().map(|s| s.to_string()))
-                    .collect()
-            })
+            .map(|deps_map| deps_map.keys().filter_map(|k| k.as_str()).collect())
             .unwrap_or_default();
 
-        let removed: Vec<String> = locked_names.difference(&config_names).cloned().collect();
+        let removed: Vec<String> = locked_names
+            .into_iter()
+            .filter(|name| !config_names.contains(name.as_str()))
+            .collect();
 
         if removed.is_empty() {
             return false;
@@ -531,7 +515,6 @@ impl ExtInstallCommand {
         config: &Config,
         parsed: &serde_yaml::Value,
         extension: &str,
-        ext_location: &ExtensionLocation,
         container_helper: &SdkContainer,
         container_image: &str,
         target: &str,
@@ -546,6 +529,12 @@ impl ExtInstallCommand {
     ) -> Result<bool> {
         let sysroot = self.extension_sysroot(extension);
 
+        // Extension configuration from the composed/merged config: for remote
+        // extensions this is the merged remote extension config, for local
+        // ones the main config's entry. Looked up once and borrowed by every
+        // step below.
+        let raw_ext_config = parsed.get("extensions").and_then(|ext| ext.get(extension));
+
         // Record runtime → extension membership upfront when a runtime is in
         // scope. Extensions without `packages:` (file-only / compile-only)
         // would otherwise leave no trace in the lockfile because the
@@ -564,49 +553,31 @@ impl ExtInstallCommand {
         // Detect package removals: compare current config packages with lock file.
         // If packages were removed, we must clean the sysroot and reinstall from scratch
         // because DNF install is additive-only and cannot remove packages.
-        let needs_clean_reinstall = self.detect_package_removals(
-            parsed,
-            extension,
-            ext_location,
-            config,
-            target,
-            lock_file,
-        );
-
-        if needs_clean_reinstall {
-            // Clean the sysroot so it will be recreated fresh below
-            let clean_command = format!(r#"rm -rf "$AVOCADO_EXT_SYSROOTS/{extension}""#);
-
-            let run_config = RunConfig {
-                container_image: container_image.to_string(),
-                target: target.to_string(),
-                command: clean_command,
-                verbose: self.verbose,
-                source_environment: false,
-                interactive: false,
-                repo_url: repo_url.cloned(),
-                repo_release: repo_release.cloned(),
-                container_args: merged_container_args.clone(),
-                dnf_args: self.dnf_args.clone(),
-                sdk_arch: self.sdk_arch.clone(),
-                tui_context: effective_tui_context.clone(),
-                env_vars: self.runtime_env_vars(),
-                ..Default::default()
-            };
-            // Best-effort clean -- if sysroot doesn't exist, this is a no-op
-            let _ = run_container_command(container_helper, run_config, runs_on_context).await;
-        }
-
-        // Check if the sysroot exists (it may have just been cleaned above, or never created)
-        let check_command = format!("[ -d $AVOCADO_EXT_SYSROOTS/{extension} ]");
+        let needs_clean_reinstall =
+            self.detect_package_removals(raw_ext_config, extension, target, lock_file);
+
+        // Create the sysroot, seeded with the rootfs rpm database, unless it
+        // already exists. A pending clean reinstall removes it first, so the
+        // clean, the existence probe and the setup share one container run.
+        let sysroot = ext_sysroot(extension);
+        let clean_step = if needs_clean_reinstall {
+            format!("rm -rf {sysroot}\n")
+        } else {
+            String::new()
+        };
         let setup_command = format!(
-            "mkdir -p $AVOCADO_EXT_SYSROOTS/{extension}/var/lib && cp -rf $AVOCADO_PREFIX/rootfs/var/lib/rpm $AVOCADO_EXT_SYSROOTS/{extension}/var/lib"
+            r#"{clean_step}if [ ! -d {sysroot} ]; then
+    mkdir -p {sysroot}/var/lib && \
+    {{ cp -rf --reflink=auto "$AVOCADO_PREFIX/rootfs/var/lib/rpm" {sysroot}/var/lib 2>/dev/null || cp -rf "$AVOCADO_PREFIX/rootfs/var/lib/rpm" {sysroot}/var/lib; }} && \
+    echo "Created sysroot for extension '"{name}"'."
+fi"#,
+            name = shell_word(extension),
         );
 
         let run_config = RunConfig {
             container_image: container_image.to_string(),
             target: target.to_string(),
-            command: check_command,
+            command: setup_command,
             verbose: self.verbose,
             source_environment: false,
             interactive: false,
@@ -614,64 +585,24 @@ impl ExtInstallCommand {
             repo_release: repo_release.cloned(),
             container_args: merged_container_args.clone(),
             dnf_args: self.dnf_args.clone(),
+            sdk_arch: self.sdk_arch.clone(),
             tui_context: effective_tui_context.clone(),
             env_vars: self.runtime_env_vars(),
             ..Default::default()
         };
-        let sysroot_exists =
-            run_container_command(container_helper, run_config, runs_on_context).await?;
-
-        if !sysroot_exists {
-            let run_config = RunConfig {
-                container_image: container_image.to_string(),
-                target: target.to_string(),
-                command: setup_command,
-                verbose: self.verbose,
-                source_environment: false,
-                interactive: false,
-                repo_url: repo_url.cloned(),
-                repo_release: repo_release.cloned(),
-                container_args: merged_container_args.clone(),
-                dnf_args: self.dnf_args.clone(),
-                tui_context: effective_tui_context.clone(),
-                env_vars: self.runtime_env_vars(),
-                ..Default::default()
-            };
-            let success =
-                run_container_command(container_helper, run_config, runs_on_context).await?;
-
-            if success {
-                print_success(
-                    &format!("Created sysroot for extension '{extension}'."),
-                    OutputLevel::Normal,
-                );
-            } else {
-                print_error(
-                    &format!("Failed to create sysroot for extension '{extension}'."),
-                    OutputLevel::Normal,
-                );
-                return Ok(false);
-            }
+        if !run_container_command(container_helper, run_config, runs_on_context).await? {
+            print_error(
+                &format!("Failed to create sysroot for extension '{extension}'."),
+                OutputLevel::Normal,
+            );
+            return Ok(false);
         }
 
-        // Get extension configuration from the composed/merged config
-        // For remote extensions, this comes from the merged remote extension config
-        // For local extensions, this comes from the main config's ext section
-        let raw_ext_config = match ext_location {
-            ExtensionLocation::Remote { .. } | ExtensionLocation::Local { .. } => {
-                // Use the already-merged config from `parsed` which contains remote extension configs
-                parsed
-                    .get("extensions")
-                    .and_then(|ext| ext.get(extension))
-                    .cloned()
-            }
-        };
-
         // Resolve the kernel version up-front when the extension declares
         // overrides that depend on it OR has packages that could include
         // kernel-family names. Skip the container roundtrip for trivial
         // extensions (no packages, no overrides).
-        let has_overrides_or_packages = raw_ext_config.as_ref().is_some_and(|ec| {
+        let has_overrides_or_packages = raw_ext_config.is_some_and(|ec| {
             ec.get("packages").is_some()
                 || ec.as_mapping().is_some_and(|m| {
                     m.keys().any(|k| {
@@ -721,7 +652,7 @@ impl ExtInstallCommand {
         // Strips override sub-keys and merges matching ones into the parent
         // so consumers below see a flat `packages: { ... }` map with
         // kernel-conditional entries already folded in.
-        let ext_config = raw_ext_config.as_ref().map(|ec| {
+        let ext_config = raw_ext_config.map(|ec| {
             config.resolve_overrides_in_value(
                 ec.clone(),
                 target,
@@ -735,10 +666,17 @@ impl ExtInstallCommand {
 
         if let Some(serde_yaml::Value::Mapping(deps_map)) = dependencies {
             // Build list of packages to install and handle extension dependencies
-            let mut packages = Vec::new();
-            let mut package_names = Vec::new();
+            let mut packages = Vec::with_capacity(deps_map.len());
+            let mut package_names = Vec::with_capacity(deps_map.len());
             let mut extension_dependencies = Vec::new();
 
+            // Only repo packages need the kernel-version substitution; compile
+            // and extension dependencies are skipped before it is computed.
+            let resolve_name = |package_name: &str| match resolved_kver.as_deref() {
+                Some(kver) => substitute_kernel_version(package_name, kver),
+                None => package_name.to_string(),
+            };
+
             for (package_name_val, version_spec) in deps_map {
                 // Convert package name from Value to String
                 let package_name = match package_name_val.as_str() {
@@ -746,11 +684,6 @@ impl ExtInstallCommand {
                     None => continue, // Skip if package name is not a string
                 };
 
-                let resolved_name = match resolved_kver.as_deref() {
-                    Some(kver) => substitute_kernel_version(package_name, kver),
-                    None => package_name.to_string(),
-                };
-
                 // Handle different dependency types based on value format
                 match version_spec {
                     // Simple string version: "package: version" or "package: '*'"
@@ -760,7 +693,7 @@ impl ExtInstallCommand {
                             lock_file,
                             target,
                             &sysroot,
-                            &resolved_name,
+                            &resolve_name(package_name),
                             version,
                         );
                         packages.push(package_spec);
@@ -826,7 +759,7 @@ impl ExtInstallCommand {
                                 lock_file,
                                 target,
                                 &sysroot,
-                                &resolved_name,
+                                &resolve_name(package_name),
                                 version,
                             );
                             packages.push(package_spec);
@@ -869,7 +802,7 @@ impl ExtInstallCommand {
             if !packages.is_empty() {
                 // Build DNF install command
                 let yes = if self.force { "-y" } else { "" };
-                let installroot = format!("$AVOCADO_EXT_SYSROOTS/{extension}");
+                let installroot = ext_sysroot(extension);
                 let dnf_args_str = if let Some(args) = &self.dnf_args {
                     format!(" {} ", args.join(" "))
                 } else {
@@ -880,6 +813,9 @@ impl ExtInstallCommand {
                 } else {
                     format!(" {} ", off_kernel_excludes.join(" "))
                 };
+                // Repo metadata is cached next to the target repo config and
+                // shared by every extension (and `ext dnf`), instead of being
+                // downloaded again into each sysroot's own var/cache.
                 let command = format!(
                     r#"
 RPM_NO_CHROOT_FOR_SCRIPTS=1 \
@@ -889,6 +825,7 @@ RPM_CONFIGDIR=$AVOCADO_SDK_PREFIX/ext-rpm-config-scripts \
 RPM_ETCCONFIGDIR=$DNF_SDK_TARGET_PREFIX \
 $DNF_SDK_HOST \
     $DNF_SDK_TARGET_REPO_CONF \
+    --setopt=cachedir=$DNF_SDK_TARGET_PREFIX/var/cache \
     --setopt=sslcacert=${{SSL_CERT_FILE}} \
     --installroot={} \
     --disablerepo=${{AVOCADO_TARGET}}-target-ext \
@@ -979,24 +916,10 @@ $DNF_SDK_HOST \
                     OutputLevel::Normal,
                 );
             }
-        } else if let Some(deps_value) = dependencies {
-            // packages field exists but is not a YAML mapping — detect common syntax mistakes
-            if !deps_value.is_null() {
-                let value_str =
-                    serde_yaml::to_string(deps_value).unwrap_or_else(|_| format!("{deps_value:?}"));
-                let hint = if value_str.contains('=') {
-                    "\n\nIt looks like '=' was used instead of ':'. YAML uses ':' for key-value pairs.\n\
-                     Example:\n  packages:\n    curl: \"*\"\n    iperf3: \"*\""
-                } else {
-                    "\n\nExpected a YAML mapping (key: value pairs).\n\
-                     Example:\n  packages:\n    curl: \"*\"\n    iperf3: \"*\""
-                };
-                return Err(anyhow::anyhow!(
-                    "Invalid 'packages' format in extension '{extension}': \
-                     expected a mapping but got: {}{hint}",
-                    value_str.trim()
-                ));
-            }
+        } else if dependencies.is_some() {
+            // Overrides can introduce a `packages:` value the up-front check
+            // in execute_install_internal never saw.
+            validate_packages_field(extension, dependencies)?;
         } else if self.verbose {
             print_debug(
                 &format!("No dependencies defined for extension '{extension}'."),
@@ -1008,6 +931,31 @@ $DNF_SDK_HOST \
     }
 }
 
+/// Reject a `packages:` value that is present but not a YAML mapping,
+/// pointing out the common `name=version` mistake.
+fn validate_packages_field(extension: &str, packages: Option<&serde_yaml::Value>) -> Result<()> {
+    let Some(deps_value) = packages else {
+        return Ok(());
+    };
+    if deps_value.is_null() || deps_value.is_mapping() {
+        return Ok(());
+    }
+
+    let value_str = serde_yaml::to_string(deps_value).unwrap_or_else(|_| format!("{deps_value:?}"));
+    let hint = if value_str.contains('=') {
+        "\n\nIt looks like '=' was used instead of ':'. YAML uses ':' for key-value pairs.\n\
+         Example:\n  packages:\n    curl: \"*\"\n    iperf3: \"*\""
+    } else {
+        "\n\nExpected a YAML mapping (key: value pairs).\n\
+         Example:\n  packages:\n    curl: \"*\"\n    iperf3: \"*\""
+    };
+    Err(anyhow::anyhow!(
+        "Invalid 'packages' format in extension '{extension}': \
+         expected a mapping but got: {}{hint}",
+        value_str.trim()
+    ))
+}
+
 /// Helper function to run a container command, using shared context if available
 async fn run_container_command(
     container_helper: &SdkContainer,
@@ -1022,3 +970,44 @@ async fn run_container_command(
         container_helper.run_in_container(config).await
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn packages_of(yaml: &str) -> serde_yaml::Value {
+        let ext: serde_yaml::Value = serde_yaml::from_str(yaml).unwrap();
+        ext.get("packages").cloned().unwrap()
+    }
+
+    #[test]
+    fn test_validate_packages_field_accepts_mapping_null_and_missing() {
+        let mapping = packages_of("packages:\n  curl: '*'\n");
+        let null = packages_of("packages:\n");
+
+        assert!(validate_packages_field("my-ext", Some(&mapping)).is_ok());
+        assert!(validate_packages_field("my-ext", Some(&null)).is_ok());
+        assert!(validate_packages_field("my-ext", None).is_ok());
+    }
+
+    #[test]
+    fn test_validate_packages_field_hints_at_equals_typo() {
+        let list = packages_of("packages:\n  - curl=*\n");
+
+        let err = validate_packages_field("my-ext", Some(&list))
+            .unwrap_err()
+            .to_string();
+        assert!(err.contains("Invalid 'packages' format in extension 'my-ext'"));
+        assert!(err.contains("'=' was used instead of ':'"));
+    }
+
+    #[test]
+    fn test_validate_packages_field_rejects_scalar() {
+        let scalar = packages_of("packages: curl\n");
+
+        let err = validate_packages_field("my-ext", Some(&scalar))
+            .unwrap_err()
+            .to_string();
+        assert!(err.contains("Expected a YAML mapping"));
+    }
+}
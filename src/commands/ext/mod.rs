@@ -60,6 +60,15 @@ pub(crate) fn find_ext_in_mapping<'a>(
     None
 }
 
+/// Container path of an extension's sysroot as a single shell word, with
+/// the extension name quoted so it is taken literally.
+pub(crate) fn ext_sysroot(extension_name: &str) -> String {
+    format!(
+        "\"$AVOCADO_EXT_SYSROOTS\"/{}",
+        crate::utils::shell::shell_word(extension_name)
+    )
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -2,6 +2,7 @@ use anyhow::{Context, Result};
 use std::collections::HashMap;
 use std::fs;
 use std::include_str;
+use std::io::Write;
 #[cfg(unix)]
 use std::os::unix::fs::PermissionsExt;
 use std::path::{Path, PathBuf};
@@ -283,6 +284,8 @@ impl InitCommand {
     /// Downloads a file from GitHub and saves it to the specified path.
     ///
     /// # Arguments
+    /// * `client` - HTTP client shared with the directory listing, so every
+    ///   file in a directory reuses the same pooled connection
     /// * `download_url` - The URL to download the file from
     /// * `dest_path` - The destination path to save the file
     /// * `is_executable` - Whether the file should have execute permissions
@@ -291,14 +294,11 @@ impl InitCommand {
     /// * `Ok(())` if successful
     /// * `Err` if there was an error downloading or saving the file
     async fn download_file(
+        client: &reqwest::Client,
         download_url: &str,
         dest_path: &Path,
         is_executable: bool,
     ) -> Result<()> {
-        let client = reqwest::Client::builder()
-            .user_agent("avocado-cli")
-            .build()?;
-
         let response = client
             .get(download_url)
             .send()
@@ -525,10 +525,11 @@ impl InitCommand {
                 .await
                 .with_context(|| "Failed to parse GitHub API response")?;
 
+            let reference_prefix = format!("{reference_name}/");
             for item in contents {
                 let relative_path = item
                     .path
-                    .strip_prefix(&format!("{reference_name}/"))
+                    .strip_prefix(&reference_prefix)
                     .unwrap_or(&item.path);
 
                 let local_path = local_base_path.join(relative_path);
@@ -580,8 +581,13 @@ impl InitCommand {
                                     .get(relative_path)
                                     .map(|mode| mode == "100755")
                                     .unwrap_or(false);
-                                Self::download_file(download_url, &local_path, is_executable)
-                                    .await?;
+                                Self::download_file(
+                                    &client,
+                                    download_url,
+                                    &local_path,
+                                    is_executable,
+                                )
+                                .await?;
                             }
                         }
                         "dir" => {
@@ -799,8 +805,13 @@ impl InitCommand {
                                     .or_else(|| file_modes.get(item_name))
                                     .map(|mode| mode == "100755")
                                     .unwrap_or(false);
-                                Self::download_file(download_url, &item_local_path, is_executable)
-                                    .await?;
+                                Self::download_file(
+                                    &client,
+                                    download_url,
+                                    &item_local_path,
+                                    is_executable,
+                                )
+                                .await?;
                             }
                         }
                         "dir" => {
@@ -951,11 +962,10 @@ impl InitCommand {
 
         // Create the destination dir if it doesn't exist. With --name
         // this is the new subdir; without --name it's the bare directory
-        // (matching the historical behavior).
-        if !destination.exists() {
-            fs::create_dir_all(&destination)
-                .with_context(|| format!("Failed to create directory '{destination_str}'"))?;
-        }
+        // (matching the historical behavior). create_dir_all is a no-op for
+        // an existing directory, so no separate existence probe is needed.
+        fs::create_dir_all(&destination)
+            .with_context(|| format!("Failed to create directory '{destination_str}'"))?;
 
         // If reference is specified, download the reference project
         if let Some(ref_name) = &self.reference {
@@ -1055,24 +1065,41 @@ impl InitCommand {
             // Create the avocado.yaml file path
             let toml_path = destination.join("avocado.yaml");
 
-            // Check if configuration file already exists
-            if toml_path.exists() {
-                anyhow::bail!(
-                    "Configuration file '{}' already exists.",
-                    toml_path.display()
-                );
-            }
-
             // Load the configuration template for the target
             let config_content = Self::load_config_template(target);
 
-            // Write the configuration file
-            fs::write(&toml_path, config_content).with_context(|| {
-                format!(
-                    "Failed to write configuration file '{}'",
-                    toml_path.display()
-                )
-            })?;
+            // Write the configuration file. The template goes to a synced temp
+            // file in the destination directory first, then is linked into
+            // place without replacing an existing file, so a crash never
+            // leaves a half-written avocado.yaml and an existing config is
+            // never clobbered.
+            let write_result = tempfile::NamedTempFile::new_in(&destination).and_then(|mut tmp| {
+                tmp.write_all(config_content.as_bytes())?;
+                // NamedTempFile is created 0600; the config is a regular 0644 file
+                #[cfg(unix)]
+                tmp.as_file()
+                    .set_permissions(fs::Permissions::from_mode(0o644))?;
+                tmp.as_file().sync_all()?;
+                tmp.persist_noclobber(&toml_path).map_err(|e| e.error)?;
+                Ok(())
+            });
+            match write_result {
+                Ok(()) => {}
+                Err(e) if e.kind() == std::io::ErrorKind::AlreadyExists => {
+                    anyhow::bail!(
+                        "Configuration file '{}' already exists.",
+                        toml_path.display()
+                    );
+                }
+                Err(e) => {
+                    return Err(e).with_context(|| {
+                        format!(
+                            "Failed to write configuration file '{}'",
+                            toml_path.display()
+                        )
+                    });
+                }
+            }
 
             let canonical_toml = toml_path
                 .canonicalize()
@@ -5,6 +5,10 @@ use crate::utils::config::get_post_install;
 use crate::utils::{
     config::{ComposedConfig, Config, ImageConfig},
     container::{RunConfig, SdkContainer, TuiContext},
+    ext_version::{
+        generate_rpm_version_query_script, installed_extension_version, local_extension_version,
+        parse_rpm_version_output,
+    },
     output::{print_error, print_info, print_success, OutputLevel},
     permissions::{mapping_from_hashmap, render_users_groups_script},
     runs_on::RunsOnContext,
@@ -225,6 +229,12 @@ impl RuntimeBuildCommand {
         container_helper: &SdkContainer,
         runs_on_context: Option<&RunsOnContext>,
     ) -> Result<()> {
+        // Merged runtime config (target-specific packages and overrides
+        // applied). Resolved once and shared by the stamp check, extension
+        // version resolution and the build script below.
+        let merged_runtime =
+            config.get_merged_runtime_config(&self.runtime_name, target_arch, &self.config_path)?;
+
         // Validate stamps before proceeding (unless --no-stamps)
         if !self.no_stamps {
             // Get detailed extension dependencies for this runtime
@@ -267,11 +277,7 @@ impl RuntimeBuildCommand {
             // Compute current inputs for staleness detection so that changes to
             // extension packages (e.g. from path-based sources) are detected.
             // Only compare against Runtime stamps — SDK/compile-deps stamps use their own hash.
-            // Use get_merged_runtime_config to match how the install stamp was created.
-            let merged_runtime = config
-                .get_merged_runtime_config(&self.runtime_name, target_arch, &self.config_path)
-                .ok()
-                .flatten();
+            // The merged runtime config matches how the install stamp was created.
             let project_root = config.project_root(&self.config_path);
             let install_inputs = merged_runtime
                 .as_ref()
@@ -302,8 +308,6 @@ impl RuntimeBuildCommand {
         );
 
         // Check for kernel configuration in the merged runtime config
-        let merged_runtime =
-            config.get_merged_runtime_config(&self.runtime_name, target_arch, &self.config_path)?;
         let kernel_config = merged_runtime.as_ref().and_then(|v| {
             Config::get_kernel_config_from_runtime(v, config.kernel.as_ref())
                 .ok()
@@ -492,18 +496,50 @@ impl RuntimeBuildCommand {
         let resolved_extensions = self
             .collect_runtime_extensions(
                 parsed,
-                config,
+                merged_runtime.as_ref(),
                 &self.runtime_name,
                 target_arch,
-                &self.config_path,
                 container_image,
                 merged_container_args.clone(),
             )
             .await?;
 
         // Build var image
-        let build_script =
-            self.create_build_script(config, parsed, target_arch, &resolved_extensions)?;
+        let mut build_script = self.create_build_script(
+            config,
+            parsed,
+            target_arch,
+            &resolved_extensions,
+            merged_runtime.as_ref(),
+        )?;
+
+        // The build stamp is written by the last container run of the build —
+        // the post_build hook when one is configured, otherwise the build
+        // script itself — instead of a container run of its own. Its inputs
+        // come from config alone, so it can be rendered up front.
+        let post_build = merged_runtime
+            .as_ref()
+            .and_then(|rt| rt.get("post_build"))
+            .and_then(|v| v.as_str())
+            .map(|s| s.to_string());
+        let stamp_script = if self.no_stamps {
+            None
+        } else {
+            let inputs = compute_runtime_build_input_hash(
+                &merged_runtime.clone().unwrap_or_default(),
+                &self.runtime_name,
+                parsed,
+                &config.project_root(&self.config_path),
+            )?;
+            let outputs = StampOutputs::default();
+            let stamp = Stamp::runtime_build(&self.runtime_name, target_arch, inputs, outputs);
+            Some(generate_write_stamp_script(&stamp)?)
+        };
+        if post_build.is_none() {
+            if let Some(ref stamp_script) = stamp_script {
+                append_stamp_on_success(&mut build_script, stamp_script);
+            }
+        }
 
         if self.verbose {
             print_info(
@@ -719,12 +755,7 @@ impl RuntimeBuildCommand {
         // relative to /opt/src (the main avocado.yaml's src dir) — runtimes
         // are only defined in the local config, so there's no remote source
         // path to consider here.
-        if let Some(post_build) = merged_runtime
-            .as_ref()
-            .and_then(|rt| rt.get("post_build"))
-            .and_then(|v| v.as_str())
-            .map(|s| s.to_string())
-        {
+        if let Some(post_build) = post_build {
             self.run_post_build(
                 &post_build,
                 container_image,
@@ -734,58 +765,16 @@ impl RuntimeBuildCommand {
                 merged_container_args,
                 container_helper,
                 runs_on_context,
+                stamp_script.as_deref(),
             )
             .await?;
         }
 
-        // Write runtime build stamp (unless --no-stamps)
-        if !self.no_stamps {
-            let merged_runtime = config
-                .get_merged_runtime_config(&self.runtime_name, target_arch, &self.config_path)?
-                .unwrap_or_default();
-            let inputs = compute_runtime_build_input_hash(
-                &merged_runtime,
-                &self.runtime_name,
-                parsed,
-                &config.project_root(&self.config_path),
-            )?;
-            let outputs = StampOutputs::default();
-            let stamp = Stamp::runtime_build(&self.runtime_name, target_arch, inputs, outputs);
-            let stamp_script = generate_write_stamp_script(&stamp)?;
-
-            let run_config = RunConfig {
-                container_image: container_image.to_string(),
-                target: target_arch.to_string(),
-                command: stamp_script,
-                verbose: self.verbose,
-                source_environment: true,
-                interactive: false,
-                repo_url: repo_url.cloned(),
-                repo_release: repo_release.cloned(),
-                container_args: merged_container_args.clone(),
-                dnf_args: self.dnf_args.clone(),
-                // runs_on handled by shared context
-                sdk_arch: self.sdk_arch.clone(),
-                tui_context: self.tui_context.clone(),
-                env_vars: self.runtime_env_vars(),
-                ..Default::default()
-            };
-
-            let stamp_ok =
-                run_container_command(container_helper, run_config, runs_on_context).await?;
-            if !stamp_ok {
-                return Err(anyhow::anyhow!(
-                    "Failed to write build stamp for runtime '{}'",
-                    self.runtime_name
-                ));
-            }
-
-            if self.verbose {
-                print_info(
-                    &format!("Wrote build stamp for runtime '{}'.", self.runtime_name),
-                    OutputLevel::Normal,
-                );
-            }
+        if stamp_script.is_some() && self.verbose {
+            print_info(
+                &format!("Wrote build stamp for runtime '{}'.", self.runtime_name),
+                OutputLevel::Normal,
+            );
         }
 
         // Generate TUF delegation staging and write into the build volume.
@@ -1045,9 +1034,10 @@ echo -n '}}'
         )?;
 
         // Phase 3: Write signed files into the build volume via a container run.
-        // We write them to a temp dir under the project directory (accessible inside
-        // the container as /opt/src/.tuf-staging-tmp/), then copy into the volume.
-        let tmp_dir = project_dir.join(".tuf-staging-tmp");
+        // We write them to a per-runtime temp dir under the project directory
+        // (accessible inside the container as /opt/src/.tuf-staging-tmp/<runtime>/),
+        // then copy into the volume.
+        let tmp_dir = project_dir.join(tuf_staging_rel_dir(&self.runtime_name));
         let tmp_delegations = tmp_dir.join("delegations");
         std::fs::create_dir_all(&tmp_delegations)
             .context("Failed to create TUF staging temp directory")?;
@@ -1060,17 +1050,8 @@ echo -n '}}'
         )
         .context("Failed to write delegated targets to temp dir")?;
 
-        let runtime_name = &self.runtime_name;
-        let runtime_uuid = &collection.runtime_uuid;
-        let copy_script = format!(
-            r#"set -euo pipefail
-DEST="$AVOCADO_PREFIX/runtimes/{runtime_name}/var-staging/lib/avocado/tuf-staging"
-mkdir -p "$DEST/delegations"
-cp /opt/src/.tuf-staging-tmp/targets.json "$DEST/targets.json"
-cp /opt/src/.tuf-staging-tmp/delegations/runtime-{runtime_uuid}.json \
-   "$DEST/delegations/runtime-{runtime_uuid}.json"
-"#
-        );
+        let copy_script =
+            generate_tuf_staging_copy_script(&self.runtime_name, &collection.runtime_uuid);
 
         let copy_run_config = RunConfig {
             container_image: container_image.to_string(),
@@ -1090,7 +1071,7 @@ cp /opt/src/.tuf-staging-tmp/delegations/runtime-{runtime_uuid}.json \
         run_container_command(container_helper, copy_run_config, runs_on_context).await?;
 
         // Clean up host temp files.
-        let _ = std::fs::remove_dir_all(&tmp_dir);
+        remove_tuf_staging_dir(&tmp_dir);
 
         print_info(
             &format!(
@@ -1164,7 +1145,7 @@ cp /opt/src/.tuf-staging-tmp/delegations/runtime-{runtime_uuid}.json \
         )?;
 
         // Phase 3: Write files into the build volume.
-        let tmp_dir = project_dir.join(".tuf-staging-tmp");
+        let tmp_dir = project_dir.join(tuf_staging_rel_dir(&self.runtime_name));
         let tmp_delegations = tmp_dir.join("delegations");
         std::fs::create_dir_all(&tmp_delegations)
             .context("Failed to create TUF staging temp directory")?;
@@ -1177,17 +1158,8 @@ cp /opt/src/.tuf-staging-tmp/delegations/runtime-{runtime_uuid}.json \
         )
         .context("Failed to write delegated targets to temp dir")?;
 
-        let runtime_name = &self.runtime_name;
-        let runtime_uuid = &collection.runtime_uuid;
-        let copy_script = format!(
-            r#"set -euo pipefail
-DEST="$AVOCADO_PREFIX/runtimes/{runtime_name}/var-staging/lib/avocado/tuf-staging"
-mkdir -p "$DEST/delegations"
-cp /opt/src/.tuf-staging-tmp/targets.json "$DEST/targets.json"
-cp /opt/src/.tuf-staging-tmp/delegations/runtime-{runtime_uuid}.json \
-   "$DEST/delegations/runtime-{runtime_uuid}.json"
-"#
-        );
+        let copy_script =
+            generate_tuf_staging_copy_script(&self.runtime_name, &collection.runtime_uuid);
 
         let copy_run_config = RunConfig {
             container_image: container_image.to_string(),
@@ -1206,7 +1178,7 @@ cp /opt/src/.tuf-staging-tmp/delegations/runtime-{runtime_uuid}.json \
         };
         run_container_command(container_helper, copy_run_config, runs_on_context).await?;
 
-        let _ = std::fs::remove_dir_all(&tmp_dir);
+        remove_tuf_staging_dir(&tmp_dir);
 
         print_info(
             &format!(
@@ -1219,22 +1191,34 @@ cp /opt/src/.tuf-staging-tmp/delegations/runtime-{runtime_uuid}.json \
         Ok(())
     }
 
+    /// Render the runtime image build script.
+    ///
+    /// `merged_runtime` is the caller's already-resolved merged runtime
+    /// config; when `None` it is looked up here.
     fn create_build_script(
         &self,
         config: &Config,
         parsed: &serde_yaml::Value,
         target_arch: &str,
         resolved_extensions: &[String],
+        merged_runtime: Option<&serde_yaml::Value>,
     ) -> Result<String> {
         // Get merged runtime configuration including target-specific dependencies
-        let merged_runtime = config
-            .get_merged_runtime_config(&self.runtime_name, target_arch, &self.config_path)?
-            .with_context(|| {
-                format!(
-                    "Runtime '{}' not found or has no configuration for target '{}'",
-                    self.runtime_name, target_arch
-                )
-            })?;
+        let looked_up;
+        let merged_runtime = match merged_runtime {
+            Some(merged) => merged,
+            None => {
+                looked_up = config
+                    .get_merged_runtime_config(&self.runtime_name, target_arch, &self.config_path)?
+                    .with_context(|| {
+                        format!(
+                            "Runtime '{}' not found or has no configuration for target '{}'",
+                            self.runtime_name, target_arch
+                        )
+                    })?;
+                &looked_up
+            }
+        };
 
         // Extract extension names from the `extensions` array
         let mut required_extensions = HashSet::new();
@@ -1272,99 +1256,82 @@ cp /opt/src/.tuf-staging-tmp/delegations/runtime-{runtime_uuid}.json \
 
         // Build a map from extension name to versioned name from resolved_extensions
         // Format of resolved_extensions items: "ext_name-version" (e.g., "my-ext-1.0.0")
-        let mut ext_version_map: HashMap<String, String> = HashMap::new();
-        for versioned_name in resolved_extensions {
-            // Parse "ext_name-version" - find the last occurrence of -X.Y.Z pattern
-            if let Some(idx) = versioned_name.rfind('-') {
-                let (name, version_with_dash) = versioned_name.split_at(idx);
-                let version = &version_with_dash[1..]; // Skip the leading '-'
-                                                       // Verify it looks like a version (starts with a digit)
-                if version
-                    .chars()
-                    .next()
-                    .map(|c| c.is_ascii_digit())
-                    .unwrap_or(false)
-                {
-                    ext_version_map.insert(name.to_string(), versioned_name.clone());
-                }
-            }
-        }
+        let ext_version_map: HashMap<&str, &String> = resolved_extensions
+            .iter()
+            .filter_map(|versioned_name| {
+                split_versioned_name(versioned_name).map(|(name, _)| (name, versioned_name))
+            })
+            .collect();
 
-        // Build copy commands for required extensions
-        let mut copy_commands = Vec::new();
-        let mut processed_extensions = HashSet::new();
-
-        // Process local extensions defined in [ext.*] sections
-        if let Some(ext_config) = parsed.get("extensions").and_then(|v| v.as_mapping()) {
-            for (ext_name_val, ext_data) in ext_config {
-                if let Some(ext_name) = ext_name_val.as_str() {
-                    if all_required_extensions.contains(ext_name) {
-                        let ext_version = ext_data
-                            .get("version")
-                            .map(|v| {
-                                v.as_str().map(|s| s.to_string()).unwrap_or_else(|| {
-                                    format!(
-                                        "{}",
-                                        v.as_i64()
-                                            .or_else(|| v.as_f64().map(|f| f as i64))
-                                            .unwrap_or(0)
-                                    )
-                                })
-                            })
-                            .ok_or_else(|| {
-                                anyhow::anyhow!(
-                                    "Extension '{ext_name}' is missing a 'version' field. \
-                                 Check that the extension config was parsed and merged correctly."
-                                )
-                            })?;
-
-                        let ext_suffix = crate::utils::config::get_ext_image_type(ext_data)
-                            .map(|t| {
-                                if t == "kab" {
-                                    "kab".to_string()
-                                } else {
-                                    "raw".to_string()
-                                }
-                            })
-                            .unwrap_or_else(|| "raw".to_string());
-                        copy_commands.push(format!(
-                            r#"
+        // Build copy commands for required extensions; one block per extension,
+        // joined once below. Walk the required set and look each name up in the
+        // local `extensions` section rather than scanning every extension the
+        // project defines. Sorted so the generated script is stable.
+        let local_extensions = parsed.get("extensions").and_then(|v| v.as_mapping());
+        let mut required_sorted: Vec<&String> = all_required_extensions.iter().collect();
+        required_sorted.sort();
+        let mut copy_commands = Vec::with_capacity(required_sorted.len());
+
+        for ext_name in required_sorted {
+            if let Some(ext_data) = local_extensions.and_then(|m| m.get(ext_name.as_str())) {
+                // Local extension defined in the extensions section
+                let ext_version = ext_data
+                    .get("version")
+                    .map(|v| {
+                        v.as_str().map(|s| s.to_string()).unwrap_or_else(|| {
+                            format!(
+                                "{}",
+                                v.as_i64()
+                                    .or_else(|| v.as_f64().map(|f| f as i64))
+                                    .unwrap_or(0)
+                            )
+                        })
+                    })
+                    .ok_or_else(|| {
+                        anyhow::anyhow!(
+                            "Extension '{ext_name}' is missing a 'version' field. \
+                         Check that the extension config was parsed and merged correctly."
+                        )
+                    })?;
+
+                let ext_suffix = crate::utils::config::get_ext_image_type(ext_data)
+                    .map(|t| {
+                        if t == "kab" {
+                            "kab".to_string()
+                        } else {
+                            "raw".to_string()
+                        }
+                    })
+                    .unwrap_or_else(|| "raw".to_string());
+                copy_commands.push(format!(
+                    r#"
 if [ -f "$AVOCADO_PREFIX/output/extensions/{ext_name}-{ext_version}.{ext_suffix}" ]; then
-    cp -f "$AVOCADO_PREFIX/output/extensions/{ext_name}-{ext_version}.{ext_suffix}" "$RUNTIME_EXT_DIR/{ext_name}-{ext_version}.{ext_suffix}"
+    stage_ext_image "$AVOCADO_PREFIX/output/extensions/{ext_name}-{ext_version}.{ext_suffix}" "$RUNTIME_EXT_DIR/{ext_name}-{ext_version}.{ext_suffix}"
     echo "  Copied: {ext_name}-{ext_version}.{ext_suffix}"
 fi"#
-                        ));
-                        processed_extensions.insert(ext_name.to_string());
-                    }
-                }
-            }
-        }
-
-        // Process external/versioned extensions (those required but not defined locally)
-        for ext_name in &all_required_extensions {
-            if !processed_extensions.contains(ext_name) {
-                if let Some(versioned_name) = ext_version_map.get(ext_name) {
-                    copy_commands.push(format!(
-                        r#"
+                ));
+            } else if let Some(versioned_name) = ext_version_map.get(ext_name.as_str()) {
+                // External/versioned extension (required but not defined locally)
+                copy_commands.push(format!(
+                    r#"
 if [ -f "$AVOCADO_PREFIX/output/extensions/{versioned_name}.raw" ]; then
-    cp -f "$AVOCADO_PREFIX/output/extensions/{versioned_name}.raw" "$RUNTIME_EXT_DIR/{versioned_name}.raw"
+    stage_ext_image "$AVOCADO_PREFIX/output/extensions/{versioned_name}.raw" "$RUNTIME_EXT_DIR/{versioned_name}.raw"
     echo "  Copied: {versioned_name}.raw"
 else
     echo "ERROR: Extension image not found: $AVOCADO_PREFIX/output/extensions/{versioned_name}.raw"
     exit 1
 fi"#
-                    ));
-                } else {
-                    copy_commands.push(format!(
-                        r#"
+                ));
+            } else {
+                copy_commands.push(format!(
+                    r#"
 EXT_FILE=$(ls "$AVOCADO_PREFIX/output/extensions/{ext_name}"-*.raw 2>/dev/null | head -n 1)
 if [ -n "$EXT_FILE" ]; then
     EXT_BASENAME=$(basename "$EXT_FILE")
-    cp -f "$EXT_FILE" "$RUNTIME_EXT_DIR/$EXT_BASENAME"
+    stage_ext_image "$EXT_FILE" "$RUNTIME_EXT_DIR/$EXT_BASENAME"
     echo "  Copied: $EXT_BASENAME"
 fi"#
-                    ));
-                }
+                ));
             }
         }
 
@@ -1388,25 +1355,12 @@ fi"#
         let ext_info_pairs: Vec<String> = resolved_extensions
             .iter()
             .map(|versioned_name| {
-                let (name, version) = if let Some(idx) = versioned_name.rfind('-') {
-                    let (n, v_with_dash) = versioned_name.split_at(idx);
-                    let v = &v_with_dash[1..];
-                    if v.chars()
-                        .next()
-                        .map(|c| c.is_ascii_digit())
-                        .unwrap_or(false)
-                    {
-                        (n.to_string(), v.to_string())
-                    } else {
-                        (versioned_name.clone(), "0.0.0".to_string())
-                    }
-                } else {
-                    (versioned_name.clone(), "0.0.0".to_string())
-                };
+                let (name, version) =
+                    split_versioned_name(versioned_name).unwrap_or((versioned_name, "0.0.0"));
                 // Look up image type from parsed config (image.type field)
                 let image_type = parsed
                     .get("extensions")
-                    .and_then(|e| e.get(&name))
+                    .and_then(|e| e.get(name))
                     .and_then(crate::utils::config::get_ext_image_type)
                     .unwrap_or_else(|| "raw".to_string());
                 format!("{name}:{version}:{image_type}")
@@ -2354,7 +2308,13 @@ mkdir -p "$RUNTIME_EXT_DIR"
 echo "Cleaning up stale extensions..."
 rm -f "$RUNTIME_EXT_DIR"/*.raw "$RUNTIME_EXT_DIR"/*.kab 2>/dev/null || true
 
-# Copy required extension images from global output/extensions to runtime-specific location
+# Copy required extension images from global output/extensions to runtime-specific location.
+# The staged images are only read (hashed, then copied into the var image),
+# and `ext image` always writes a fresh file rather than rewriting in place,
+# so a hardlink stands in for a full copy when both sit on the same volume.
+stage_ext_image() {{
+    ln -f "$1" "$2" 2>/dev/null || cp -f "$1" "$2"
+}}
 echo "Copying required extension images to runtime-specific directory..."
 {copy_section}
 
@@ -2581,10 +2541,16 @@ sign_amf "$AVOCADO_MANIFEST_PATH"
         let mut all_extensions = HashSet::new();
         let mut visited = HashSet::new();
 
+        // Parse the main config once; the recursion below only reads from it
+        let parsed = crate::utils::config::Config::read_config_value(std::path::Path::new(
+            &self.config_path,
+        ))?;
+
         // Process each direct extension dependency
         for ext_name in direct_extensions {
             self.collect_extension_dependencies(
                 config,
+                &parsed,
                 ext_name,
                 &mut all_extensions,
                 &mut visited,
@@ -2599,6 +2565,7 @@ sign_amf "$AVOCADO_MANIFEST_PATH"
     fn collect_extension_dependencies(
         &self,
         _config: &crate::utils::config::Config,
+        parsed: &serde_yaml::Value,
         ext_name: &str,
         all_extensions: &mut HashSet<String>,
         visited: &mut HashSet<String>,
@@ -2613,10 +2580,6 @@ sign_amf "$AVOCADO_MANIFEST_PATH"
         // Add this extension to the result set
         all_extensions.insert(ext_name.to_string());
 
-        // Load the main config to check for local extensions
-        let content = std::fs::read_to_string(&self.config_path)?;
-        let parsed: serde_yaml::Value = serde_yaml::from_str(&content)?;
-
         // Check if this is a local extension defined in the ext section
         // Extension source configuration (repo, git, path) is now in the ext section
         if let Some(ext_config) = parsed
@@ -2636,6 +2599,7 @@ sign_amf "$AVOCADO_MANIFEST_PATH"
                     {
                         self.collect_extension_dependencies(
                             _config,
+                            parsed,
                             &spec.name,
                             all_extensions,
                             visited,
@@ -2658,21 +2622,16 @@ sign_amf "$AVOCADO_MANIFEST_PATH"
     async fn collect_runtime_extensions(
         &self,
         parsed: &serde_yaml::Value,
-        config: &crate::utils::config::Config,
+        merged_runtime: Option<&serde_yaml::Value>,
         runtime_name: &str,
         target_arch: &str,
-        config_path: &str,
         container_image: &str,
         container_args: Option<Vec<String>>,
     ) -> Result<Vec<String>> {
-        let merged_runtime =
-            config.get_merged_runtime_config(runtime_name, target_arch, config_path)?;
-
         let mut extensions = Vec::new();
 
         // Read extensions from the new `extensions` array format
         let ext_list = merged_runtime
-            .as_ref()
             .and_then(|value| value.get("extensions").and_then(|e| e.as_sequence()))
             .or_else(|| {
                 parsed
@@ -2683,24 +2642,38 @@ sign_amf "$AVOCADO_MANIFEST_PATH"
             });
 
         if let Some(ext_seq) = ext_list {
-            for ext in ext_seq {
-                if let Some(spec) =
-                    crate::utils::runtime_extension::RuntimeExtensionSpec::parse_entry(ext)
-                {
-                    let ext_name = spec.name.as_str();
-                    let version = self
-                        .resolve_extension_version(
-                            parsed,
-                            config,
-                            config_path,
-                            ext_name,
-                            container_image,
-                            target_arch,
-                            container_args.clone(),
-                        )
-                        .await?;
-                    extensions.push(format!("{ext_name}-{version}"));
-                }
+            let names: Vec<String> = ext_seq
+                .iter()
+                .filter_map(crate::utils::runtime_extension::RuntimeExtensionSpec::parse_entry)
+                .map(|spec| spec.name)
+                .collect();
+
+            // Versions pinned in the local `extensions` section win; everything
+            // else is read from the RPM database in one container run rather
+            // than one run per extension.
+            let local_versions: Vec<Option<String>> = names
+                .iter()
+                .map(|name| local_extension_version(parsed, name))
+                .collect();
+            let to_query: Vec<&str> = names
+                .iter()
+                .zip(&local_versions)
+                .filter(|(_, version)| version.is_none())
+                .map(|(name, _)| name.as_str())
+                .collect();
+            let rpm_versions = if to_query.is_empty() {
+                HashMap::new()
+            } else {
+                self.query_rpm_versions(&to_query, container_image, target_arch, container_args)
+                    .await?
+            };
+
+            for (ext_name, local_version) in names.iter().zip(local_versions) {
+                let version = match local_version {
+                    Some(version) => version,
+                    None => installed_extension_version(&rpm_versions, ext_name)?,
+                };
+                extensions.push(format!("{ext_name}-{version}"));
             }
         }
 
@@ -2712,70 +2685,25 @@ sign_amf "$AVOCADO_MANIFEST_PATH"
         Ok(extensions)
     }
 
-    /// Resolve the version for an extension.
-    ///
-    /// Priority order:
-    /// 1. Version from local `[ext]` section
-    /// 2. Query RPM database for installed version (for repo-sourced extensions)
-    #[allow(clippy::too_many_arguments)]
-    async fn resolve_extension_version(
-        &self,
-        parsed: &serde_yaml::Value,
-        _config: &crate::utils::config::Config,
-        _config_path: &str,
-        ext_name: &str,
-        container_image: &str,
-        target_arch: &str,
-        container_args: Option<Vec<String>>,
-    ) -> Result<String> {
-        // Try to get version from local [ext] section
-        if let Some(version) = parsed
-            .get("extensions")
-            .and_then(|ext_section| ext_section.as_mapping())
-            .and_then(|ext_table| ext_table.get(ext_name))
-            .and_then(|ext_config| ext_config.get("version"))
-            .and_then(|v| v.as_str())
-        {
-            if version != "*" {
-                return Ok(version.to_string());
-            }
-            // If version is "*", fall through to query RPM
-        }
-
-        // No version found in config - this is likely a package repository extension
-        // Query RPM database for the installed version
-        self.query_rpm_version(ext_name, container_image, target_arch, container_args)
-            .await
-    }
-
-    /// Query RPM database for the actual installed version of an extension.
+    /// Query the RPM database for the installed versions of several extensions.
     ///
-    /// This queries the RPM database in the extension's sysroot at $AVOCADO_EXT_SYSROOTS/{ext_name}
-    /// to get the actual installed version. This ensures AVOCADO_EXT_LIST contains
-    /// precise version information.
-    async fn query_rpm_version(
+    /// Each extension is looked up in its own sysroot at $AVOCADO_EXT_SYSROOTS/{ext_name}
+    /// so AVOCADO_EXT_LIST carries precise version information. All lookups share one
+    /// container run; extensions that are not installed are simply absent from the
+    /// returned map.
+    async fn query_rpm_versions(
         &self,
-        ext_name: &str,
+        ext_names: &[&str],
         container_image: &str,
         target: &str,
         container_args: Option<Vec<String>>,
-    ) -> Result<String> {
+    ) -> Result<HashMap<String, String>> {
         let container_helper = SdkContainer::new();
 
-        let version_query_script = format!(
-            r#"
-set -e
-# Query RPM version for extension from RPM database using the same config as installation
-RPM_CONFIGDIR=$AVOCADO_SDK_PREFIX/ext-rpm-config \
-RPM_ETCCONFIGDIR=$DNF_SDK_TARGET_PREFIX \
-rpm --root="$AVOCADO_EXT_SYSROOTS/{ext_name}" --dbpath=/var/lib/extension.d/rpm -q {ext_name} --queryformat '%{{VERSION}}'
-"#
-        );
-
         let version_query_config = RunConfig {
             container_image: container_image.to_string(),
             target: target.to_string(),
-            command: version_query_script,
+            command: generate_rpm_version_query_script(ext_names),
             verbose: self.verbose,
             source_environment: true,
             interactive: false,
@@ -2787,31 +2715,34 @@ rpm --root="$AVOCADO_EXT_SYSROOTS/{ext_name}" --dbpath=/var/lib/extension.d/rpm
             ..Default::default()
         };
 
-        match container_helper
+        let output = container_helper
             .run_in_container_with_output(version_query_config)
             .await
-        {
-            Ok(Some(actual_version)) => {
-                let trimmed_version = actual_version.trim();
-                if self.verbose {
-                    print_info(
-                        &format!(
-                            "Resolved extension '{ext_name}' to version '{trimmed_version}' from RPM database"
-                        ),
-                        OutputLevel::Normal,
-                    );
-                }
-                Ok(trimmed_version.to_string())
+            .map_err(|e| {
+                anyhow::anyhow!(
+                    "Failed to query extension versions from RPM database: {e}. \
+                        Extensions may not be installed yet. Run 'avocado install' first."
+                )
+            })?
+            .ok_or_else(|| {
+                anyhow::anyhow!(
+                    "Failed to query extension versions from RPM database. \
+                        Extensions may not be installed yet. Run 'avocado install' first."
+                )
+            })?;
+
+        let versions = parse_rpm_version_output(&output, ext_names);
+        if self.verbose {
+            for (ext_name, version) in &versions {
+                print_info(
+                    &format!(
+                        "Resolved extension '{ext_name}' to version '{version}' from RPM database"
+                    ),
+                    OutputLevel::Normal,
+                );
             }
-            Ok(None) => Err(anyhow::anyhow!(
-                "Failed to query version for extension '{ext_name}' from RPM database. \
-                    Extension may not be installed yet. Run 'avocado install' first."
-            )),
-            Err(e) => Err(anyhow::anyhow!(
-                "Failed to query version for extension '{ext_name}' from RPM database: {e}. \
-                    Extension may not be installed yet. Run 'avocado install' first."
-            )),
         }
+        Ok(versions)
     }
 
     /// Run the runtime's `post_build` script inside the SDK container.
@@ -2837,6 +2768,7 @@ rpm --root="$AVOCADO_EXT_SYSROOTS/{ext_name}" --dbpath=/var/lib/extension.d/rpm
         merged_container_args: &Option<Vec<String>>,
         container_helper: &SdkContainer,
         runs_on_context: Option<&RunsOnContext>,
+        stamp_script: Option<&str>,
     ) -> Result<()> {
         print_info(
             &format!(
@@ -2851,11 +2783,14 @@ rpm --root="$AVOCADO_EXT_SYSROOTS/{ext_name}" --dbpath=/var/lib/extension.d/rpm
             target_arch, self.runtime_name
         );
 
-        let command = format!(
+        let mut command = format!(
             r#"if [ -f '{script_path}' ]; then echo 'Running post_build script: {script_path}'; export AVOCADO_RUNTIME_NAME='{runtime_name}'; export AVOCADO_TARGET='{target}'; export AVOCADO_RUNTIME_BUILD_DIR="{runtime_build_dir}"; bash '{script_path}'; else echo 'post_build script {script_path} not found.'; ls -la; exit 1; fi"#,
             runtime_name = self.runtime_name,
             target = target_arch,
         );
+        if let Some(stamp_script) = stamp_script {
+            append_stamp_on_success(&mut command, stamp_script);
+        }
 
         let run_config = RunConfig {
             container_image: container_image.to_string(),
@@ -2934,6 +2869,59 @@ fn collect_runtime_compile_entries(merged_runtime: &serde_yaml::Value) -> Vec<Ru
     out
 }
 
+/// Append a stamp write to a container script so it only runs when the script
+/// up to that point succeeded. The scripts run without `set -e`, so their
+/// result is the status of their last command; that status is checked and
+/// preserved before the stamp is written.
+fn append_stamp_on_success(script: &mut String, stamp_script: &str) {
+    script.push_str("\nSTATUS=$?\nif [ \"$STATUS\" -ne 0 ]; then exit \"$STATUS\"; fi\n");
+    script.push_str(stamp_script);
+}
+
+/// Split a resolved "ext_name-version" entry (e.g. "my-ext-1.0.0") at its last
+/// dash. Returns `None` when the suffix does not look like a version, i.e. does
+/// not start with a digit.
+fn split_versioned_name(versioned_name: &str) -> Option<(&str, &str)> {
+    let (name, version) = versioned_name.rsplit_once('-')?;
+    version
+        .starts_with(|c: char| c.is_ascii_digit())
+        .then_some((name, version))
+}
+
+/// Project-relative directory where a runtime stages its signed TUF metadata
+/// before copying it into the build volume.
+///
+/// Each runtime gets its own subdirectory so concurrent runtime builds
+/// (`AVOCADO_PARALLEL_RUNTIMES`) never read or delete each other's files.
+fn tuf_staging_rel_dir(runtime_name: &str) -> String {
+    format!(".tuf-staging-tmp/{runtime_name}")
+}
+
+/// Script that copies a runtime's staged TUF metadata from the project
+/// mount into its `tuf-staging` directory in the build volume.
+fn generate_tuf_staging_copy_script(runtime_name: &str, runtime_uuid: &str) -> String {
+    let src = format!("/opt/src/{}", tuf_staging_rel_dir(runtime_name));
+    format!(
+        r#"set -euo pipefail
+DEST="$AVOCADO_PREFIX/runtimes/{runtime_name}/var-staging/lib/avocado/tuf-staging"
+mkdir -p "$DEST/delegations"
+cp "{src}/targets.json" "$DEST/targets.json"
+cp "{src}/delegations/runtime-{runtime_uuid}.json" \
+   "$DEST/delegations/runtime-{runtime_uuid}.json"
+"#
+    )
+}
+
+/// Remove a runtime's TUF staging dir, and the shared parent once no other
+/// runtime is still using it.
+fn remove_tuf_staging_dir(tmp_dir: &std::path::Path) {
+    let _ = std::fs::remove_dir_all(tmp_dir);
+    if let Some(parent) = tmp_dir.parent() {
+        // Only succeeds when empty, i.e. no concurrent build is staging.
+        let _ = std::fs::remove_dir(parent);
+    }
+}
+
 /// Helper function to run a container command, using shared context if available
 async fn run_container_command(
     container_helper: &SdkContainer,
@@ -3074,7 +3062,7 @@ runtimes:
         let config = Config::load(&cmd.config_path).unwrap();
         let resolved_extensions: Vec<String> = vec![];
         let script = cmd
-            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions)
+            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions, None)
             .unwrap();
 
         assert!(script.contains("RUNTIME_NAME=\"test-runtime\""));
@@ -3120,7 +3108,7 @@ extensions:
         let config = Config::load(&cmd.config_path).unwrap();
         let resolved_extensions = vec!["test-ext-1.0.0".to_string()];
         let script = cmd
-            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions)
+            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions, None)
             .unwrap();
 
         assert!(script.contains("test-ext-1.0.0.raw"));
@@ -3166,7 +3154,7 @@ extensions:
         let config = Config::load(&cmd.config_path).unwrap();
         let resolved_extensions = vec!["test-ext-1.0.0".to_string()];
         let script = cmd
-            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions)
+            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions, None)
             .unwrap();
 
         assert!(script.contains("$AVOCADO_PREFIX/output/extensions"));
@@ -3210,7 +3198,7 @@ extensions:
         let config = Config::load(&cmd.config_path).unwrap();
         let resolved_extensions = vec!["test-ext-1.0.0".to_string()];
         let script = cmd
-            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions)
+            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions, None)
             .unwrap();
 
         assert!(script.contains("$AVOCADO_PREFIX/output/extensions"));
@@ -3346,7 +3334,7 @@ extensions:
         let config = Config::load(&cmd.config_path).unwrap();
         let resolved_extensions = vec!["test-ext-1.0.0".to_string()];
         let script = cmd
-            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions)
+            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions, None)
             .unwrap();
 
         // Manifest should be generated dynamically via Python
@@ -3452,7 +3440,7 @@ runtimes:
         );
         let config = Config::load(&cmd.config_path).unwrap();
         let script = cmd
-            .create_build_script(&config, &parsed, "raspberrypi4", &[])
+            .create_build_script(&config, &parsed, "raspberrypi4", &[], None)
             .unwrap();
 
         // Wrap section emitted only for rootfs.
@@ -3509,7 +3497,7 @@ runtimes:
         let config = Config::load(&cmd.config_path).unwrap();
         let resolved_extensions: Vec<String> = vec![];
         let script = cmd
-            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions)
+            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions, None)
             .unwrap();
 
         assert!(script.contains("AVOCADO_RUNTIME_NAME=\"empty-runtime\""));
@@ -3545,7 +3533,7 @@ runtimes:
 
         let config = Config::load(&cmd.config_path).unwrap();
         let script = cmd
-            .create_build_script(&config, &parsed, "x86_64", &[])
+            .create_build_script(&config, &parsed, "x86_64", &[], None)
             .unwrap();
 
         // The manifest section should set BUILD_ID with a UUID
@@ -3553,4 +3541,91 @@ runtimes:
         // The manifest section should set BUILT_AT with a timestamp
         assert!(script.contains("BUILT_AT=\""));
     }
+
+    #[test]
+    fn test_tuf_staging_dir_is_unique_per_runtime() {
+        assert_eq!(tuf_staging_rel_dir("dev"), ".tuf-staging-tmp/dev");
+        assert_ne!(tuf_staging_rel_dir("dev"), tuf_staging_rel_dir("prod"));
+
+        let dev = generate_tuf_staging_copy_script("dev", "uuid-1");
+        assert!(dev.contains("cp \"/opt/src/.tuf-staging-tmp/dev/targets.json\""));
+        assert!(dev.contains("/opt/src/.tuf-staging-tmp/dev/delegations/runtime-uuid-1.json"));
+        assert!(dev.contains("$AVOCADO_PREFIX/runtimes/dev/var-staging/lib/avocado/tuf-staging"));
+
+        let prod = generate_tuf_staging_copy_script("prod", "uuid-2");
+        assert!(!prod.contains(".tuf-staging-tmp/dev"));
+        assert!(prod.contains("/opt/src/.tuf-staging-tmp/prod/targets.json"));
+    }
+
+    #[test]
+    fn test_split_versioned_name() {
+        assert_eq!(
+            split_versioned_name("my-ext-1.0.0"),
+            Some(("my-ext", "1.0.0"))
+        );
+        assert_eq!(split_versioned_name("app-2"), Some(("app", "2")));
+        assert_eq!(split_versioned_name("my-ext-latest"), None);
+        assert_eq!(split_versioned_name("plain"), None);
+    }
+
+    #[test]
+    fn test_create_build_script_links_extension_images() {
+        let temp_dir = TempDir::new().unwrap();
+        let config_content = r#"
+sdk:
+  image: "test-image"
+
+connect:
+  org: test
+
+runtimes:
+  test-runtime:
+    target: "x86_64"
+    extensions:
+      - test-ext
+
+extensions:
+  test-ext:
+    version: "1.0.0"
+    types:
+      - sysext
+"#;
+        let config_path = create_test_config_file(&temp_dir, config_content);
+        let parsed: serde_yaml::Value = serde_yaml::from_str(config_content).unwrap();
+        let cmd = RuntimeBuildCommand::new(
+            "test-runtime".to_string(),
+            config_path,
+            false,
+            Some("x86_64".to_string()),
+            None,
+            None,
+        );
+
+        let config = Config::load(&cmd.config_path).unwrap();
+        let resolved_extensions = vec!["test-ext-1.0.0".to_string()];
+        let script = cmd
+            .create_build_script(&config, &parsed, "x86_64", &resolved_extensions, None)
+            .unwrap();
+
+        assert!(script.contains(r#"ln -f "$1" "$2" 2>/dev/null || cp -f "$1" "$2""#));
+        assert!(script.contains(
+            r#"stage_ext_image "$AVOCADO_PREFIX/output/extensions/test-ext-1.0.0.raw" "$RUNTIME_EXT_DIR/test-ext-1.0.0.raw""#
+        ));
+        let defined = script.find("stage_ext_image() {").unwrap();
+        let used = script.find("stage_ext_image \"").unwrap();
+        assert!(defined < used);
+    }
+
+    #[test]
+    fn test_append_stamp_on_success_preserves_script_status() {
+        let mut script = "bash '/opt/src/post-build.sh'".to_string();
+        append_stamp_on_success(&mut script, "\n# Write stamp file\n");
+
+        let guard = script
+            .find(r#"if [ "$STATUS" -ne 0 ]; then exit "$STATUS"; fi"#)
+            .unwrap();
+        let stamp = script.find("# Write stamp file").unwrap();
+        assert!(script.starts_with("bash '/opt/src/post-build.sh'\nSTATUS=$?\n"));
+        assert!(guard < stamp);
+    }
 }
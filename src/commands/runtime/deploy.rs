@@ -725,7 +725,7 @@ FIRST=false
 if [ -d "$IMAGES_DIR" ]; then
     for RAW_FILE in "$IMAGES_DIR"/*.raw; do
         [ -f "$RAW_FILE" ] || continue
-        BASENAME=$(basename "$RAW_FILE")
+        BASENAME="${{RAW_FILE##*/}}"
         HASH=$(sha256sum "$RAW_FILE" | awk '{{print $1}}')
         SIZE=$(stat -c '%s' "$RAW_FILE")
         if [ "$FIRST" = "false" ]; then
@@ -800,8 +800,8 @@ fi
 if [ -d "$IMAGES_DIR" ]; then
     for RAW_FILE in "$IMAGES_DIR"/*.raw; do
         [ -f "$RAW_FILE" ] || continue
-        BASENAME=$(basename "$RAW_FILE")
-        ln -sf "$RAW_FILE" "$REPO_DIR/targets/$BASENAME"
+        BASENAME="${{RAW_FILE##*/}}"
+        ln -sfn "$RAW_FILE" "$REPO_DIR/targets/$BASENAME"
     done
 fi
 
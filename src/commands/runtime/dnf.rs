@@ -216,9 +216,11 @@ impl RuntimeDnfCommand {
         repo_release: Option<&String>,
         merged_container_args: &Option<Vec<String>>,
     ) -> Result<()> {
+        // Reflink the rpmdb where the volume supports it; a hardlinked copy
+        // would let DNF's in-place writes corrupt the rootfs database.
         let setup_cmd = format!(
-            "mkdir -p $AVOCADO_PREFIX/runtimes/{}/var/lib && cp -rf $AVOCADO_PREFIX/rootfs/var/lib/rpm $AVOCADO_PREFIX/runtimes/{}/var/lib",
-            self.runtime, self.runtime
+            "mkdir -p $AVOCADO_PREFIX/runtimes/{rt}/var/lib && {{ cp -rf --reflink=auto $AVOCADO_PREFIX/rootfs/var/lib/rpm $AVOCADO_PREFIX/runtimes/{rt}/var/lib 2>/dev/null || cp -rf $AVOCADO_PREFIX/rootfs/var/lib/rpm $AVOCADO_PREFIX/runtimes/{rt}/var/lib; }}",
+            rt = self.runtime
         );
 
         let config = RunConfig {
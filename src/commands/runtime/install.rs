@@ -464,37 +464,28 @@ impl RuntimeInstallCommand {
 
         let installroot_path = format!("$AVOCADO_PREFIX/runtimes/{runtime}");
 
-        if needs_clean_reinstall {
-            let clean_command = format!(r#"rm -rf "{installroot_path}""#);
-
-            let run_config = RunConfig {
-                container_image: container_image.to_string(),
-                target: target_arch.clone(),
-                command: clean_command,
-                verbose: self.verbose,
-                source_environment: false,
-                interactive: false,
-                repo_url: repo_url.cloned(),
-                repo_release: repo_release.cloned(),
-                container_args: merged_container_args.clone(),
-                dnf_args: self.dnf_args.clone(),
-                sdk_arch: self.sdk_arch.clone(),
-                tui_context: self.tui_context.clone(),
-                ..Default::default()
-            };
-            let _ = run_container_command(container_helper, run_config, runs_on_context).await;
-        }
-
-        // Check if the installroot exists (may have been cleaned above or never created)
-        let check_command = format!("[ -d {installroot_path} ]");
+        // Create the installroot, seeded with the rootfs rpm database, unless
+        // it already exists. A pending clean reinstall removes it first, so the
+        // clean, the existence probe and the setup share one container run.
+        // Reflink the rpmdb where the volume supports it; a hardlinked copy
+        // would let DNF's in-place writes corrupt the rootfs database.
+        let clean_step = if needs_clean_reinstall {
+            format!("rm -rf \"{installroot_path}\"\n")
+        } else {
+            String::new()
+        };
         let setup_command = format!(
-            "mkdir -p {installroot_path}/var/lib && cp -rf $AVOCADO_PREFIX/rootfs/var/lib/rpm {installroot_path}/var/lib"
+            r#"{clean_step}if [ ! -d "{installroot_path}" ]; then
+    mkdir -p "{installroot_path}/var/lib" && \
+    {{ cp -rf --reflink=auto "$AVOCADO_PREFIX/rootfs/var/lib/rpm" "{installroot_path}/var/lib" 2>/dev/null || cp -rf "$AVOCADO_PREFIX/rootfs/var/lib/rpm" "{installroot_path}/var/lib"; }} && \
+    echo "Created installroot for runtime '{runtime}'."
+fi"#
         );
 
         let run_config = RunConfig {
             container_image: container_image.to_string(),
             target: target_arch.clone(),
-            command: check_command,
+            command: setup_command,
             verbose: self.verbose,
             source_environment: false,
             interactive: false,
@@ -506,40 +497,12 @@ impl RuntimeInstallCommand {
             tui_context: self.tui_context.clone(),
             ..Default::default()
         };
-        let installroot_exists =
-            run_container_command(container_helper, run_config, runs_on_context).await?;
-
-        if !installroot_exists {
-            let run_config = RunConfig {
-                container_image: container_image.to_string(),
-                target: target_arch.clone(),
-                command: setup_command,
-                verbose: self.verbose,
-                source_environment: false,
-                interactive: false,
-                repo_url: repo_url.cloned(),
-                repo_release: repo_release.cloned(),
-                container_args: merged_container_args.clone(),
-                dnf_args: self.dnf_args.clone(),
-                sdk_arch: self.sdk_arch.clone(),
-                tui_context: self.tui_context.clone(),
-                ..Default::default()
-            };
-            let success =
-                run_container_command(container_helper, run_config, runs_on_context).await?;
-
-            if success {
-                print_success(
-                    &format!("Created installroot for runtime '{runtime}'."),
-                    OutputLevel::Normal,
-                );
-            } else {
-                print_error(
-                    &format!("Failed to create installroot for runtime '{runtime}'."),
-                    OutputLevel::Normal,
-                );
-                return Ok(false);
-            }
+        if !run_container_command(container_helper, run_config, runs_on_context).await? {
+            print_error(
+                &format!("Failed to create installroot for runtime '{runtime}'."),
+                OutputLevel::Normal,
+            );
+            return Ok(false);
         }
 
         // Install dependencies if they exist (using merged config to include target-specific dependencies)
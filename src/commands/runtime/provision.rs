@@ -3,6 +3,10 @@ use crate::utils::signing_service::{generate_helper_script, SigningService, Sign
 use crate::utils::{
     config::{ComposedConfig, Config},
     container::{is_docker_desktop, RunConfig, SdkContainer},
+    ext_version::{
+        generate_rpm_version_query_script, installed_extension_version, local_extension_version,
+        parse_rpm_version_output,
+    },
     lockfile::{LockFile, SysrootType},
     output::{print_info, print_success, print_warning, OutputLevel},
     remote::{RemoteHost, SshClient},
@@ -350,48 +354,49 @@ impl RuntimeProvisionCommand {
         // lock + docker volume), falling back to the CWD. A per-board runtime
         // (`runtimes/<board>/avocado.yaml` + `src_dir: ../..`) is provisioned
         // from the board dir, so the CWD is not the src_dir.
-        let lock_src_dir = config
-            .get_resolved_src_dir(&self.config.config_path)
-            .or_else(|| std::env::current_dir().ok());
-        if let Some(src_dir) = lock_src_dir {
-            if let Ok(lock_file) = LockFile::load(&src_dir) {
-                // Validate kernel consistency before provision. Any drift between
-                // rootfs/initramfs kvers, or a pinned kver without a populated
-                // kernel sysroot, surfaces here as a warning. Phase 5 promotes
-                // these to fatal once the v1 rootfs auto-append is removed.
-                if let Err(e) = lock_file.validate_kernel_consistency(&target_arch) {
-                    print_warning(
-                        &format!(
-                            "Kernel consistency warning before provision: {e} \
-                             (provision will continue; this becomes a hard error in a future release)"
-                        ),
-                        OutputLevel::Normal,
-                    );
-                }
+        // The same directory keys the docker volume and the state file below,
+        // so resolve it once and pass it explicitly from here on.
+        let src_dir = match config.get_resolved_src_dir(&self.config.config_path) {
+            Some(dir) => dir,
+            None => std::env::current_dir()?,
+        };
+        if let Ok(lock_file) = LockFile::load(&src_dir) {
+            // Validate kernel consistency before provision. Any drift between
+            // rootfs/initramfs kvers, or a pinned kver without a populated
+            // kernel sysroot, surfaces here as a warning. Phase 5 promotes
+            // these to fatal once the v1 rootfs auto-append is removed.
+            if let Err(e) = lock_file.validate_kernel_consistency(&target_arch) {
+                print_warning(
+                    &format!(
+                        "Kernel consistency warning before provision: {e} \
+                         (provision will continue; this becomes a hard error in a future release)"
+                    ),
+                    OutputLevel::Normal,
+                );
+            }
 
-                if let Some(kver) = lock_file
-                    .get_kernel_version(&target_arch, &SysrootType::Rootfs)
-                    .cloned()
-                {
-                    // Prefer the content-addressed kernel sysroot when populated
-                    // (Phase 2c stages it from the rootfs install). The
-                    // `Image` symlink inside that directory points at the
-                    // arch-appropriate image (`Image-<kver>` on ARM64,
-                    // `bzImage-<kver>` on x86-64). Fall back to the rootfs
-                    // `/boot/Image-<kver>` path for v4 lockfiles or if staging
-                    // silently failed.
-                    let kernel_sysroot = SysrootType::Kernel(kver.clone());
-                    let kernel_sysroot_populated = lock_file
-                        .get_sysroot_versions(&target_arch, &kernel_sysroot)
-                        .is_some();
-                    let image_path = if kernel_sysroot_populated {
-                        format!("/opt/_avocado/{target_arch}/kernel/{kver}/Image")
-                    } else {
-                        format!("/opt/_avocado/{target_arch}/rootfs/boot/Image-{kver}")
-                    };
-                    env_vars.insert("AVOCADO_PROVISION_KERNEL_VERSION".to_string(), kver);
-                    env_vars.insert("AVOCADO_PROVISION_KERNEL_IMAGE".to_string(), image_path);
-                }
+            if let Some(kver) = lock_file
+                .get_kernel_version(&target_arch, &SysrootType::Rootfs)
+                .cloned()
+            {
+                // Prefer the content-addressed kernel sysroot when populated
+                // (Phase 2c stages it from the rootfs install). The
+                // `Image` symlink inside that directory points at the
+                // arch-appropriate image (`Image-<kver>` on ARM64,
+                // `bzImage-<kver>` on x86-64). Fall back to the rootfs
+                // `/boot/Image-<kver>` path for v4 lockfiles or if staging
+                // silently failed.
+                let kernel_sysroot = SysrootType::Kernel(kver.clone());
+                let kernel_sysroot_populated = lock_file
+                    .get_sysroot_versions(&target_arch, &kernel_sysroot)
+                    .is_some();
+                let image_path = if kernel_sysroot_populated {
+                    format!("/opt/_avocado/{target_arch}/kernel/{kver}/Image")
+                } else {
+                    format!("/opt/_avocado/{target_arch}/rootfs/boot/Image-{kver}")
+                };
+                env_vars.insert("AVOCADO_PROVISION_KERNEL_VERSION".to_string(), kver);
+                env_vars.insert("AVOCADO_PROVISION_KERNEL_IMAGE".to_string(), image_path);
             }
         }
 
@@ -425,10 +430,6 @@ impl RuntimeProvisionCommand {
         // resolved `src_dir` as the docker volume / lockfile (not the CWD), so
         // a per-board runtime provisioned from `runtimes/<board>/` reads the
         // state file from — and attaches the volume keyed at — the repo root.
-        let src_dir = match config.get_resolved_src_dir(&self.config.config_path) {
-            Some(dir) => dir,
-            None => std::env::current_dir()?,
-        };
         let state_file_existed =
             if let Some((ref state_file_path, ref container_state_path)) = state_file_info {
                 self.copy_state_to_container(
@@ -999,27 +1000,45 @@ avocado-provision-{} {}
                     .and_then(|d| d.as_mapping())
             });
 
-        let mut extensions = Vec::new();
-
+        let mut ext_specs = Vec::new();
         if let Some(deps) = runtime_dep_table {
             for dep_spec in deps.values() {
                 if let Some(ext_name) = dep_spec.get("extensions").and_then(|v| v.as_str()) {
-                    let version = self
-                        .resolve_extension_version(
-                            parsed,
-                            config,
-                            config_path,
-                            ext_name,
-                            dep_spec,
-                            container_image,
-                            target_arch,
-                        )
-                        .await?;
-                    extensions.push(format!("{ext_name}-{version}"));
+                    let version = Self::configured_extension_version(
+                        parsed,
+                        config,
+                        config_path,
+                        ext_name,
+                        dep_spec,
+                    )?;
+                    ext_specs.push((ext_name, version));
                 }
             }
         }
 
+        // Extensions without a pinned version are read from the RPM database
+        // in one container run rather than one run per extension.
+        let to_query: Vec<&str> = ext_specs
+            .iter()
+            .filter(|(_, version)| version.is_none())
+            .map(|(name, _)| *name)
+            .collect();
+        let rpm_versions = if to_query.is_empty() {
+            HashMap::new()
+        } else {
+            self.query_rpm_versions(&to_query, container_image, target_arch)
+                .await?
+        };
+
+        let mut extensions = Vec::with_capacity(ext_specs.len());
+        for (ext_name, version) in ext_specs {
+            let version = match version {
+                Some(version) => version,
+                None => installed_extension_version(&rpm_versions, ext_name)?,
+            };
+            extensions.push(format!("{ext_name}-{version}"));
+        }
+
         // Deduplicate while preserving declaration order from the config.
         // The order in the extensions array determines merge priority in avocadoctl.
         let mut seen = std::collections::HashSet::new();
@@ -1028,21 +1047,19 @@ avocado-provision-{} {}
         Ok(extensions)
     }
 
-    #[allow(clippy::too_many_arguments)]
-    async fn resolve_extension_version(
-        &self,
+    /// Version of an extension pinned in config, or `None` if it has to be
+    /// read from the RPM database.
+    fn configured_extension_version(
         parsed: &serde_yaml::Value,
         config: &crate::utils::config::Config,
         config_path: &str,
         ext_name: &str,
         dep_spec: &serde_yaml::Value,
-        container_image: &str,
-        target_arch: &str,
-    ) -> Result<String> {
+    ) -> Result<Option<String>> {
         // If version is explicitly specified with vsn field, use it (unless it's a wildcard)
         if let Some(version) = dep_spec.get("vsn").and_then(|v| v.as_str()) {
             if version != "*" {
-                return Ok(version.to_string());
+                return Ok(Some(version.to_string()));
             }
             // If vsn is "*", fall through to query RPM for the actual installed version
         }
@@ -1051,63 +1068,35 @@ avocado-provision-{} {}
         if let Some(external_config_path) = dep_spec.get("config").and_then(|v| v.as_str()) {
             let external_extensions =
                 config.load_external_extensions(config_path, external_config_path)?;
-            if let Some(ext_config) = external_extensions.get(ext_name) {
-                if let Some(version) = ext_config.get("version").and_then(|v| v.as_str()) {
-                    if version != "*" {
-                        return Ok(version.to_string());
-                    }
-                    // If version is "*", fall through to query RPM
-                }
-            }
+            let version = external_extensions
+                .get(ext_name)
+                .and_then(|ext_config| ext_config.get("version"))
+                .and_then(|v| v.as_str())
+                .filter(|version| *version != "*")
+                .map(str::to_string);
             // External config but no version found or version is "*" - query RPM database
-            return self
-                .query_rpm_version(ext_name, container_image, target_arch)
-                .await;
-        }
-
-        // Try to get version from local [ext] section
-        if let Some(version) = parsed
-            .get("extensions")
-            .and_then(|ext_section| ext_section.as_mapping())
-            .and_then(|ext_table| ext_table.get(ext_name))
-            .and_then(|ext_config| ext_config.get("version"))
-            .and_then(|v| v.as_str())
-        {
-            if version != "*" {
-                return Ok(version.to_string());
-            }
-            // If version is "*", fall through to query RPM
+            return Ok(version);
         }
 
-        // No version found in config - this is likely a package repository extension
-        // Query RPM database for the installed version
-        self.query_rpm_version(ext_name, container_image, target_arch)
-            .await
+        // Try to get version from local [ext] section; if there is none this is
+        // likely a package repository extension and RPM has the installed version
+        Ok(local_extension_version(parsed, ext_name))
     }
 
-    /// Query RPM database for the actual installed version of an extension
+    /// Query the RPM database for the installed versions of several extensions.
     ///
-    /// This queries the RPM database in the extension's sysroot at $AVOCADO_EXT_SYSROOTS/{ext_name}
-    /// to get the actual installed version. This ensures AVOCADO_EXT_LIST contains
-    /// precise version information.
-    async fn query_rpm_version(
+    /// Each extension is looked up in its own sysroot at $AVOCADO_EXT_SYSROOTS/{ext_name}
+    /// so AVOCADO_EXT_LIST carries precise version information. All lookups share one
+    /// container run; extensions that are not installed are simply absent from the
+    /// returned map.
+    async fn query_rpm_versions(
         &self,
-        ext_name: &str,
+        ext_names: &[&str],
         container_image: &str,
         target: &str,
-    ) -> Result<String> {
+    ) -> Result<HashMap<String, String>> {
         let container_helper = SdkContainer::new();
 
-        let version_query_script = format!(
-            r#"
-set -e
-# Query RPM version for extension from RPM database using the same config as installation
-RPM_CONFIGDIR=$AVOCADO_SDK_PREFIX/ext-rpm-config \
-RPM_ETCCONFIGDIR=$DNF_SDK_TARGET_PREFIX \
-rpm --root="$AVOCADO_EXT_SYSROOTS/{ext_name}" --dbpath=/var/lib/extension.d/rpm -q {ext_name} --queryformat '%{{VERSION}}'
-"#
-        );
-
         let mut query_env = HashMap::new();
         query_env.insert(
             "AVOCADO_RUNTIME".to_string(),
@@ -1116,7 +1105,7 @@ rpm --root="$AVOCADO_EXT_SYSROOTS/{ext_name}" --dbpath=/var/lib/extension.d/rpm
         let version_query_config = crate::utils::container::RunConfig {
             container_image: container_image.to_string(),
             target: target.to_string(),
-            command: version_query_script,
+            command: generate_rpm_version_query_script(ext_names),
             verbose: self.config.verbose,
             source_environment: true,
             interactive: false,
@@ -1126,31 +1115,34 @@ rpm --root="$AVOCADO_EXT_SYSROOTS/{ext_name}" --dbpath=/var/lib/extension.d/rpm
             ..Default::default()
         };
 
-        match container_helper
+        let output = container_helper
             .run_in_container_with_output(version_query_config)
             .await
-        {
-            Ok(Some(actual_version)) => {
-                let trimmed_version = actual_version.trim();
-                if self.config.verbose {
-                    print_info(
-                        &format!(
-                            "Resolved extension '{ext_name}' to version '{trimmed_version}' from RPM database"
-                        ),
-                        OutputLevel::Normal,
-                    );
-                }
-                Ok(trimmed_version.to_string())
+            .map_err(|e| {
+                anyhow::anyhow!(
+                    "Failed to query extension versions from RPM database: {e}. \
+                        Extensions may not be installed yet. Run 'avocado install' first."
+                )
+            })?
+            .ok_or_else(|| {
+                anyhow::anyhow!(
+                    "Failed to query extension versions from RPM database. \
+                        Extensions may not be installed yet. Run 'avocado install' first."
+                )
+            })?;
+
+        let versions = parse_rpm_version_output(&output, ext_names);
+        if self.config.verbose {
+            for (ext_name, version) in &versions {
+                print_info(
+                    &format!(
+                        "Resolved extension '{ext_name}' to version '{version}' from RPM database"
+                    ),
+                    OutputLevel::Normal,
+                );
             }
-            Ok(None) => Err(anyhow::anyhow!(
-                "Failed to query version for extension '{ext_name}' from RPM database. \
-                    Extension may not be installed yet. Run 'avocado install' first."
-            )),
-            Err(e) => Err(anyhow::anyhow!(
-                "Failed to query version for extension '{ext_name}' from RPM database: {e}. \
-                    Extension may not be installed yet. Run 'avocado install' first."
-            )),
         }
+        Ok(versions)
     }
 }
 
@@ -230,10 +230,16 @@ impl RuntimeSignCommand {
         let mut all_extensions = HashSet::new();
         let mut visited = HashSet::new();
 
+        // Parse the main config once; the recursion below only reads from it
+        let parsed = crate::utils::config::Config::read_config_value(std::path::Path::new(
+            &self.config_path,
+        ))?;
+
         // Process each direct extension dependency
         for ext_name in direct_extensions {
             self.collect_extension_dependencies(
                 config,
+                &parsed,
                 ext_name,
                 &mut all_extensions,
                 &mut visited,
@@ -248,6 +254,7 @@ impl RuntimeSignCommand {
     fn collect_extension_dependencies(
         &self,
         config: &crate::utils::config::Config,
+        parsed: &serde_yaml::Value,
         ext_name: &str,
         all_extensions: &mut HashSet<String>,
         visited: &mut HashSet<String>,
@@ -262,10 +269,6 @@ impl RuntimeSignCommand {
         // Add this extension to the result set
         all_extensions.insert(ext_name.to_string());
 
-        // Load the main config to check for local extensions
-        let content = std::fs::read_to_string(&self.config_path)?;
-        let parsed: serde_yaml::Value = serde_yaml::from_str(&content)?;
-
         // Check if this is a local extension
         if let Some(ext_config) = parsed
             .get("extensions")
@@ -291,6 +294,7 @@ impl RuntimeSignCommand {
                             // Add the external extension itself
                             self.collect_extension_dependencies(
                                 config,
+                                parsed,
                                 nested_ext_name,
                                 all_extensions,
                                 visited,
@@ -309,6 +313,7 @@ impl RuntimeSignCommand {
                                         {
                                             self.collect_extension_dependencies(
                                                 config,
+                                                parsed,
                                                 nested_nested_ext_name,
                                                 all_extensions,
                                                 visited,
@@ -322,6 +327,7 @@ impl RuntimeSignCommand {
                             // This is a local extension dependency
                             self.collect_extension_dependencies(
                                 config,
+                                parsed,
                                 nested_ext_name,
                                 all_extensions,
                                 visited,
@@ -369,6 +375,7 @@ impl RuntimeSignCommand {
                                             {
                                                 self.collect_extension_dependencies(
                                                     config,
+                                                    parsed,
                                                     nested_ext_name,
                                                     all_extensions,
                                                     visited,
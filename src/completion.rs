@@ -15,7 +15,7 @@
 //!   The shell silently shows no candidates, which is the right UX.
 
 use std::ffi::OsStr;
-use std::path::{Path, PathBuf};
+use std::path::PathBuf;
 
 use clap_complete::engine::CompletionCandidate;
 
@@ -36,16 +36,17 @@ fn find_avocado_yaml() -> Option<PathBuf> {
     }
 }
 
-/// Parse `avocado.yaml` as a plain YAML map (no include resolution, no
-/// interpolation) and return the keys under `section`. This is the cheap
-/// path: full `Config::load_composed` would hit the SDK container.
-fn read_top_level_keys(yaml_path: &Path, section: &str) -> Vec<String> {
-    let Ok(content) = std::fs::read_to_string(yaml_path) else {
-        return vec![];
-    };
-    let Ok(value) = serde_yaml::from_str::<serde_yaml::Value>(&content) else {
-        return vec![];
-    };
+/// Find and parse `avocado.yaml` as a plain YAML value (no include
+/// resolution, no interpolation). This is the cheap path: full
+/// `Config::load_composed` would hit the SDK container.
+fn read_avocado_yaml() -> Option<serde_yaml::Value> {
+    let path = find_avocado_yaml()?;
+    let content = std::fs::read_to_string(path).ok()?;
+    serde_yaml::from_str(&content).ok()
+}
+
+/// Return the keys of the mapping under `section`, or nothing if absent.
+fn top_level_keys(value: &serde_yaml::Value, section: &str) -> Vec<String> {
     let Some(map) = value.get(section).and_then(|v| v.as_mapping()) else {
         return vec![];
     };
@@ -64,20 +65,20 @@ fn filter(names: Vec<String>, current: &OsStr) -> Vec<CompletionCandidate> {
 }
 
 pub fn extensions(current: &OsStr) -> Vec<CompletionCandidate> {
-    let Some(path) = find_avocado_yaml() else {
+    let Some(value) = read_avocado_yaml() else {
         return vec![];
     };
-    filter(read_top_level_keys(&path, "extensions"), current)
+    filter(top_level_keys(&value, "extensions"), current)
 }
 
 pub fn runtimes(current: &OsStr) -> Vec<CompletionCandidate> {
-    let Some(path) = find_avocado_yaml() else {
+    let Some(value) = read_avocado_yaml() else {
         return vec![];
     };
     // `runtime` is the legacy singular alias accepted by Config's deserializer.
-    let mut names = read_top_level_keys(&path, "runtimes");
+    let mut names = top_level_keys(&value, "runtimes");
     if names.is_empty() {
-        names = read_top_level_keys(&path, "runtime");
+        names = top_level_keys(&value, "runtime");
     }
     filter(names, current)
 }
@@ -86,13 +87,7 @@ pub fn runtimes(current: &OsStr) -> Vec<CompletionCandidate> {
 /// it's absent or `"*"` (meaning "all"), we can't enumerate without the
 /// SDK, so we yield nothing rather than guess.
 pub fn targets(current: &OsStr) -> Vec<CompletionCandidate> {
-    let Some(path) = find_avocado_yaml() else {
-        return vec![];
-    };
-    let Ok(content) = std::fs::read_to_string(&path) else {
-        return vec![];
-    };
-    let Ok(value) = serde_yaml::from_str::<serde_yaml::Value>(&content) else {
+    let Some(value) = read_avocado_yaml() else {
         return vec![];
     };
     let names = match value.get("supported_targets") {
@@ -1870,6 +1870,14 @@ fn resolve_runtime_at_path(config_path: &str, cli_runtime: Option<&str>) -> Resu
     crate::utils::runtime::validate_and_log_runtime(cli_runtime, &config)
 }
 
+/// Pick the extension name from the positional argument or `-e/--extension`,
+/// failing when neither was given. Shared by every `ext` subcommand that
+/// operates on exactly one extension.
+fn required_extension_name(name: Option<String>, extension: Option<String>) -> Result<String> {
+    name.or(extension)
+        .context("extension name is required (provide as positional or -e/--extension)")
+}
+
 /// Park the CLI `--target-board` value in the process-scoped interpolation
 /// override, then return it unchanged so the caller can keep threading it.
 ///
@@ -1994,6 +2002,21 @@ fn cli_command_with_completers() -> clap::Command {
 }
 
 fn needs_vm_routing(cmd: &Commands) -> bool {
+    // Listing / dependency-report subcommands only read avocado.yaml on the
+    // host. Don't pay for VM discovery (or an auto-start) just to print
+    // config back to the user.
+    if matches!(
+        cmd,
+        Commands::Ext {
+            command: ExtCommands::List { .. } | ExtCommands::Deps { .. }
+        } | Commands::Runtime {
+            command: RuntimeCommands::List { .. } | RuntimeCommands::Deps { .. }
+        } | Commands::Sdk {
+            command: SdkCommands::Deps { .. }
+        }
+    ) {
+        return false;
+    }
     matches!(
         cmd,
         Commands::Build { .. }
@@ -2037,10 +2060,24 @@ async fn main() -> Result<()> {
         std::env::set_var("AVOCADO_NO_TUI", "1");
     }
 
-    let skip_update_check = matches!(
-        cli.command,
-        Commands::Upgrade { .. } | Commands::Completion { .. }
-    );
+    // Suppress the update banner when the user asked for JSON / NDJSON
+    // output. The banner goes to stderr, but callers that capture both
+    // streams (e.g. the avocado-desktop CLI runner merges stdout + stderr
+    // in causal order) ended up feeding the banner into a JSON parser,
+    // which then refused the entire payload. Silent-when-machine-readable
+    // is the safer contract. Since the result would be discarded, don't
+    // start the check (or wait on it at exit) in the first place.
+    let json_mode = std::env::args().any(|a| a == "--output")
+        && std::env::args()
+            .skip_while(|a| a != "--output")
+            .nth(1)
+            .as_deref()
+            == Some("json");
+    let skip_update_check = json_mode
+        || matches!(
+            cli.command,
+            Commands::Upgrade { .. } | Commands::Completion { .. }
+        );
     let update_handle = if !skip_update_check {
         Some(tokio::spawn(utils::update_check::check_for_update()))
     } else {
@@ -2825,9 +2862,7 @@ async fn main() -> Result<()> {
                 container_args,
                 dnf_args,
             } => {
-                let extension = name.or(extension).context(
-                    "extension name is required (provide as positional or -e/--extension)",
-                )?;
+                let extension = required_extension_name(name, extension)?;
                 // Resolve runtime when caller asked for it (or env / default
                 // runtime would resolve). Fall through to None for projects
                 // without runtimes so legacy per-target builds keep working.
@@ -2859,9 +2894,7 @@ async fn main() -> Result<()> {
                 src_path,
                 container_tool,
             } => {
-                let extension = name.or(extension).context(
-                    "extension name is required (provide as positional or -e/--extension)",
-                )?;
+                let extension = required_extension_name(name, extension)?;
                 let resolved_runtime = resolve_runtime_at_path(&config, runtime.as_deref()).ok();
                 let checkout_cmd = ExtCheckoutCommand::new(
                     extension,
@@ -2929,9 +2962,7 @@ async fn main() -> Result<()> {
                 container_args,
                 dnf_args,
             } => {
-                let extension = name.or(extension).context(
-                    "extension name is required (provide as positional or -e/--extension)",
-                )?;
+                let extension = required_extension_name(name, extension)?;
                 let resolved_runtime = resolve_runtime_at_path(&config, runtime.as_deref()).ok();
                 let clean_cmd = ExtCleanCommand::new(
                     extension,
@@ -2957,9 +2988,7 @@ async fn main() -> Result<()> {
                 container_args,
                 dnf_args,
             } => {
-                let extension = name.or(extension).context(
-                    "extension name is required (provide as positional or -e/--extension)",
-                )?;
+                let extension = required_extension_name(name, extension)?;
                 let resolved_runtime = resolve_runtime_at_path(&config, runtime.as_deref()).ok();
                 let image_cmd = ExtImageCommand::new(
                     extension,
@@ -2987,9 +3016,7 @@ async fn main() -> Result<()> {
                 container_args,
                 dnf_args,
             } => {
-                let extension = name.or(extension).context(
-                    "extension name is required (provide as positional or -e/--extension)",
-                )?;
+                let extension = required_extension_name(name, extension)?;
                 let resolved_runtime = resolve_runtime_at_path(&config, runtime.as_deref()).ok();
                 let package_cmd = ExtPackageCommand::new(
                     config,
@@ -4205,33 +4232,18 @@ async fn main() -> Result<()> {
         if let Ok(Ok(Some(version))) =
             tokio::time::timeout(std::time::Duration::from_secs(5), handle).await
         {
-            // Suppress the banner when the user asked for JSON / NDJSON
-            // output. The banner goes to stderr, but callers that
-            // capture both streams (e.g. the avocado-desktop CLI runner
-            // merges stdout + stderr in causal order) ended up feeding
-            // the banner into a JSON parser, which then refused the
-            // entire payload. Silent-when-machine-readable is the
-            // safer contract.
-            let json_mode = std::env::args().any(|a| a == "--output")
-                && std::env::args()
-                    .skip_while(|a| a != "--output")
-                    .nth(1)
-                    .as_deref()
-                    == Some("json");
-            if !json_mode {
-                let upgrade_hint = match utils::install_method::current_install_method() {
-                    utils::install_method::InstallMethod::Homebrew => {
-                        "Run 'avocado upgrade' or 'brew upgrade avocado-cli' to update."
-                    }
-                    _ => "Run 'avocado upgrade' to update.",
-                };
-                eprintln!(
-                    "\n\x1b[93m[UPDATE]\x1b[0m avocado {} is available (you have {}).\n         {}",
-                    version,
-                    env!("CARGO_PKG_VERSION"),
-                    upgrade_hint
-                );
-            }
+            let upgrade_hint = match utils::install_method::current_install_method() {
+                utils::install_method::InstallMethod::Homebrew => {
+                    "Run 'avocado upgrade' or 'brew upgrade avocado-cli' to update."
+                }
+                _ => "Run 'avocado upgrade' to update.",
+            };
+            eprintln!(
+                "\n\x1b[93m[UPDATE]\x1b[0m avocado {} is available (you have {}).\n         {}",
+                version,
+                env!("CARGO_PKG_VERSION"),
+                upgrade_hint
+            );
         }
     }
 
@@ -4351,9 +4363,10 @@ enum ExtCommands {
         /// Enable verbose output
         #[arg(short, long)]
         verbose: bool,
-        /// Name of the extension to operate on
-        #[arg(short = 'e', long = "extension", required = true)]
-        extension: String,
+        /// Name of the extension to operate on. Repeat to run the same DNF
+        /// command against several extensions in a single container.
+        #[arg(short = 'e', long = "extension", required = true, action = clap::ArgAction::Append)]
+        extension: Vec<String>,
         /// Target architecture
         #[arg(short, long)]
         target: Option<String>,
@@ -5008,4 +5021,42 @@ mod tests {
             "qemux86-64",
         ])));
     }
+
+    /// Listing and dependency-report subcommands only read avocado.yaml,
+    /// so they stay on the host.
+    #[test]
+    fn needs_vm_routing_skips_host_only_listing_commands() {
+        let cmd = |args: &[&str]| {
+            Cli::try_parse_from(args)
+                .expect("args should parse")
+                .command
+        };
+
+        assert!(!needs_vm_routing(&cmd(&["avocado", "ext", "list"])));
+        assert!(!needs_vm_routing(&cmd(&["avocado", "ext", "deps"])));
+        assert!(!needs_vm_routing(&cmd(&["avocado", "runtime", "list"])));
+        assert!(!needs_vm_routing(&cmd(&[
+            "avocado", "runtime", "deps", "dev"
+        ])));
+        assert!(!needs_vm_routing(&cmd(&["avocado", "sdk", "deps"])));
+
+        // sibling subcommands that run containers still route
+        assert!(needs_vm_routing(&cmd(&[
+            "avocado", "ext", "build", "my-ext"
+        ])));
+        assert!(needs_vm_routing(&cmd(&["avocado", "sdk", "install"])));
+    }
+
+    #[test]
+    fn required_extension_name_prefers_positional() {
+        assert_eq!(
+            required_extension_name(Some("a".into()), Some("b".into())).unwrap(),
+            "a"
+        );
+        assert_eq!(
+            required_extension_name(None, Some("b".into())).unwrap(),
+            "b"
+        );
+        assert!(required_extension_name(None, None).is_err());
+    }
 }
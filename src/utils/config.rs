@@ -6,6 +6,8 @@ use std::collections::{HashMap, HashSet};
 use std::env;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::{Mutex, OnceLock};
+use std::time::SystemTime;
 
 use crate::utils::kernel_version::KernelVersionSpec;
 use crate::utils::output::{print_warning, OutputLevel};
@@ -1532,10 +1534,7 @@ impl Config {
         cli_target_board: Option<&str>,
     ) -> Result<Option<serde_yaml::Value>> {
         // Read the raw config to access target-specific sections
-        let content = fs::read_to_string(config_path)
-            .with_context(|| format!("Failed to read config file: {config_path}"))?;
-
-        let mut parsed = Self::parse_config_value(config_path, &content)?;
+        let mut parsed = Self::read_config_value(Path::new(config_path))?;
 
         // Apply interpolation to the parsed config
         crate::utils::interpolation::interpolate_config(
@@ -1563,6 +1562,41 @@ impl Config {
         }
     }
 
+    /// Read a config file and parse it into a raw (uninterpolated) YAML value.
+    ///
+    /// Results are memoized per process, keyed on the file's mtime and size,
+    /// so the accessors that re-read avocado.yaml during one command only pay
+    /// for the parse once. Callers get an owned clone and are free to
+    /// interpolate it in place.
+    pub(crate) fn read_config_value(path: &Path) -> Result<serde_yaml::Value> {
+        let stamp = config_cache_enabled()
+            .then(|| fs::metadata(path).ok())
+            .flatten()
+            .map(|m| (m.modified().ok(), m.len()));
+
+        if let Some(stamp) = stamp {
+            let guard = config_value_cache().lock().unwrap();
+            if let Some((cached_stamp, value)) = guard.get(path) {
+                if *cached_stamp == stamp {
+                    return Ok(value.clone());
+                }
+            }
+        }
+
+        let content = fs::read_to_string(path)
+            .with_context(|| format!("Failed to read config file: {}", path.display()))?;
+        let parsed = Self::parse_config_value(&path.to_string_lossy(), &content)?;
+
+        if let Some(stamp) = stamp {
+            config_value_cache()
+                .lock()
+                .unwrap()
+                .insert(path.to_path_buf(), (stamp, parsed.clone()));
+        }
+
+        Ok(parsed)
+    }
+
     /// Parse a config file content into a YAML value
     fn parse_config_value(path: &str, content: &str) -> Result<serde_yaml::Value> {
         serde_yaml::from_str(content)
@@ -1627,10 +1661,9 @@ impl Config {
         // config refs) operates on a fully-resolved tree. A second pass is
         // applied below after merging external configs so any templates those
         // configs introduce are also resolved.
-        let content = fs::read_to_string(path)
-            .with_context(|| format!("Failed to read config file: {}", path.display()))?;
-        let mut main_config =
-            Self::parse_config_value_with_interpolation(&config_path_str, &content, target)?;
+        let mut main_config = Self::read_config_value(path)?;
+        crate::utils::interpolation::interpolate_config(&mut main_config, target, None)
+            .with_context(|| "Failed to interpolate configuration values")?;
 
         // Resolve `source: { type: path, path: ... }` on rootfs / initramfs /
         // kernel — pulls each fragment's section in over the path-source
@@ -3237,10 +3270,7 @@ impl Config {
     ///
     /// Returns a sorted list of runtime names from the `runtimes` section.
     pub fn get_runtime_names(config_path: &str) -> Result<Vec<String>> {
-        let content = fs::read_to_string(config_path)
-            .with_context(|| format!("Failed to read config file: {config_path}"))?;
-        let parsed: serde_yaml::Value = serde_yaml::from_str(&content)
-            .with_context(|| format!("Failed to parse config file: {config_path}"))?;
+        let parsed = Self::read_config_value(Path::new(config_path))?;
 
         let mut runtimes: Vec<String> = parsed
             .get("runtimes")
@@ -3375,9 +3405,7 @@ impl Config {
         config_path: &str,
     ) -> Result<Option<serde_yaml::Value>> {
         // Read the raw config to access target-specific sections
-        let content = fs::read_to_string(config_path)
-            .with_context(|| format!("Failed to read config file: {config_path}"))?;
-        let mut parsed = Self::parse_config_value(config_path, &content)?;
+        let mut parsed = Self::read_config_value(Path::new(config_path))?;
 
         // Apply interpolation to the parsed config
         crate::utils::interpolation::interpolate_config(&mut parsed, Some(target), None)
@@ -3410,19 +3438,23 @@ impl Config {
             return Err(ConfigError::FileNotFound(path.display().to_string()).into());
         }
 
-        let content = fs::read_to_string(path)
-            .with_context(|| format!("Failed to read config file: {}", path.display()))?;
+        let parsed = Self::read_config_value(path)?;
 
-        Self::load_from_yaml_str(&content)
+        Self::load_from_yaml_value(parsed)
             .with_context(|| format!("Failed to parse YAML config file: {}", path.display()))
     }
 
     /// Load configuration from a YAML string
     pub fn load_from_yaml_str(content: &str) -> Result<Self> {
         // Parse YAML into a Value first
-        let mut parsed: serde_yaml::Value =
+        let parsed: serde_yaml::Value =
             serde_yaml::from_str(content).with_context(|| "Failed to parse YAML configuration")?;
 
+        Self::load_from_yaml_value(parsed)
+    }
+
+    /// Load configuration from an already-parsed, uninterpolated YAML value
+    fn load_from_yaml_value(mut parsed: serde_yaml::Value) -> Result<Self> {
         // Perform interpolation before deserializing to Config struct
         crate::utils::interpolation::interpolate_config(&mut parsed, None, None)
             .with_context(|| "Failed to interpolate configuration values")?;
@@ -3682,12 +3714,7 @@ impl Config {
         target: &str,
     ) -> Result<Option<HashMap<String, serde_yaml::Value>>> {
         // Re-read the config file to get raw (uninterpolated) values
-        let content = std::fs::read_to_string(config_path)
-            .with_context(|| format!("Failed to read config file: {config_path}"))?;
-
-        // Parse YAML into a Value
-        let mut parsed: serde_yaml::Value =
-            serde_yaml::from_str(&content).with_context(|| "Failed to parse YAML configuration")?;
+        let mut parsed = Self::read_config_value(Path::new(config_path))?;
 
         // Perform interpolation with the target
         crate::utils::interpolation::interpolate_config(&mut parsed, Some(target), None)
@@ -4453,9 +4480,9 @@ impl Config {
         config_path: &str,
         target: Option<&str>,
     ) -> Result<Vec<(String, ExtensionSource)>> {
-        let content = std::fs::read_to_string(config_path)
-            .with_context(|| format!("Failed to read config file: {config_path}"))?;
-        let parsed = Self::parse_config_value_with_interpolation(config_path, &content, target)?;
+        let mut parsed = Self::read_config_value(Path::new(config_path))?;
+        crate::utils::interpolation::interpolate_config(&mut parsed, target, None)
+            .with_context(|| "Failed to interpolate configuration values")?;
 
         Self::discover_remote_extensions_from_value(&parsed)
     }
@@ -4588,102 +4615,38 @@ impl Config {
     }
 
     /// Find an extension in the full dependency tree (local and external)
-    /// This is a comprehensive search that looks through all runtime dependencies
-    /// and their transitive extension dependencies
+    ///
+    /// Every extension a runtime can reference must be declared in the
+    /// `extensions` section, so this is a single keyed lookup there: the
+    /// extension is remote if it declares a `source`, local otherwise.
     pub fn find_extension_in_dependency_tree(
         &self,
         config_path: &str,
         extension_name: &str,
         target: &str,
     ) -> Result<Option<ExtensionLocation>> {
-        let content = std::fs::read_to_string(config_path)?;
-        let parsed =
-            Self::parse_config_value_with_interpolation(config_path, &content, Some(target))?;
-
-        // First check if it's defined in the ext section.
-        // Keys are already interpolated by parse_config_value_with_interpolation.
-        if let Some(ext_section) = parsed.get("extensions") {
-            if let Some(ext_map) = ext_section.as_mapping() {
-                for (ext_key, ext_config) in ext_map {
-                    if let Some(name) = ext_key.as_str() {
-                        if name == extension_name {
-                            if let Some(source) =
-                                Self::parse_extension_source(extension_name, ext_config)?
-                            {
-                                return Ok(Some(ExtensionLocation::Remote {
-                                    name: extension_name.to_string(),
-                                    source,
-                                }));
-                            }
-                            return Ok(Some(ExtensionLocation::Local {
-                                name: extension_name.to_string(),
-                                config_path: config_path.to_string(),
-                            }));
-                        }
-                    }
-                }
-            }
-        }
+        let mut parsed = Self::read_config_value(Path::new(config_path))?;
+        crate::utils::interpolation::interpolate_config(&mut parsed, Some(target), None)
+            .with_context(|| "Failed to interpolate configuration values")?;
 
-        // If not found in ext section, search through runtime extensions array
-        let runtime_section = parsed.get("runtimes").and_then(|r| r.as_mapping());
+        // Keys are already interpolated above.
+        let Some(ext_config) = parsed
+            .get("extensions")
+            .and_then(|ext_section| ext_section.get(extension_name))
+        else {
+            return Ok(None);
+        };
 
-        if let Some(runtime_section) = runtime_section {
-            for (runtime_name_key, _) in runtime_section {
-                if let Some(runtime_name) = runtime_name_key.as_str() {
-                    let merged_runtime =
-                        self.get_merged_runtime_config(runtime_name, target, config_path)?;
-                    if let Some(merged_value) = merged_runtime {
-                        if let Some(extensions) =
-                            merged_value.get("extensions").and_then(|e| e.as_sequence())
-                        {
-                            for ext in extensions {
-                                if let Some(spec) =
-                                    crate::utils::runtime_extension::RuntimeExtensionSpec::parse_entry(ext)
-                                {
-                                    if spec.name == extension_name {
-                                        if let Some(ext_section) = parsed.get("extensions") {
-                                            if let Some(ext_map) = ext_section.as_mapping() {
-                                                for (ext_key, ext_config) in ext_map {
-                                                    if let Some(name) = ext_key.as_str() {
-                                                        if name == extension_name {
-                                                            if let Some(source) =
-                                                                Self::parse_extension_source(
-                                                                    extension_name,
-                                                                    ext_config,
-                                                                )?
-                                                            {
-                                                                return Ok(Some(
-                                                                    ExtensionLocation::Remote {
-                                                                        name: extension_name
-                                                                            .to_string(),
-                                                                        source,
-                                                                    },
-                                                                ));
-                                                            }
-                                                            return Ok(Some(
-                                                                ExtensionLocation::Local {
-                                                                    name: extension_name
-                                                                        .to_string(),
-                                                                    config_path: config_path
-                                                                        .to_string(),
-                                                                },
-                                                            ));
-                                                        }
-                                                    }
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
+        if let Some(source) = Self::parse_extension_source(extension_name, ext_config)? {
+            return Ok(Some(ExtensionLocation::Remote {
+                name: extension_name.to_string(),
+                source,
+            }));
         }
-
-        Ok(None)
+        Ok(Some(ExtensionLocation::Local {
+            name: extension_name.to_string(),
+            config_path: config_path.to_string(),
+        }))
     }
 
     /// Expand environment variables in a string
@@ -5316,9 +5279,7 @@ impl Config {
     /// Merged SDK configuration or error if parsing fails
     pub fn get_merged_sdk_config(&self, target: &str, config_path: &str) -> Result<SdkConfig> {
         // Read the raw config to access target-specific sections
-        let content = std::fs::read_to_string(config_path)
-            .with_context(|| format!("Failed to read config file: {config_path}"))?;
-        let parsed = Self::parse_config_value(config_path, &content)?;
+        let parsed = Self::read_config_value(Path::new(config_path))?;
 
         // Start with the base SDK config
         let mut merged_config = self.sdk.clone().unwrap_or_default();
@@ -5366,9 +5327,7 @@ impl Config {
         config_path: &str,
     ) -> Result<Option<HashMap<String, serde_yaml::Value>>> {
         // Read the raw config to access target-specific sections
-        let content = std::fs::read_to_string(config_path)
-            .with_context(|| format!("Failed to read config file: {config_path}"))?;
-        let parsed = Self::parse_config_value(config_path, &content)?;
+        let parsed = Self::read_config_value(Path::new(config_path))?;
 
         let mut merged_deps = HashMap::new();
 
@@ -5532,6 +5491,39 @@ pub fn resolve_host_uid_gid(config: Option<&SdkConfig>) -> (u32, u32) {
     (uid, gid)
 }
 
+/// File identity used to validate a cached parse: `(mtime, size)`.
+type ConfigFileStamp = (Option<SystemTime>, u64);
+
+/// Process-level cache type alias.
+type ConfigValueCache = Mutex<HashMap<PathBuf, (ConfigFileStamp, serde_yaml::Value)>>;
+
+/// Process-level cache of `path -> parsed avocado.yaml`.
+///
+/// A single command reloads the same config from many accessors (typed load,
+/// merged sections, composed config, extension discovery). Only the raw parse
+/// is cached — interpolation depends on the target and environment, so it is
+/// re-applied by each caller.
+fn config_value_cache() -> &'static ConfigValueCache {
+    static CACHE: OnceLock<ConfigValueCache> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(HashMap::new()))
+}
+
+/// Whether parsed configs may be served from [`config_value_cache`].
+///
+/// Set `AVOCADO_CONFIG_NOCACHE=1` to force every load to re-read the file.
+fn config_cache_enabled() -> bool {
+    !nocache_requested(env::var("AVOCADO_CONFIG_NOCACHE").ok().as_deref())
+}
+
+/// Whether an `AVOCADO_CONFIG_NOCACHE` value disables the config cache.
+///
+/// Unset, empty, `0` and `false` leave the cache on; any other value turns it off.
+fn nocache_requested(value: Option<&str>) -> bool {
+    value
+        .map(str::trim)
+        .is_some_and(|v| !v.is_empty() && v != "0" && !v.eq_ignore_ascii_case("false"))
+}
+
 /// Convenience function to load a config file
 #[allow(dead_code)]
 pub fn load_config<P: AsRef<Path>>(config_path: P) -> Result<Config> {
@@ -5745,6 +5737,57 @@ sdk:
         assert!(result.is_err());
     }
 
+    #[test]
+    fn test_load_config_reparses_after_file_changes() {
+        let temp_file = NamedTempFile::new().unwrap();
+        fs::write(temp_file.path(), "default_target: qemux86-64\n").unwrap();
+
+        let config = Config::load(temp_file.path()).unwrap();
+        assert_eq!(config.get_target(), Some("qemux86-64".to_string()));
+
+        // A different size invalidates the cached parse even if the mtime
+        // has not ticked over.
+        fs::write(temp_file.path(), "default_target: qemuarm64-longer\n").unwrap();
+
+        let config = Config::load(temp_file.path()).unwrap();
+        assert_eq!(config.get_target(), Some("qemuarm64-longer".to_string()));
+    }
+
+    #[test]
+    fn test_find_extension_in_dependency_tree_resolves_declared_extensions() {
+        let temp_file = NamedTempFile::new().unwrap();
+        fs::write(
+            temp_file.path(),
+            r#"
+default_target: qemux86-64
+extensions:
+  local-ext:
+    version: "1.0.0"
+  "{{ avocado.target }}-ext":
+    version: "1.0.0"
+"#,
+        )
+        .unwrap();
+        let config_path = temp_file.path().to_str().unwrap();
+        let config = Config::load(config_path).unwrap();
+
+        match config
+            .find_extension_in_dependency_tree(config_path, "local-ext", "qemux86-64")
+            .unwrap()
+        {
+            Some(ExtensionLocation::Local { name, .. }) => assert_eq!(name, "local-ext"),
+            other => panic!("expected local extension, got {other:?}"),
+        }
+        assert!(config
+            .find_extension_in_dependency_tree(config_path, "qemux86-64-ext", "qemux86-64")
+            .unwrap()
+            .is_some());
+        assert!(config
+            .find_extension_in_dependency_tree(config_path, "missing-ext", "qemux86-64")
+            .unwrap()
+            .is_none());
+    }
+
     #[test]
     fn test_src_dir_absolute_path() {
         let config_content = r#"
@@ -11941,4 +11984,34 @@ extensions:
             other => panic!("expected Git source, got {other:?}"),
         }
     }
+
+    #[test]
+    fn test_nocache_requested_values() {
+        assert!(!nocache_requested(None));
+        assert!(!nocache_requested(Some("")));
+        assert!(!nocache_requested(Some("0")));
+        assert!(!nocache_requested(Some("false")));
+        assert!(!nocache_requested(Some("FALSE")));
+        assert!(nocache_requested(Some("1")));
+        assert!(nocache_requested(Some("true")));
+        assert!(nocache_requested(Some("yes")));
+    }
+
+    #[test]
+    #[serial]
+    fn test_config_cache_env_toggle() {
+        std::env::remove_var("AVOCADO_CONFIG_NOCACHE");
+        assert!(config_cache_enabled());
+
+        std::env::set_var("AVOCADO_CONFIG_NOCACHE", "1");
+        assert!(!config_cache_enabled());
+
+        std::env::set_var("AVOCADO_CONFIG_NOCACHE", "0");
+        assert!(config_cache_enabled());
+
+        std::env::set_var("AVOCADO_CONFIG_NOCACHE", "");
+        assert!(config_cache_enabled());
+
+        std::env::remove_var("AVOCADO_CONFIG_NOCACHE");
+    }
 }
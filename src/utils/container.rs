@@ -721,21 +721,30 @@ impl SdkContainer {
                 OutputLevel::Normal,
             );
         };
-        let content = match std::fs::read_to_string(&config_path) {
-            Ok(c) => c,
-            Err(e) => {
-                warn("read", &e);
-                return None;
-            }
-        };
-        let value: serde_yaml::Value = match serde_yaml::from_str(&content) {
+        // Goes through the per-process config cache: this runs for every
+        // container invocation, and the file rarely changes between them.
+        let value = match crate::utils::config::Config::read_config_value(&config_path) {
             Ok(v) => v,
             Err(e) => {
-                warn("parse", &e);
+                warn("load", &format!("{e:#}"));
                 return None;
             }
         };
 
+        // Most configs declare no `type: path` sources at all; bail out before
+        // building the interpolation context, which walks the whole config.
+        // A templated `type:` can't be judged before interpolation, so it
+        // keeps the slow path.
+        let may_have_path_source = value
+            .get("extensions")
+            .and_then(|e| e.as_mapping())?
+            .values()
+            .filter_map(|ext| ext.get("source")?.get("type")?.as_str())
+            .any(|t| t == "path" || t.contains("{{"));
+        if !may_have_path_source {
+            return None;
+        }
+
         // Build the interpolation context from the full config (so
         // `{{ avocado.target/board/distro }}` resolve), then interpolate ONLY the
         // `extensions` subtree. Scoping the interpolation there means an error in
@@ -3050,6 +3059,46 @@ fi
     }
 }
 
+/// Read buffer for piped container output. Sized so chatty build logs are
+/// drained in a few large reads rather than many 4 KiB ones.
+const OUTPUT_READ_BUFFER: usize = 64 * 1024;
+
+/// A complete line of container output, split by `split_output_chunk`.
+#[derive(Debug, PartialEq)]
+enum OutputLine {
+    /// Terminated by `\n` — a new line of output.
+    Append(String),
+    /// Terminated by `\r` — overwrites the previous line (progress bars).
+    Replace(String),
+}
+
+/// Split a chunk of raw output into lines, carrying any unterminated tail in
+/// `pending` to the next chunk. Lines are decoded only once complete, so a
+/// UTF-8 sequence split across two reads is not mangled.
+fn split_output_chunk(pending: &mut Vec<u8>, chunk: &[u8], mut emit: impl FnMut(OutputLine)) {
+    for segment in chunk.split_inclusive(|b| *b == b'\n' || *b == b'\r') {
+        match segment.split_last() {
+            Some((b'\n', body)) => {
+                pending.extend_from_slice(body);
+                emit(OutputLine::Append(
+                    String::from_utf8_lossy(pending).into_owned(),
+                ));
+                pending.clear();
+            }
+            Some((b'\r', body)) => {
+                pending.extend_from_slice(body);
+                if !pending.is_empty() {
+                    emit(OutputLine::Replace(
+                        String::from_utf8_lossy(pending).into_owned(),
+                    ));
+                    pending.clear();
+                }
+            }
+            _ => pending.extend_from_slice(segment),
+        }
+    }
+}
+
 /// Read an output stream (stdout or stderr) from a container process and feed
 /// lines to the TUI renderer. Handles both newlines (`\n`) and carriage returns
 /// (`\r`) — the latter is used by progress bars (e.g. dnf) to overwrite the
@@ -3059,44 +3108,28 @@ async fn read_output_stream<R: tokio::io::AsyncRead + Unpin>(
     task_id: &TaskId,
     renderer: &std::sync::Arc<TaskRenderer>,
 ) {
-    use tokio::io::AsyncReadExt;
+    use tokio::io::AsyncBufReadExt;
 
-    let mut reader = tokio::io::BufReader::new(stream);
-    let mut buf = [0u8; 4096];
-    let mut current_line = String::new();
+    let mut reader = tokio::io::BufReader::with_capacity(OUTPUT_READ_BUFFER, stream);
+    let mut pending = Vec::new();
 
     loop {
-        match reader.read(&mut buf).await {
-            Ok(0) => break, // EOF
-            Ok(n) => {
-                let chunk = String::from_utf8_lossy(&buf[..n]);
-                for ch in chunk.chars() {
-                    match ch {
-                        '\n' => {
-                            // Complete line — append to ring buffer
-                            let line = std::mem::take(&mut current_line);
-                            renderer.append_output(task_id, line);
-                        }
-                        '\r' => {
-                            // Carriage return — replace last line (progress bar update)
-                            if !current_line.is_empty() {
-                                let line = std::mem::take(&mut current_line);
-                                renderer.replace_last_output(task_id, line);
-                            }
-                        }
-                        _ => {
-                            current_line.push(ch);
-                        }
-                    }
-                }
-            }
+        let chunk = match reader.fill_buf().await {
+            Ok(chunk) if chunk.is_empty() => break, // EOF
+            Ok(chunk) => chunk,
             Err(_) => break,
-        }
+        };
+        let n = chunk.len();
+        split_output_chunk(&mut pending, chunk, |line| match line {
+            OutputLine::Append(line) => renderer.append_output(task_id, line),
+            OutputLine::Replace(line) => renderer.replace_last_output(task_id, line),
+        });
+        reader.consume(n);
     }
 
     // Flush any remaining partial line
-    if !current_line.is_empty() {
-        renderer.append_output(task_id, current_line);
+    if !pending.is_empty() {
+        renderer.append_output(task_id, String::from_utf8_lossy(&pending).into_owned());
     }
 }
 
@@ -3219,6 +3252,28 @@ extensions:
         assert!(container.derive_ext_path_mounts("qemux86-64").is_none());
     }
 
+    #[test]
+    fn derive_ext_path_mounts_honors_templated_source_type() {
+        // The no-path-source short-circuit must not drop a `type:` that only
+        // becomes `path` after interpolation.
+        let tmp = tempfile::tempdir().unwrap();
+        let root = tmp.path();
+        std::fs::create_dir_all(root.join("ext/local-thing")).unwrap();
+        let cfg = root.join("avocado.yaml");
+        std::fs::write(
+            &cfg,
+            "extensions:\n  local-thing:\n    kind: path\n    source:\n      type: \"{{ config.local-thing.kind }}\"\n      path: ext/local-thing\n",
+        )
+        .unwrap();
+        let container = SdkContainer::new()
+            .with_src_dir(Some(root.to_path_buf()))
+            .with_config_path(Some(cfg));
+        let mounts = container
+            .derive_ext_path_mounts("qemux86-64")
+            .expect("templated path source should still be mounted");
+        assert!(mounts.contains_key("local-thing"));
+    }
+
     #[test]
     fn derive_ext_path_mounts_falls_back_to_src_dir_without_config_path() {
         // `ext install` / `runtime install` build a bare SdkContainer::new()
@@ -3583,4 +3638,51 @@ extensions:
         assert!(result.starts_with("linux/"));
         assert_eq!(result, get_host_platform());
     }
+
+    fn split_all(chunks: &[&[u8]]) -> (Vec<OutputLine>, Vec<u8>) {
+        let mut pending = Vec::new();
+        let mut lines = Vec::new();
+        for chunk in chunks {
+            split_output_chunk(&mut pending, chunk, |line| lines.push(line));
+        }
+        (lines, pending)
+    }
+
+    #[test]
+    fn output_chunks_split_on_newline_and_carriage_return() {
+        let (lines, pending) =
+            split_all(&[b"one\n\nprogress 10%\rprogress 50%\rdone\ntail" as &[u8]]);
+        assert_eq!(
+            lines,
+            vec![
+                OutputLine::Append("one".to_string()),
+                OutputLine::Append(String::new()),
+                OutputLine::Replace("progress 10%".to_string()),
+                OutputLine::Replace("progress 50%".to_string()),
+                OutputLine::Append("done".to_string()),
+            ]
+        );
+        assert_eq!(pending, b"tail");
+    }
+
+    #[test]
+    fn output_chunks_skip_empty_carriage_return_lines() {
+        let (lines, _) = split_all(&[b"a\r\n" as &[u8]]);
+        assert_eq!(
+            lines,
+            vec![
+                OutputLine::Replace("a".to_string()),
+                OutputLine::Append(String::new()),
+            ]
+        );
+    }
+
+    #[test]
+    fn output_chunks_keep_utf8_split_across_reads() {
+        let text = "✓ installed\n".as_bytes();
+        // Split inside the three-byte check mark
+        let (lines, pending) = split_all(&[&text[..1], &text[1..]]);
+        assert_eq!(lines, vec![OutputLine::Append("✓ installed".to_string())]);
+        assert!(pending.is_empty());
+    }
 }
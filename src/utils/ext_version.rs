@@ -0,0 +1,129 @@
+//! Version resolution for the extensions a runtime ships.
+//!
+//! `runtime build` and `runtime provision` both turn a runtime's extensions
+//! into `<name>-<version>` entries for `AVOCADO_EXT_LIST`. Versions pinned in
+//! config are used as-is; everything else is read from the RPM database of
+//! each extension's sysroot, with all lookups batched into one container run.
+
+use anyhow::Result;
+use std::collections::HashMap;
+
+/// Version of an extension pinned in the local `extensions` section, if any.
+///
+/// A `"*"` version means "whatever is installed" and is treated as unpinned.
+pub fn local_extension_version(parsed: &serde_yaml::Value, ext_name: &str) -> Option<String> {
+    parsed
+        .get("extensions")
+        .and_then(|ext_section| ext_section.as_mapping())
+        .and_then(|ext_table| ext_table.get(ext_name))
+        .and_then(|ext_config| ext_config.get("version"))
+        .and_then(|v| v.as_str())
+        .filter(|version| *version != "*")
+        .map(str::to_string)
+}
+
+/// Script that prints `<ext_name> <version>` for each installed extension,
+/// using the same RPM config as installation.
+pub fn generate_rpm_version_query_script(ext_names: &[&str]) -> String {
+    format!(
+        r#"
+export RPM_CONFIGDIR=$AVOCADO_SDK_PREFIX/ext-rpm-config
+export RPM_ETCCONFIGDIR=$DNF_SDK_TARGET_PREFIX
+for ext in {names}; do
+    if version=$(rpm --root="$AVOCADO_EXT_SYSROOTS/$ext" --dbpath=/var/lib/extension.d/rpm -q "$ext" --queryformat '%{{VERSION}}'); then
+        echo "$ext $version"
+    fi
+done
+"#,
+        names = ext_names.join(" ")
+    )
+}
+
+/// Parse the output of `generate_rpm_version_query_script`, ignoring any
+/// line that does not name one of the queried extensions.
+pub fn parse_rpm_version_output(output: &str, ext_names: &[&str]) -> HashMap<String, String> {
+    output
+        .lines()
+        .filter_map(|line| line.trim().split_once(' '))
+        .filter(|(name, version)| ext_names.contains(name) && !version.trim().is_empty())
+        .map(|(name, version)| (name.to_string(), version.trim().to_string()))
+        .collect()
+}
+
+/// Installed version of `ext_name` from a `parse_rpm_version_output` map,
+/// or an error pointing the user at `avocado install` if it is missing.
+pub fn installed_extension_version(
+    rpm_versions: &HashMap<String, String>,
+    ext_name: &str,
+) -> Result<String> {
+    rpm_versions.get(ext_name).cloned().ok_or_else(|| {
+        anyhow::anyhow!(
+            "Failed to query version for extension '{ext_name}' from RPM database. \
+                Extension may not be installed yet. Run 'avocado install' first."
+        )
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_local_extension_version_skips_wildcard() {
+        let parsed: serde_yaml::Value = serde_yaml::from_str(
+            r#"
+extensions:
+  pinned:
+    version: "1.2.3"
+  any:
+    version: "*"
+  unversioned: {}
+"#,
+        )
+        .unwrap();
+
+        assert_eq!(
+            local_extension_version(&parsed, "pinned").as_deref(),
+            Some("1.2.3")
+        );
+        assert_eq!(local_extension_version(&parsed, "any"), None);
+        assert_eq!(local_extension_version(&parsed, "unversioned"), None);
+        assert_eq!(local_extension_version(&parsed, "missing"), None);
+    }
+
+    #[test]
+    fn test_rpm_version_query_script_covers_all_extensions() {
+        let script = generate_rpm_version_query_script(&["app", "net-tools"]);
+
+        assert!(script.contains("for ext in app net-tools; do"));
+        assert!(script.contains("--root=\"$AVOCADO_EXT_SYSROOTS/$ext\""));
+        assert!(script.contains("--queryformat '%{VERSION}'"));
+        // A missing extension must not abort the lookups for the rest
+        assert!(!script.contains("set -e"));
+    }
+
+    #[test]
+    fn test_parse_rpm_version_output() {
+        let output = "app 1.0.0\nnoise from entrypoint\nnet-tools 2.3\nother 9.9\n";
+        let versions = parse_rpm_version_output(output, &["app", "net-tools", "absent"]);
+
+        assert_eq!(versions.len(), 2);
+        assert_eq!(versions.get("app").map(String::as_str), Some("1.0.0"));
+        assert_eq!(versions.get("net-tools").map(String::as_str), Some("2.3"));
+        assert!(!versions.contains_key("absent"));
+        assert!(!versions.contains_key("other"));
+    }
+
+    #[test]
+    fn test_installed_extension_version_reports_missing() {
+        let versions = HashMap::from([("app".to_string(), "1.0.0".to_string())]);
+
+        assert_eq!(
+            installed_extension_version(&versions, "app").unwrap(),
+            "1.0.0"
+        );
+        let err = installed_extension_version(&versions, "absent").unwrap_err();
+        assert!(err.to_string().contains("'absent'"));
+        assert!(err.to_string().contains("avocado install"));
+    }
+}
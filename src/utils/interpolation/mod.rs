@@ -56,6 +56,7 @@ use anyhow::Result;
 use regex::Regex;
 use serde_yaml::Value;
 use std::collections::HashSet;
+use std::sync::OnceLock;
 
 pub mod avocado;
 pub mod config;
@@ -67,6 +68,22 @@ pub use avocado::AvocadoContext;
 
 const MAX_ITERATIONS: usize = 100;
 
+/// Matches any `{{ ... }}` template, capturing the inner expression.
+///
+/// Compiled on first use and shared for the rest of the process: a single
+/// config load walks every string in the tree on every interpolation pass,
+/// so building the regex per call dominated the cost of interpolation.
+fn template_regex() -> &'static Regex {
+    static RE: OnceLock<Regex> = OnceLock::new();
+    RE.get_or_init(|| Regex::new(r"\{\{\s*([^}]+)\s*\}\}").unwrap())
+}
+
+/// Matches the `{{ avocado.target }}` template used in extension names.
+fn target_name_regex() -> &'static Regex {
+    static RE: OnceLock<Regex> = OnceLock::new();
+    RE.get_or_init(|| Regex::new(r"\{\{\s*avocado\.target\s*\}\}").unwrap())
+}
+
 /// Interpolate a simple string with the target value.
 ///
 /// This is a lightweight interpolation for extension names and other strings
@@ -86,8 +103,7 @@ const MAX_ITERATIONS: usize = 100;
 /// assert_eq!(result, "my-ext-raspberrypi4");
 /// ```
 pub fn interpolate_name(input: &str, target: &str) -> String {
-    let re = Regex::new(r"\{\{\s*avocado\.target\s*\}\}").unwrap();
-    re.replace_all(input, target).to_string()
+    target_name_regex().replace_all(input, target).to_string()
 }
 
 /// Interpolate configuration values in a YAML structure.
@@ -364,8 +380,7 @@ fn interpolate_string(
     location: &YamlLocation,
     lenient: bool,
 ) -> Result<Option<String>> {
-    // Regex to match {{ ... }} templates
-    let re = Regex::new(r"\{\{\s*([^}]+)\s*\}\}").unwrap();
+    let re = template_regex();
 
     if !re.is_match(input) {
         return Ok(None);
@@ -4,6 +4,7 @@ pub mod container;
 #[cfg(target_os = "macos")]
 pub mod disk_writer;
 pub mod ext_fetch;
+pub mod ext_version;
 pub mod host_copy;
 pub mod image_signing;
 pub mod install_method;
@@ -26,6 +27,7 @@ pub mod runs_on;
 pub mod runtime;
 pub mod runtime_extension;
 pub mod scheduler;
+pub mod shell;
 pub mod signing_keys;
 #[cfg(unix)]
 pub mod signing_service;
@@ -17,6 +17,7 @@ use crate::utils::output::{print_info, print_success, OutputLevel};
 use crate::utils::remote::{
     get_local_ip_for_remote, RemoteHost, RemoteVolumeManager, SshClient, SshControlMaster,
 };
+use crate::utils::shell::shell_quote;
 
 #[cfg(unix)]
 use crate::utils::remote::SshTunnel;
@@ -534,7 +535,7 @@ impl RunsOnContext {
 
         // Add environment variables
         for (key, value) in env_vars {
-            docker_cmd.push_str(&format!(" -e {}={}", key, shell_escape(value)));
+            docker_cmd.push_str(&format!(" -e {}={}", key, shell_quote(value)));
         }
 
         // Add signing socket and helper script if tunnel is active
@@ -561,7 +562,7 @@ impl RunsOnContext {
         }
 
         // Add image and command
-        docker_cmd.push_str(&format!(" {} bash -c {}", image, shell_escape(command)));
+        docker_cmd.push_str(&format!(" {} bash -c {}", image, shell_quote(command)));
 
         Ok(docker_cmd)
     }
@@ -685,36 +686,3 @@ impl RunsOnContext {
         Ok(())
     }
 }
-
-/// Shell escape a string for safe use in a shell command
-fn shell_escape(s: &str) -> String {
-    format!("'{}'", s.replace('\'', "'\\''"))
-}
-
-#[cfg(test)]
-mod tests {
-    use super::*;
-
-    #[test]
-    fn test_shell_escape_simple() {
-        assert_eq!(shell_escape("hello"), "'hello'");
-    }
-
-    #[test]
-    fn test_shell_escape_with_spaces() {
-        assert_eq!(shell_escape("hello world"), "'hello world'");
-    }
-
-    #[test]
-    fn test_shell_escape_with_quotes() {
-        assert_eq!(shell_escape("it's"), "'it'\\''s'");
-    }
-
-    #[test]
-    fn test_shell_escape_complex() {
-        assert_eq!(
-            shell_escape("echo 'hello' && rm -rf /"),
-            "'echo '\\''hello'\\'' && rm -rf /'"
-        );
-    }
-}
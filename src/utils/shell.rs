@@ -0,0 +1,69 @@
+//! Quoting for values interpolated into scripts run by `sh`/`bash`.
+
+/// Single-quote a string so the shell takes it literally.
+pub fn shell_quote(s: &str) -> String {
+    format!("'{}'", s.replace('\'', "'\\''"))
+}
+
+/// Quote a string as a single shell word. Plain words (names, versions,
+/// options) pass through unchanged; anything with spaces, globs or other
+/// shell syntax is single-quoted via [`shell_quote`].
+pub fn shell_word(s: &str) -> String {
+    let is_plain = !s.is_empty()
+        && s.chars().all(|c| {
+            c.is_ascii_alphanumeric()
+                || matches!(c, '-' | '_' | '.' | '/' | ':' | '=' | '+' | ',' | '@' | '%')
+        });
+    if is_plain {
+        s.to_string()
+    } else {
+        shell_quote(s)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_shell_quote_simple() {
+        assert_eq!(shell_quote("hello"), "'hello'");
+    }
+
+    #[test]
+    fn test_shell_quote_with_spaces() {
+        assert_eq!(shell_quote("hello world"), "'hello world'");
+    }
+
+    #[test]
+    fn test_shell_quote_with_quotes() {
+        assert_eq!(shell_quote("it's"), "'it'\\''s'");
+    }
+
+    #[test]
+    fn test_shell_quote_complex() {
+        assert_eq!(
+            shell_quote("echo 'hello' && rm -rf /"),
+            "'echo '\\''hello'\\'' && rm -rf /'"
+        );
+    }
+
+    #[test]
+    fn test_shell_word_leaves_plain_words_alone() {
+        assert_eq!(shell_word("install"), "install");
+        assert_eq!(shell_word("curl-7.88.1"), "curl-7.88.1");
+        assert_eq!(
+            shell_word("--setopt=tsflags=nodocs"),
+            "--setopt=tsflags=nodocs"
+        );
+    }
+
+    #[test]
+    fn test_shell_word_quotes_shell_syntax() {
+        assert_eq!(shell_word("lib*"), "'lib*'");
+        assert_eq!(shell_word("pkg >= 1.0"), "'pkg >= 1.0'");
+        assert_eq!(shell_word("it's"), "'it'\\''s'");
+        assert_eq!(shell_word("$(id)"), "'$(id)'");
+        assert_eq!(shell_word(""), "''");
+    }
+}
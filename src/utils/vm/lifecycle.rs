@@ -565,7 +565,9 @@ async fn apply_network_config(
     let domains = match persisted_search {
         Some(list) if !list.is_empty() => list
             .iter()
-            .map(|d| shell_quote(d))
+            // Search domains are constrained (RFC 1035 label charset), but be
+            // defensive anyway.
+            .map(|d| crate::utils::shell::shell_quote(d))
             .collect::<Vec<_>>()
             .join(" "),
         _ => "'~.'".to_string(),
@@ -592,13 +594,6 @@ fn looks_like_ip(s: &str) -> bool {
             .all(|c| c.is_ascii_hexdigit() || matches!(c, '.' | ':' | '%' | '/' | '_'))
 }
 
-/// Single-quote a search-domain string for shell. Search domains are
-/// constrained (RFC 1035 label charset), but be defensive anyway.
-fn shell_quote(s: &str) -> String {
-    let escaped = s.replace('\'', "'\\''");
-    format!("'{escaped}'")
-}
-
 /// Parse a human-readable size string ("50G", "10M", "1024K", "12345" bytes).
 /// Suffixes are powers of 1024 (KiB/MiB/GiB), matching what `truncate(1)`
 /// and `btrfs filesystem resize` accept on Linux.